@@ -5,14 +5,36 @@ Bu dosya Flask uygulamasını oluşturur ve yapılandırır.
 """
 
 import os
-from flask import Flask
+from flask import Flask, current_app, request, has_request_context
 from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy.session import Session
 from flask_jwt_extended import JWTManager
 from flask_cors import CORS
 from flask_migrate import Migrate
 
+# Salt okunur motora yönlendirilen HTTP metodları
+READ_METHODS = ('GET', 'HEAD')
+
+
+class RoutingSession(Session):
+    """
+    GET isteklerinde salt okunur motoru kullanan oturum
+    
+    Okuma istekleri app.extensions['read_engine'] altındaki ayrı bağlantı
+    havuzundan, diğer tüm işlemler (istek dışı işler dahil) yazma
+    motorundan bağlantı alır.
+    """
+    
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and has_request_context() and request.method in READ_METHODS:
+            read_engine = current_app.extensions.get('read_engine')
+            if read_engine is not None:
+                return read_engine
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
 # Veritabanı ve JWT nesneleri
-db = SQLAlchemy()
+db = SQLAlchemy(session_options={'class_': RoutingSession})
 jwt = JWTManager()
 migrate = Migrate()
 
@@ -50,10 +72,10 @@ def create_app(config_name=None):
     os.makedirs(app.config['BACKUP_FOLDER'], exist_ok=True)
     
     # Modelleri import et
-    from app.models import User, Client, Case, Transaction, Installment, Lead, Document, CalendarEvent, Template
+    from app.models import User, Client, Case, Transaction, Installment, Lead, Document, DocumentContent, CalendarEvent, Template, FinanceRollup
     
     # Route'ları kaydet
-    from app.routes import auth_bp, clients_bp, cases_bp, finance_bp, leads_bp, documents_bp, calendar_bp, templates_bp, dashboard_bp, users_bp
+    from app.routes import auth_bp, clients_bp, cases_bp, finance_bp, leads_bp, documents_bp, calendar_bp, templates_bp, dashboard_bp, users_bp, search_bp, suggest_bp
     
     app.register_blueprint(auth_bp, url_prefix='/api/auth')
     app.register_blueprint(clients_bp, url_prefix='/api/clients')
@@ -65,6 +87,8 @@ def create_app(config_name=None):
     app.register_blueprint(templates_bp, url_prefix='/api/templates')
     app.register_blueprint(dashboard_bp, url_prefix='/api/dashboard')
     app.register_blueprint(users_bp, url_prefix='/api/users')
+    app.register_blueprint(search_bp, url_prefix='/api/search')
+    app.register_blueprint(suggest_bp, url_prefix='/api/suggest')
     
     # JWT hata işleyicileri
     @jwt.expired_token_loader
@@ -85,13 +109,46 @@ def create_app(config_name=None):
     
     # Veritabanını oluştur ve varsayılan admin kullanıcısını ekle
     with app.app_context():
+        # SQLite bağlantı ayarlarını ilk bağlantıdan önce etkinleştir
+        from app.services.sqlite_service import init_sqlite_pragmas, init_read_engine
+        init_sqlite_pragmas(app)
+        init_read_engine(app)
+        
         db.create_all()
+        
+        # Mevcut tablolara yeni kolon ve indeksleri ekle
+        from app.services.schema_service import upgrade_schema
+        upgrade_schema()
+        
         _create_default_admin()
+        
+        # Başlangıç oturumunun bağlantısını indeks kurulumundan önce havuza geri ver
+        db.session.remove()
+        
+        # Tam metin arama indekslerini hazırla
+        from app.services.search_service import init_search_indexes
+        init_search_indexes(app)
+    
+    # Otomatik tamamlama indeksini oluştur
+    from app.services.suggest_service import init_suggest_index
+    init_suggest_index(app)
+    
+    # Dashboard yanıt önbelleğini oluştur
+    from app.services.dashboard_service import init_dashboard_cache
+    init_dashboard_cache(app)
+    
+    # Belge içeriği çıkarma havuzunu başlat
+    from app.services.extraction_service import init_extraction_worker
+    init_extraction_worker(app)
     
     # Yedekleme servisini başlat
     from app.services.backup_service import init_backup_scheduler
     init_backup_scheduler(app)
     
+    # Müvekkil sayaçlarının periyodik denetimini zamanla
+    from app.services.counter_service import init_counter_reconciler
+    init_counter_reconciler(app)
+    
     return app
 
 
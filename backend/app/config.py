@@ -22,6 +22,22 @@ class Config:
         f'sqlite:///{os.path.join(BASE_DIR, "lawyer_management.db")}'
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     
+    # Yazma bağlantıları varsayılan havuzu kullanır; eşzamanlı yazmalar SQLite'ın
+    # yazma kilidinde busy_timeout süresince bekleyerek sıraya girer
+    
+    # GET istekleri için ayrı salt okunur bağlantı havuzu (0: devre dışı)
+    DATABASE_READ_POOL_SIZE = 8
+    
+    # SQLite bağlantı ayarları (her yeni bağlantıda PRAGMA olarak uygulanır)
+    SQLITE_PRAGMAS = {
+        'busy_timeout': 5000,  # Kilitli veritabanında beklenecek süre (ms)
+        'journal_mode': 'wal',  # Okuyucular yazma işlemlerini beklemez
+        'synchronous': 'normal',  # WAL kipinde güvenli ve hızlı
+        'cache_size': -16000,  # Sayfa önbelleği (negatif değer KiB: ~16 MB)
+        'mmap_size': 128 * 1024 * 1024,  # Bellek eşlemeli okuma (bayt)
+        'temp_store': 'memory'  # Geçici tablo ve sıralamalar bellekte
+    }
+    
     # JWT Yapılandırması
     JWT_SECRET_KEY = os.environ.get('JWT_SECRET_KEY') or 'jwt-secret-key-change-in-production'
     JWT_ACCESS_TOKEN_EXPIRES = timedelta(hours=1)
@@ -39,11 +55,32 @@ class Config:
     BACKUP_FOLDER = os.path.join(BASE_DIR, 'backups')
     BACKUP_INTERVAL_HOURS = 24  # 24 saatte bir otomatik yedekleme
     
+    # Sayaç kolonları (müvekkil dava/borç sayaçları, işlem taksit toplamları)
+    COUNTER_RECONCILE_HOURS = 24  # Sayaçların kaynak tablolarla karşılaştırılma aralığı (0: kapalı)
+    
     # CORS Yapılandırması
     CORS_ORIGINS = ['http://localhost:3000', 'http://127.0.0.1:3000']
     
     # Sayfalama
     ITEMS_PER_PAGE = 10
+    MAX_ITEMS_PER_PAGE = 100  # İmleçli sayfalamada sayfa başına en fazla kayıt
+    COUNT_CACHE_TTL = 60  # Tahmini toplam sayıların önbellekte kalma süresi (saniye)
+    
+    # Dashboard
+    DASHBOARD_CACHE_TTL = 60  # İstatistik yanıtlarının önbellekte kalma süresi (saniye, 0: kapalı)
+    DASHBOARD_TREND_MAX_MONTHS = 120  # Trend endpoint'inde istenebilecek en fazla ay sayısı
+    REPORT_MAX_PERIODS = 1000  # Finansal rapor serisinde en fazla dönem sayısı
+    
+    # Arama
+    SEARCH_USE_FTS = True  # SQLite FTS5 indekslerini kullan (desteklenmiyorsa ilike'a döner)
+    GLOBAL_SEARCH_LIMIT = 5  # Genel aramada tip başına varsayılan sonuç sayısı
+    GLOBAL_SEARCH_MAX_LIMIT = 20
+    SUGGEST_LIMIT = 10  # Otomatik tamamlamada varsayılan öneri sayısı
+    SUGGEST_MAX_LIMIT = 50
+    
+    # Belge içeriği çıkarma
+    DOCUMENT_EXTRACTION_WORKERS = 2  # Arka plan iş parçacığı sayısı (0: istek içinde çalışır)
+    DOCUMENT_TEXT_MAX_LENGTH = 1000000  # Saklanacak en fazla karakter sayısı
 
 
 class DevelopmentConfig(Config):
@@ -55,12 +92,25 @@ class DevelopmentConfig(Config):
 class ProductionConfig(Config):
     """Üretim ortamı yapılandırması"""
     DEBUG = False
+    SQLITE_PRAGMAS = {
+        **Config.SQLITE_PRAGMAS,
+        'busy_timeout': 10000,
+        'cache_size': -64000,
+        'mmap_size': 256 * 1024 * 1024
+    }
 
 
 class TestingConfig(Config):
     """Test ortamı yapılandırması"""
     TESTING = True
     SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
+    DATABASE_READ_POOL_SIZE = 0
+    SQLITE_PRAGMAS = {
+        'journal_mode': 'memory',
+        'synchronous': 'off',
+        'temp_store': 'memory'
+    }
+    DOCUMENT_EXTRACTION_WORKERS = 0
 
 
 # Yapılandırma eşlemesi
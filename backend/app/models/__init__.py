@@ -9,9 +9,11 @@ from app.models.client import Client
 from app.models.case import Case
 from app.models.transaction import Transaction, Installment
 from app.models.lead import Lead
-from app.models.document import Document
+from app.models.document import Document, DocumentContent
 from app.models.calendar_event import CalendarEvent
 from app.models.template import Template
+from app.models.finance_rollup import FinanceRollup
+from app.models.counters import rebuild_client_counters, rebuild_transaction_totals, rebuild_finance_rollup
 
 __all__ = [
     'User',
@@ -21,6 +23,11 @@ __all__ = [
     'Installment',
     'Lead',
     'Document',
+    'DocumentContent',
     'CalendarEvent',
-    'Template'
+    'Template',
+    'FinanceRollup',
+    'rebuild_client_counters',
+    'rebuild_transaction_totals',
+    'rebuild_finance_rollup'
 ]
@@ -6,9 +6,10 @@ Takvim etkinliği veritabanı modelini tanımlar.
 
 from datetime import datetime
 from app import db
+from app.models.serializer import SerializerMixin
 
 
-class CalendarEvent(db.Model):
+class CalendarEvent(SerializerMixin, db.Model):
     """
     Takvim etkinliği modeli
     
@@ -30,11 +31,15 @@ class CalendarEvent(db.Model):
     """
     
     __tablename__ = 'calendar_events'
+    __table_args__ = (
+        db.Index('ix_calendar_events_status_start', 'status', 'start_datetime'),
+        db.Index('ix_calendar_events_related', 'related_to', 'related_id'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(200), nullable=False)
-    event_type = db.Column(db.String(50), nullable=False)
-    start_datetime = db.Column(db.DateTime, nullable=False)
+    event_type = db.Column(db.String(50), nullable=False, index=True)
+    start_datetime = db.Column(db.DateTime, nullable=False, index=True)
     end_datetime = db.Column(db.DateTime)
     location = db.Column(db.String(200))
     related_to = db.Column(db.String(20))  # case, client
@@ -67,6 +72,20 @@ class CalendarEvent(db.Model):
         'postponed': 'Ertelendi'
     }
     
+    # Serileştirme alanları
+    COMPUTED_FIELDS = {
+        'event_type_display': ('event_type',),
+        'status_display': ('status',),
+        'is_past': ('start_datetime',),
+        'is_upcoming': ('start_datetime', 'status'),
+        'duration_minutes': ('start_datetime', 'end_datetime')
+    }
+    RELATION_FIELDS = {
+        'creator': ('created_by',),
+        'related_case': ('related_to', 'related_id'),
+        'related_client': ('related_to', 'related_id')
+    }
+    
     @property
     def event_type_display(self):
         """Etkinlik tipi görüntü adını döndürür"""
@@ -95,42 +114,68 @@ class CalendarEvent(db.Model):
             return int(delta.total_seconds() / 60)
         return None
     
-    def to_dict(self, include_relations=False):
-        """Model'i sözlük olarak döndürür"""
-        data = {
-            'id': self.id,
-            'title': self.title,
-            'event_type': self.event_type,
-            'event_type_display': self.event_type_display,
-            'start_datetime': self.start_datetime.isoformat() if self.start_datetime else None,
-            'end_datetime': self.end_datetime.isoformat() if self.end_datetime else None,
-            'location': self.location,
-            'related_to': self.related_to,
-            'related_id': self.related_id,
-            'reminder_time': self.reminder_time,
-            'status': self.status,
-            'status_display': self.status_display,
-            'is_past': self.is_past,
-            'is_upcoming': self.is_upcoming,
-            'duration_minutes': self.duration_minutes,
-            'description': self.description,
-            'created_by': self.created_by,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
-        }
+    @staticmethod
+    def _related_model(related_to):
+        """İlişkili varlık tipine karşılık gelen modeli döndürür"""
+        if related_to == 'case':
+            from app.models.case import Case
+            return Case
+        if related_to == 'client':
+            from app.models.client import Client
+            return Client
+        return None
+    
+    @classmethod
+    def load_related(cls, events):
+        """
+        Etkinliklerin ilişkili varlıklarını toplu yükler
+        
+        Etkinlikler related_to alanına göre gruplanır ve her varlık tipi
+        tek bir IN sorgusuyla getirilir.
+        
+        Args:
+            events: Etkinlik listesi
+        
+        Returns:
+            dict: (related_to, related_id) -> ilişkili model nesnesi
+        """
+        ids_by_type = {}
+        for event in events:
+            if event.related_id and cls._related_model(event.related_to):
+                ids_by_type.setdefault(event.related_to, set()).add(event.related_id)
+        
+        related = {}
+        for related_to, ids in ids_by_type.items():
+            model = cls._related_model(related_to)
+            for obj in model.query.filter(model.id.in_(ids)).all():
+                related[(related_to, obj.id)] = obj
+        
+        return related
+    
+    def to_dict(self, include_relations=False, related=None, fields=None):
+        """
+        Model'i sözlük olarak döndürür
+        
+        Args:
+            include_relations: İlişkili verileri ekle
+            related: load_related ile önceden yüklenmiş ilişkili varlıklar
+            fields: Yalnızca bu alanları döndür (None ise tümü)
+        """
+        data = self.serialize_fields(fields)
         
         if include_relations:
-            data['creator'] = self.creator.to_dict() if self.creator else None
+            if self.wants(fields, 'creator'):
+                data['creator'] = self.creator.to_dict() if self.creator else None
             
             # İlişkili varlığı ekle
-            if self.related_to == 'case' and self.related_id:
-                from app.models.case import Case
-                case = Case.query.get(self.related_id)
-                data['related_case'] = case.to_dict() if case else None
-            elif self.related_to == 'client' and self.related_id:
-                from app.models.client import Client
-                client = Client.query.get(self.related_id)
-                data['related_client'] = client.to_dict() if client else None
+            wants_related = self.wants(fields, 'related_case', 'related_client')
+            model = self._related_model(self.related_to) if wants_related else None
+            if model and self.related_id and self.wants(fields, f'related_{self.related_to}'):
+                if related is None:
+                    target = model.query.get(self.related_id)
+                else:
+                    target = related.get((self.related_to, self.related_id))
+                data[f'related_{self.related_to}'] = target.to_dict() if target else None
         
         return data
     
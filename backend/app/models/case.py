@@ -6,9 +6,12 @@ Dava veritabanı modelini tanımlar.
 
 from datetime import datetime
 from app import db
+from app.models.serializer import SerializerMixin
+from app.models.money import Money
+from app.models.normalized import NormalizedColumnsMixin, normalize_text
 
 
-class Case(db.Model):
+class Case(SerializerMixin, NormalizedColumnsMixin, db.Model):
     """
     Dava modeli
     
@@ -29,27 +32,32 @@ class Case(db.Model):
         notes: Notlar
         created_at: Oluşturulma tarihi
         updated_at: Güncellenme tarihi
+        *_normalized: Arama için normalize edilmiş dava numarası ve karşı taraf
     """
     
     __tablename__ = 'cases'
     
     id = db.Column(db.Integer, primary_key=True)
     case_number = db.Column(db.String(50), unique=True, index=True)
-    client_id = db.Column(db.Integer, db.ForeignKey('clients.id'), nullable=False)
-    lawyer_id = db.Column(db.Integer, db.ForeignKey('users.id'))
-    case_type = db.Column(db.String(50), nullable=False)
+    client_id = db.Column(db.Integer, db.ForeignKey('clients.id'), nullable=False, index=True)
+    lawyer_id = db.Column(db.Integer, db.ForeignKey('users.id'), index=True)
+    case_type = db.Column(db.String(50), nullable=False, index=True)
     court_name = db.Column(db.String(100))
     subject = db.Column(db.Text, nullable=False)
     opposing_party = db.Column(db.String(200))
-    status = db.Column(db.String(20), default='open')
+    status = db.Column(db.String(20), default='open', index=True)
     start_date = db.Column(db.Date, default=datetime.utcnow)
     end_date = db.Column(db.Date)
     next_hearing_date = db.Column(db.DateTime)
-    case_value = db.Column(db.Numeric(15, 2))
+    case_value = db.Column(Money)
     notes = db.Column(db.Text)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
+    # Arama kolonları (kayıt sırasında otomatik doldurulur)
+    case_number_normalized = db.Column(db.String(50), index=True)
+    opposing_party_normalized = db.Column(db.String(200), index=True)
+    
     # İlişkiler
     transactions = db.relationship('Transaction', backref='case', lazy='dynamic')
     documents = db.relationship('Document',
@@ -86,6 +94,27 @@ class Case(db.Model):
         'appealed': 'Temyizde'
     }
     
+    # Serileştirme alanları
+    COMPUTED_FIELDS = {
+        'case_type_display': ('case_type',),
+        'status_display': ('status',),
+        'is_active': ('status',)
+    }
+    RELATION_FIELDS = {
+        'client': ('client_id',),
+        'lawyer': ('lawyer_id',),
+        'total_income': (),
+        'total_expense': ()
+    }
+    HIDDEN_COLUMNS = ('case_number_normalized', 'opposing_party_normalized')
+    
+    # Tam metin arama kolonları
+    SEARCH_COLUMNS = ('case_number', 'subject', 'court_name', 'opposing_party')
+    NORMALIZED_COLUMNS = {
+        'case_number': ('case_number_normalized', normalize_text),
+        'opposing_party': ('opposing_party_normalized', normalize_text)
+    }
+    
     @property
     def case_type_display(self):
         """Dava tipi görüntü adını döndürür"""
@@ -119,35 +148,64 @@ class Case(db.Model):
             status='paid'
         ).with_entities(db.func.sum(Transaction.amount)).scalar() or 0
     
-    def to_dict(self, include_relations=False):
-        """Model'i sözlük olarak döndürür"""
-        data = {
-            'id': self.id,
-            'case_number': self.case_number,
-            'client_id': self.client_id,
-            'lawyer_id': self.lawyer_id,
-            'case_type': self.case_type,
-            'case_type_display': self.case_type_display,
-            'court_name': self.court_name,
-            'subject': self.subject,
-            'opposing_party': self.opposing_party,
-            'status': self.status,
-            'status_display': self.status_display,
-            'is_active': self.is_active,
-            'start_date': self.start_date.isoformat() if self.start_date else None,
-            'end_date': self.end_date.isoformat() if self.end_date else None,
-            'next_hearing_date': self.next_hearing_date.isoformat() if self.next_hearing_date else None,
-            'case_value': float(self.case_value) if self.case_value else None,
-            'notes': self.notes,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+    @classmethod
+    def load_totals(cls, cases):
+        """
+        Dava listesi için ödenmiş gelir ve gider toplamlarını toplu hesaplar
+        
+        Tüm davaların toplamları tek bir GROUP BY sorgusuyla alınır.
+        
+        Args:
+            cases: Dava listesi
+        
+        Returns:
+            dict: Dava ID'si -> {'total_income', 'total_expense'}
+        """
+        from app.models.transaction import Transaction
+        
+        case_ids = [c.id for c in cases]
+        if not case_ids:
+            return {}
+        
+        rows = db.session.query(
+            Transaction.case_id,
+            db.func.sum(db.case((Transaction.transaction_type == 'income', Transaction.amount), else_=0)),
+            db.func.sum(db.case((Transaction.transaction_type == 'expense', Transaction.amount), else_=0))
+        ).filter(
+            Transaction.case_id.in_(case_ids),
+            Transaction.status == 'paid'
+        ).group_by(Transaction.case_id).all()
+        
+        totals = {
+            case_id: {'total_income': income or 0, 'total_expense': expense or 0}
+            for case_id, income, expense in rows
         }
         
+        return {
+            case_id: totals.get(case_id, {'total_income': 0, 'total_expense': 0})
+            for case_id in case_ids
+        }
+    
+    def to_dict(self, include_relations=False, totals=None, fields=None):
+        """
+        Model'i sözlük olarak döndürür
+        
+        Args:
+            include_relations: İlişkili verileri ekle
+            totals: load_totals ile önceden hesaplanmış gelir/gider toplamları
+            fields: Yalnızca bu alanları döndür (None ise tümü)
+        """
+        data = self.serialize_fields(fields)
+        
         if include_relations:
-            data['client'] = self.client.to_dict() if self.client else None
-            data['lawyer'] = self.assigned_lawyer.to_dict() if self.assigned_lawyer else None
-            data['total_income'] = float(self.total_income)
-            data['total_expense'] = float(self.total_expense)
+            if self.wants(fields, 'client'):
+                data['client'] = self.client.to_dict() if self.client else None
+            if self.wants(fields, 'lawyer'):
+                data['lawyer'] = self.assigned_lawyer.to_dict() if self.assigned_lawyer else None
+            if self.wants(fields, 'total_income'):
+                data['total_income'] = float(totals['total_income'] if totals else self.total_income)
+            if self.wants(fields, 'total_expense'):
+                data['total_expense'] = float(totals['total_expense'] if totals else self.total_expense)
         
         return data
     
@@ -6,9 +6,12 @@ Müvekkil veritabanı modelini tanımlar.
 
 from datetime import datetime
 from app import db
+from app.models.serializer import SerializerMixin
+from app.models.money import Money
+from app.models.normalized import NormalizedColumnsMixin, normalize_text, normalize_digits
 
 
-class Client(db.Model):
+class Client(SerializerMixin, NormalizedColumnsMixin, db.Model):
     """
     Müvekkil modeli
     
@@ -27,9 +30,15 @@ class Client(db.Model):
         created_by: Oluşturan kullanıcı ID'si
         created_at: Oluşturulma tarihi
         updated_at: Güncellenme tarihi
+        *_normalized: Arama için normalize edilmiş ad, soyad, e-posta ve telefon
+        active_cases_count: Aktif dava sayısı (dava değişiklikleriyle güncellenir)
+        total_debt: Ödenmemiş gelir işlemlerinin toplamı (işlem değişiklikleriyle güncellenir)
     """
     
     __tablename__ = 'clients'
+    __table_args__ = (
+        db.Index('ix_clients_status_created_at', 'status', 'created_at'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     tc_no = db.Column(db.String(11), unique=True, index=True)
@@ -41,11 +50,21 @@ class Client(db.Model):
     birth_date = db.Column(db.Date)
     occupation = db.Column(db.String(100))
     notes = db.Column(db.Text)
-    status = db.Column(db.String(20), default='active')
+    status = db.Column(db.String(20), default='active', index=True)
     created_by = db.Column(db.Integer, db.ForeignKey('users.id'))
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
+    # Arama kolonları (kayıt sırasında otomatik doldurulur)
+    name_normalized = db.Column(db.String(50), index=True)
+    surname_normalized = db.Column(db.String(50), index=True)
+    email_normalized = db.Column(db.String(120), index=True)
+    phone_normalized = db.Column(db.String(20), index=True)
+    
+    # Sayaç kolonları (app.models.counters tarafından güncel tutulur)
+    active_cases_count = db.Column(db.Integer, default=0, nullable=False, index=True)
+    total_debt = db.Column(Money, default=0, nullable=False, index=True)
+    
     # İlişkiler
     cases = db.relationship('Case', backref='client', lazy='dynamic')
     transactions = db.relationship('Transaction', backref='client', lazy='dynamic')
@@ -61,6 +80,29 @@ class Client(db.Model):
         'potential': 'Potansiyel'
     }
     
+    # Serileştirme alanları
+    COMPUTED_FIELDS = {
+        'full_name': ('name', 'surname'),
+        'status_display': ('status',)
+    }
+    RELATION_FIELDS = {
+        'active_cases_count': ('active_cases_count',),
+        'total_debt': ('total_debt',)
+    }
+    HIDDEN_COLUMNS = (
+        'name_normalized', 'surname_normalized', 'email_normalized', 'phone_normalized',
+        'active_cases_count', 'total_debt'
+    )
+    
+    # Tam metin arama kolonları
+    SEARCH_COLUMNS = ('name', 'surname', 'email', 'phone', 'tc_no')
+    NORMALIZED_COLUMNS = {
+        'name': ('name_normalized', normalize_text),
+        'surname': ('surname_normalized', normalize_text),
+        'email': ('email_normalized', normalize_text),
+        'phone': ('phone_normalized', normalize_digits)
+    }
+    
     @property
     def full_name(self):
         """Tam adı döndürür"""
@@ -71,50 +113,42 @@ class Client(db.Model):
         """Durum görüntü adını döndürür"""
         return self.STATUSES.get(self.status, self.status)
     
-    @property
-    def active_cases_count(self):
-        """Aktif dava sayısını döndürür"""
-        from app.models.case import Case
-        return self.cases.filter(Case.status.in_(['open', 'pending', 'in_progress'])).count()
+    # Aktif sayılan dava durumları
+    ACTIVE_CASE_STATUSES = ['open', 'pending', 'in_progress']
     
-    @property
-    def total_debt(self):
-        """Toplam borç miktarını döndürür"""
-        from app.models.transaction import Transaction
-        income = self.transactions.filter_by(transaction_type='income', status='paid').with_entities(
-            db.func.sum(Transaction.amount)
-        ).scalar() or 0
+    # Sayaç kolonları
+    COUNTER_COLUMNS = ('active_cases_count', 'total_debt')
+    
+    @classmethod
+    def backfill_columns(cls, connection, added_columns):
+        """
+        Şema güncellemesinde eklenen normalize ve sayaç kolonlarını doldurur
+        
+        Args:
+            connection: Veritabanı bağlantısı
+            added_columns: Tabloya yeni eklenen kolon adları
+        """
+        super().backfill_columns(connection, added_columns)
         
-        expected = self.transactions.filter_by(transaction_type='income').with_entities(
-            db.func.sum(Transaction.amount)
-        ).scalar() or 0
+        if set(cls.COUNTER_COLUMNS) & set(added_columns):
+            from app.models.counters import rebuild_client_counters
+            rebuild_client_counters(connection)
+    
+    def to_dict(self, include_relations=False, fields=None):
+        """
+        Model'i sözlük olarak döndürür
         
-        return expected - income
-    
-    def to_dict(self, include_relations=False):
-        """Model'i sözlük olarak döndürür"""
-        data = {
-            'id': self.id,
-            'tc_no': self.tc_no,
-            'name': self.name,
-            'surname': self.surname,
-            'full_name': self.full_name,
-            'email': self.email,
-            'phone': self.phone,
-            'address': self.address,
-            'birth_date': self.birth_date.isoformat() if self.birth_date else None,
-            'occupation': self.occupation,
-            'notes': self.notes,
-            'status': self.status,
-            'status_display': self.status_display,
-            'created_by': self.created_by,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
-        }
+        Args:
+            include_relations: Aktif dava sayısı ve toplam borcu ekle
+            fields: Yalnızca bu alanları döndür (None ise tümü)
+        """
+        data = self.serialize_fields(fields)
         
         if include_relations:
-            data['active_cases_count'] = self.active_cases_count
-            data['total_debt'] = float(self.total_debt) if self.total_debt else 0
+            if self.wants(fields, 'active_cases_count'):
+                data['active_cases_count'] = self.active_cases_count or 0
+            if self.wants(fields, 'total_debt'):
+                data['total_debt'] = float(self.total_debt) if self.total_debt else 0
         
         return data
     
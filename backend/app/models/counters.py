@@ -0,0 +1,328 @@
+# -*- coding: utf-8 -*-
+"""
+Avukat Yönetim Sistemi - Sayaç Kolonları
+Başka tablolardan türetilen toplamların (müvekkilin aktif dava sayısı ve
+toplam borcu, işlemin ödenen/kalan tutarı ve taksit sayıları, aylık finans
+özeti) kaynak kayıtlarla birlikte güncel tutulması.
+
+Kaynak kayıt eklendiğinde, silindiğinde ya da ilgili kolonları
+değiştiğinde hedef satıra yalnızca fark (+1, -1, +tutar) yazılır; bu
+güncelleme değişikliği yapan flush ile aynı işlem içinde çalışır.
+Toplu güncellemeler gibi olayları tetiklemeyen değişiklikler için
+rebuild_* fonksiyonları sayaçları baştan hesaplar.
+"""
+
+from sqlalchemy import event, select, insert, update, delete, func, or_, literal
+from app.models.client import Client
+from app.models.case import Case
+from app.models.transaction import Transaction, Installment
+from app.models.finance_rollup import FinanceRollup
+from app.models.money import Money, parse_money
+
+# Sayaçları etkileyen kolonlar
+_CASE_COLUMNS = ('client_id', 'status')
+_TRANSACTION_COLUMNS = ('client_id', 'transaction_type', 'category', 'status', 'currency', 'date', 'amount')
+_INSTALLMENT_COLUMNS = ('transaction_id', 'status', 'amount')
+
+
+def _case_contribution(values):
+    """Davanın müvekkil sayaçlarına katkısı: (müvekkil ID'si, kolon farkları)"""
+    active = 1 if values['status'] in Client.ACTIVE_CASE_STATUSES else 0
+    return values['client_id'], {'active_cases_count': active}
+
+
+def _transaction_contribution(values):
+    """İşlemin müvekkil sayaçlarına katkısı: (müvekkil ID'si, kolon farkları)"""
+    unpaid = values['transaction_type'] == 'income' and values['status'] != 'paid'
+    return values['client_id'], {'total_debt': values['amount'] if unpaid else 0}
+
+
+def _rollup_contribution(values):
+    """İşlemin aylık finans özetine katkısı: (özet anahtarı, kolon farkları)"""
+    return FinanceRollup.key_for(values), {'total': values['amount'], 'transaction_count': 1}
+
+
+def _installment_contribution(values):
+    """Taksitin işlem toplamlarına katkısı: (işlem ID'si, kolon farkları)"""
+    paid = values['status'] == 'paid'
+    amount = values['amount'] if paid else 0
+    return values['transaction_id'], {
+        'installment_count': 1,
+        'paid_installment_count': 1 if paid else 0,
+        'paid_amount': amount,
+        'remaining_amount': -amount
+    }
+
+
+def _current_values(target, columns):
+    """Nesnenin flush edilecek kolon değerlerini döndürür"""
+    return {name: getattr(target, name) for name in columns}
+
+
+def _stored_values(connection, target, columns):
+    """Kaydın veritabanındaki (değişiklik öncesi) kolon değerlerini okur"""
+    table = target.__table__
+    row = connection.execute(
+        select(*[table.c[name] for name in columns]).where(table.c.id == target.id)
+    ).one()
+    return dict(row._mapping)
+
+
+def _changed_values(connection, target, columns):
+    """
+    Güncellenen kaydın eski ve yeni kolon değerlerini döndürür
+    
+    Returns:
+        tuple: (eski değerler, yeni değerler) veya ilgili kolon değişmediyse None
+    """
+    state = target._sa_instance_state
+    histories = {name: state.attrs[name].history for name in columns}
+    if not any(history.has_changes() for history in histories.values()):
+        return None
+    
+    old = _stored_values(connection, target, columns)
+    new = {
+        name: histories[name].added[0] if histories[name].added else old[name]
+        for name in columns
+    }
+    return old, new
+
+
+def _counter_update(table, values):
+    """
+    Sayaç kolonlarını güncelleyen UPDATE ifadesini döndürür
+    
+    Sayaçlar türetilmiş veri olduğundan updated_at kolonunun onupdate
+    değeri tetiklenmez; kolon kendi değerine atanır.
+    """
+    if 'updated_at' in table.c:
+        values = {**values, 'updated_at': table.c.updated_at}
+    return update(table).values(values)
+
+
+def _apply(connection, table, key, deltas, sign):
+    """
+    Hedef satırın sayaçlarına farkları ekler
+    
+    Args:
+        connection: Veritabanı bağlantısı
+        table: Hedef tablo
+        key: Hedef satırın ID'si veya anahtar kolon -> değer sözlüğü;
+            sözlükle belirtilen satır yoksa oluşturulur
+        deltas: Kolon adı -> fark
+        sign: 1 (ekle) veya -1 (çıkar)
+    """
+    values = {name: table.c[name] + sign * delta for name, delta in deltas.items() if delta}
+    if key is None or not values:
+        return
+    
+    if not isinstance(key, dict):
+        connection.execute(_counter_update(table, values).where(table.c.id == key))
+        return
+    
+    conditions = [table.c[name] == value for name, value in key.items()]
+    result = connection.execute(_counter_update(table, values).where(*conditions))
+    if result.rowcount == 0:
+        connection.execute(insert(table).values({
+            **key, **{name: sign * delta for name, delta in deltas.items()}
+        }))
+
+
+def _apply_change(connection, table, old, new):
+    """Eski ve yeni katkı arasındaki farkı hedef tablodaki sayaçlara yazar"""
+    if old is not None:
+        _apply(connection, table, old[0], old[1], -1)
+    if new is not None:
+        _apply(connection, table, new[0], new[1], 1)
+
+
+def _track(model, columns, targets):
+    """
+    Modelin ekleme, güncelleme ve silme olaylarını hedef tablolardaki sayaçlara bağlar
+    
+    Args:
+        model: Kaynak model
+        columns: Sayaçları etkileyen kolonlar
+        targets: (hedef model, katkı fonksiyonu) listesi
+    """
+    targets = [(target_model.__table__, contribution) for target_model, contribution in targets]
+    
+    @event.listens_for(model, 'after_insert')
+    def _inserted(mapper, connection, target):
+        values = _current_values(target, columns)
+        for table, contribution in targets:
+            _apply_change(connection, table, None, contribution(values))
+    
+    @event.listens_for(model, 'before_update')
+    def _updated(mapper, connection, target):
+        values = _changed_values(connection, target, columns)
+        if values:
+            for table, contribution in targets:
+                _apply_change(connection, table, contribution(values[0]), contribution(values[1]))
+    
+    @event.listens_for(model, 'before_delete')
+    def _deleted(mapper, connection, target):
+        values = _stored_values(connection, target, columns)
+        for table, contribution in targets:
+            _apply_change(connection, table, contribution(values), None)
+
+
+_track(Case, _CASE_COLUMNS, [(Client, _case_contribution)])
+_track(Transaction, _TRANSACTION_COLUMNS, [(Client, _transaction_contribution), (FinanceRollup, _rollup_contribution)])
+_track(Installment, _INSTALLMENT_COLUMNS, [(Transaction, _installment_contribution)])
+
+
+@event.listens_for(Transaction, 'before_insert')
+def _transaction_inserting(mapper, connection, target):
+    """Yeni işlemin kalan tutarını başlatır (taksitler işlemden sonra eklenir)"""
+    target.remaining_amount = parse_money(target.amount) - parse_money(target.paid_amount or 0)
+
+
+@event.listens_for(Transaction, 'before_update')
+def _transaction_updating(mapper, connection, target):
+    """Tutar değiştiğinde kalan tutarı veritabanındaki ödenen tutardan yeniden hesaplar"""
+    if target._sa_instance_state.attrs.amount.history.has_changes():
+        paid_amount = Transaction.__table__.c.paid_amount
+        target.remaining_amount = literal(target.amount, Money()) - paid_amount
+
+
+def rebuild_client_counters(connection):
+    """
+    Tüm müvekkillerin sayaçlarını dava ve işlem tablolarından yeniden hesaplar
+    
+    Yalnızca değeri hesaplanan değerden farklı olan satırlar güncellenir.
+    
+    Args:
+        connection: Veritabanı bağlantısı
+    
+    Returns:
+        int: Düzeltilen müvekkil sayısı
+    """
+    clients = Client.__table__
+    cases = Case.__table__
+    transactions = Transaction.__table__
+    
+    active_cases = select(func.count()).where(
+        cases.c.client_id == clients.c.id,
+        cases.c.status.in_(Client.ACTIVE_CASE_STATUSES)
+    ).scalar_subquery()
+    
+    total_debt = select(func.coalesce(func.sum(transactions.c.amount), 0)).where(
+        transactions.c.client_id == clients.c.id,
+        transactions.c.transaction_type == 'income',
+        or_(transactions.c.status.is_(None), transactions.c.status != 'paid')
+    ).scalar_subquery()
+    
+    result = connection.execute(
+        _counter_update(clients, {
+            'active_cases_count': active_cases,
+            'total_debt': total_debt
+        }).where(or_(
+            clients.c.active_cases_count != active_cases,
+            clients.c.total_debt != total_debt
+        ))
+    )
+    return result.rowcount
+
+
+def rebuild_transaction_totals(connection):
+    """
+    Tüm işlemlerin taksit toplamlarını taksit tablosundan yeniden hesaplar
+    
+    Yalnızca değeri hesaplanan değerden farklı olan satırlar güncellenir.
+    
+    Args:
+        connection: Veritabanı bağlantısı
+    
+    Returns:
+        int: Düzeltilen işlem sayısı
+    """
+    transactions = Transaction.__table__
+    installments = Installment.__table__
+    
+    installment_count = select(func.count()).where(
+        installments.c.transaction_id == transactions.c.id
+    ).scalar_subquery()
+    
+    paid_count = select(func.count()).where(
+        installments.c.transaction_id == transactions.c.id,
+        installments.c.status == 'paid'
+    ).scalar_subquery()
+    
+    paid_amount = select(func.coalesce(func.sum(installments.c.amount), 0)).where(
+        installments.c.transaction_id == transactions.c.id,
+        installments.c.status == 'paid'
+    ).scalar_subquery()
+    
+    remaining_amount = transactions.c.amount - paid_amount
+    
+    result = connection.execute(
+        _counter_update(transactions, {
+            'installment_count': installment_count,
+            'paid_installment_count': paid_count,
+            'paid_amount': paid_amount,
+            'remaining_amount': remaining_amount
+        }).where(or_(
+            transactions.c.installment_count != installment_count,
+            transactions.c.paid_installment_count != paid_count,
+            transactions.c.paid_amount != paid_amount,
+            transactions.c.remaining_amount != remaining_amount
+        ))
+    )
+    return result.rowcount
+
+
+def rebuild_finance_rollup(connection):
+    """
+    Aylık finans özetini işlem tablosundan yeniden hesaplar
+    
+    İşlemler tek bir GROUP BY sorgusuyla gün bazında toplanır ve aylara
+    Python tarafında katlanır; yalnızca farklı olan özet satırları
+    eklenir, güncellenir veya silinir.
+    
+    Args:
+        connection: Veritabanı bağlantısı
+    
+    Returns:
+        int: Düzeltilen özet satırı sayısı
+    """
+    transactions = Transaction.__table__
+    rollups = FinanceRollup.__table__
+    group_columns = [transactions.c[name] for name in ('date', 'transaction_type', 'category', 'status', 'currency')]
+    
+    expected = {}
+    rows = connection.execute(
+        select(*group_columns, func.sum(transactions.c.amount).label('total'), func.count().label('transaction_count'))
+        .group_by(*group_columns)
+    )
+    for row in rows:
+        key = tuple(FinanceRollup.key_for(row._mapping).values())
+        total, count = expected.get(key, (0, 0))
+        expected[key] = (total + row.total, count + row.transaction_count)
+    
+    existing = {}
+    for row in connection.execute(select(rollups)):
+        key = tuple(getattr(row, name) for name in FinanceRollup.KEY_COLUMNS)
+        existing[key] = row
+    
+    fixed = 0
+    for key, row in existing.items():
+        if key not in expected:
+            connection.execute(delete(rollups).where(rollups.c.id == row.id))
+            fixed += 1 if row.total or row.transaction_count else 0
+    
+    for key, (total, count) in expected.items():
+        row = existing.get(key)
+        if row is None:
+            connection.execute(insert(rollups).values({
+                **dict(zip(FinanceRollup.KEY_COLUMNS, key)), 'total': total, 'transaction_count': count
+            }))
+        elif (row.total, row.transaction_count) != (total, count):
+            connection.execute(
+                update(rollups).where(rollups.c.id == row.id).values(total=total, transaction_count=count)
+            )
+        else:
+            continue
+        fixed += 1
+    
+    return fixed
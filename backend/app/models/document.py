@@ -6,9 +6,10 @@ Belge veritabanı modelini tanımlar.
 
 from datetime import datetime
 from app import db
+from app.models.serializer import SerializerMixin
 
 
-class Document(db.Model):
+class Document(SerializerMixin, db.Model):
     """
     Belge modeli
     
@@ -29,6 +30,9 @@ class Document(db.Model):
     """
     
     __tablename__ = 'documents'
+    __table_args__ = (
+        db.Index('ix_documents_related', 'related_to', 'related_id'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     filename = db.Column(db.String(255), nullable=False)
@@ -36,16 +40,17 @@ class Document(db.Model):
     file_path = db.Column(db.String(500), nullable=False)
     file_size = db.Column(db.Integer)
     mime_type = db.Column(db.String(100))
-    document_type = db.Column(db.String(50))
+    document_type = db.Column(db.String(50), index=True)
     related_to = db.Column(db.String(20))  # client, case
     related_id = db.Column(db.Integer)
     description = db.Column(db.Text)
     uploaded_by = db.Column(db.Integer, db.ForeignKey('users.id'))
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     # İlişkiler
     uploader = db.relationship('User', foreign_keys=[uploaded_by])
+    extracted_content = db.relationship('DocumentContent', uselist=False, cascade='all, delete-orphan')
     
     # Belge tipleri
     DOCUMENT_TYPES = {
@@ -60,6 +65,20 @@ class Document(db.Model):
         'other': 'Diğer'
     }
     
+    # Serileştirme alanları
+    COMPUTED_FIELDS = {
+        'file_size_display': ('file_size',),
+        'document_type_display': ('document_type',),
+        'extension': ('original_filename',)
+    }
+    RELATION_FIELDS = {
+        'uploader': ('uploaded_by',)
+    }
+    
+    # Tam metin arama kolonları
+    SEARCH_COLUMNS = ('original_filename', 'description')
+    SEARCH_INCLUDES = ('document_contents',)  # Belge ID'si ile eşleşen ek arama tabloları
+    
     @property
     def document_type_display(self):
         """Belge tipi görüntü adını döndürür"""
@@ -71,11 +90,12 @@ class Document(db.Model):
         if not self.file_size:
             return 'Bilinmiyor'
         
+        size = self.file_size
         for unit in ['B', 'KB', 'MB', 'GB']:
-            if self.file_size < 1024:
-                return f'{self.file_size:.1f} {unit}'
-            self.file_size /= 1024
-        return f'{self.file_size:.1f} TB'
+            if size < 1024:
+                return f'{size:.1f} {unit}'
+            size /= 1024
+        return f'{size:.1f} TB'
     
     @property
     def extension(self):
@@ -84,31 +104,48 @@ class Document(db.Model):
             return self.original_filename.rsplit('.', 1)[1].lower()
         return ''
     
-    def to_dict(self, include_relations=False):
-        """Model'i sözlük olarak döndürür"""
-        data = {
-            'id': self.id,
-            'filename': self.filename,
-            'original_filename': self.original_filename,
-            'file_path': self.file_path,
-            'file_size': self.file_size,
-            'file_size_display': self.file_size_display,
-            'mime_type': self.mime_type,
-            'document_type': self.document_type,
-            'document_type_display': self.document_type_display,
-            'extension': self.extension,
-            'related_to': self.related_to,
-            'related_id': self.related_id,
-            'description': self.description,
-            'uploaded_by': self.uploaded_by,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
-        }
+    def to_dict(self, include_relations=False, fields=None):
+        """
+        Model'i sözlük olarak döndürür
+        
+        Args:
+            include_relations: İlişkili verileri ekle
+            fields: Yalnızca bu alanları döndür (None ise tümü)
+        """
+        data = self.serialize_fields(fields)
         
-        if include_relations:
+        if include_relations and self.wants(fields, 'uploader'):
             data['uploader'] = self.uploader.to_dict() if self.uploader else None
         
         return data
     
     def __repr__(self):
         return f'<Document {self.original_filename}>'
+
+
+class DocumentContent(db.Model):
+    """
+    Belge içeriği modeli
+    
+    Yüklenen dosyadan arka planda çıkarılan metni tutar. Belge listesi
+    sorgularını büyütmemek için belgeden ayrı tabloda saklanır.
+    
+    Attributes:
+        id: Belge ID'si
+        content: Çıkarılan metin
+        status: Çıkarma durumu (done, failed)
+        extracted_at: Çıkarma tarihi
+    """
+    
+    __tablename__ = 'document_contents'
+    
+    id = db.Column(db.Integer, db.ForeignKey('documents.id'), primary_key=True)
+    content = db.Column(db.Text)
+    status = db.Column(db.String(20), nullable=False)
+    extracted_at = db.Column(db.DateTime, default=datetime.utcnow)
+    
+    # Tam metin arama kolonları
+    SEARCH_COLUMNS = ('content',)
+    
+    def __repr__(self):
+        return f'<DocumentContent {self.id} {self.status}>'
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""
+Avukat Yönetim Sistemi - Aylık Finans Özeti Modeli
+İşlem tutarlarının ay, tip, kategori, durum ve para birimine göre
+önceden toplanmış halini tutan tabloyu tanımlar.
+
+Dashboard ve finansal rapor toplamları işlem tablosu yerine bu tablodan
+okunur; okuma maliyeti işlem sayısına değil ay sayısına bağlıdır. Tablo
+işlem yazımlarıyla birlikte app.models.counters tarafından güncel tutulur.
+"""
+
+from app import db
+from app.models.money import Money
+
+
+class FinanceRollup(db.Model):
+    """
+    Aylık finans özeti modeli
+    
+    Attributes:
+        id: Benzersiz satır kimliği
+        month: Ay (YYYY-MM, tarihsiz işlemler için boş metin)
+        transaction_type: İşlem tipi (income, expense)
+        category: Kategori
+        status: Ödeme durumu (durumsuz işlemler için boş metin)
+        currency: Para birimi (belirtilmemişse boş metin)
+        total: Tutarların toplamı
+        transaction_count: İşlem sayısı
+    """
+    
+    __tablename__ = 'finance_rollups'
+    __table_args__ = (
+        db.UniqueConstraint('month', 'transaction_type', 'category', 'status', 'currency',
+                            name='uq_finance_rollups_key'),
+    )
+    
+    id = db.Column(db.Integer, primary_key=True)
+    month = db.Column(db.String(7), nullable=False)
+    transaction_type = db.Column(db.String(20), nullable=False)
+    category = db.Column(db.String(50), nullable=False)
+    status = db.Column(db.String(20), nullable=False, default='')
+    currency = db.Column(db.String(3), nullable=False, default='')
+    total = db.Column(Money, nullable=False, default=0)
+    transaction_count = db.Column(db.Integer, nullable=False, default=0)
+    
+    # Satırı belirleyen kolonlar
+    KEY_COLUMNS = ('month', 'transaction_type', 'category', 'status', 'currency')
+    
+    @staticmethod
+    def month_key(value):
+        """Tarihi ay anahtarına çevirir (ör. 2024-03)"""
+        return value.strftime('%Y-%m') if value else ''
+    
+    @classmethod
+    def key_for(cls, values):
+        """
+        İşlem kolon değerlerinden özet satırının anahtarını üretir
+        
+        Args:
+            values: date, transaction_type, category, status, currency değerleri
+        
+        Returns:
+            dict: Anahtar kolon adı -> değer
+        """
+        return {
+            'month': cls.month_key(values['date']),
+            'transaction_type': values['transaction_type'],
+            'category': values['category'],
+            'status': values['status'] or '',
+            'currency': values['currency'] or ''
+        }
+    
+    def __repr__(self):
+        return f'<FinanceRollup {self.month} {self.transaction_type} {self.category} {self.status}>'
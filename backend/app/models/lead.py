@@ -6,9 +6,11 @@ Lead (potansiyel müvekkil) veritabanı modelini tanımlar.
 
 from datetime import datetime
 from app import db
+from app.models.serializer import SerializerMixin
+from app.models.money import Money
 
 
-class Lead(db.Model):
+class Lead(SerializerMixin, db.Model):
     """
     Potansiyel iş/müvekkil modeli
     
@@ -29,20 +31,23 @@ class Lead(db.Model):
     """
     
     __tablename__ = 'leads'
+    __table_args__ = (
+        db.Index('ix_leads_status_follow_up', 'status', 'follow_up_date'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(100), nullable=False)
     contact_info = db.Column(db.String(200))
     case_type = db.Column(db.String(50))
     description = db.Column(db.Text)
-    source = db.Column(db.String(50))
+    source = db.Column(db.String(50), index=True)
     status = db.Column(db.String(20), default='new')
-    estimated_value = db.Column(db.Numeric(15, 2))
+    estimated_value = db.Column(Money)
     follow_up_date = db.Column(db.Date)
     converted_to_client_id = db.Column(db.Integer, db.ForeignKey('clients.id'))
     notes = db.Column(db.Text)
     created_by = db.Column(db.Integer, db.ForeignKey('users.id'))
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     # İlişkiler
@@ -71,6 +76,21 @@ class Lead(db.Model):
         'other': 'Diğer'
     }
     
+    # Serileştirme alanları
+    COMPUTED_FIELDS = {
+        'source_display': ('source',),
+        'status_display': ('status',),
+        'is_converted': ('status', 'converted_to_client_id'),
+        'needs_follow_up': ('follow_up_date', 'status')
+    }
+    RELATION_FIELDS = {
+        'converted_client': ('converted_to_client_id',),
+        'creator': ('created_by',)
+    }
+    
+    # Tam metin arama kolonları
+    SEARCH_COLUMNS = ('name', 'contact_info', 'description')
+    
     @property
     def status_display(self):
         """Durum görüntü adını döndürür"""
@@ -93,32 +113,21 @@ class Lead(db.Model):
             return False
         return self.follow_up_date <= datetime.utcnow().date()
     
-    def to_dict(self, include_relations=False):
-        """Model'i sözlük olarak döndürür"""
-        data = {
-            'id': self.id,
-            'name': self.name,
-            'contact_info': self.contact_info,
-            'case_type': self.case_type,
-            'description': self.description,
-            'source': self.source,
-            'source_display': self.source_display,
-            'status': self.status,
-            'status_display': self.status_display,
-            'estimated_value': float(self.estimated_value) if self.estimated_value else None,
-            'follow_up_date': self.follow_up_date.isoformat() if self.follow_up_date else None,
-            'converted_to_client_id': self.converted_to_client_id,
-            'is_converted': self.is_converted,
-            'needs_follow_up': self.needs_follow_up,
-            'notes': self.notes,
-            'created_by': self.created_by,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
-        }
+    def to_dict(self, include_relations=False, fields=None):
+        """
+        Model'i sözlük olarak döndürür
+        
+        Args:
+            include_relations: İlişkili verileri ekle
+            fields: Yalnızca bu alanları döndür (None ise tümü)
+        """
+        data = self.serialize_fields(fields)
         
         if include_relations:
-            data['converted_client'] = self.converted_client.to_dict() if self.converted_client else None
-            data['creator'] = self.creator.to_dict() if self.creator else None
+            if self.wants(fields, 'converted_client'):
+                data['converted_client'] = self.converted_client.to_dict() if self.converted_client else None
+            if self.wants(fields, 'creator'):
+                data['creator'] = self.creator.to_dict() if self.creator else None
         
         return data
     
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+Avukat Yönetim Sistemi - Para Kolonları
+Parasal tutarların veritabanında tam sayı kuruş olarak saklanması.
+
+SQLite Numeric kolonları REAL olarak saklar; toplamlar ikili kayan nokta
+hatası biriktirir. Money kolonları tutarı kuruş cinsinden INTEGER olarak
+yazar, Python tarafında Decimal döndürür. Böylece SUM gibi toplamlar
+veritabanında tam sayı olarak ve hatasız hesaplanır.
+"""
+
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
+from sqlalchemy.types import TypeDecorator, BigInteger
+
+# Bir liradaki kuruş sayısı
+MINOR_UNITS = 100
+
+_CENT = Decimal('0.01')
+
+# BigInteger (64 bit işaretli tam sayı) kolona sığan en büyük kuruş değeri
+MAX_MINOR_UNITS = 2 ** 63 - 1
+MAX_AMOUNT = Decimal(MAX_MINOR_UNITS).scaleb(-2)
+
+
+def parse_money(value):
+    """
+    Girilen tutarı iki basamaklı Decimal'e çevirir
+    
+    Args:
+        value: Sayı veya metin (ör. 1500, '1500.5', 1500.55)
+    
+    Returns:
+        Decimal: Kuruşa yuvarlanmış tutar
+    
+    Raises:
+        ValueError: Tutar sayı değilse veya kuruş olarak kolona sığmıyorsa
+    """
+    try:
+        amount = value if isinstance(value, Decimal) else Decimal(str(value).strip())
+    except InvalidOperation:
+        raise ValueError(f'Geçersiz tutar: {value!r}')
+    if not amount.is_finite():
+        raise ValueError(f'Geçersiz tutar: {value!r}')
+    try:
+        amount = amount.quantize(_CENT, rounding=ROUND_HALF_UP)
+    except InvalidOperation:
+        raise ValueError(f'Geçersiz tutar: {value!r}')
+    if abs(amount) > MAX_AMOUNT:
+        raise ValueError(f'Geçersiz tutar: {value!r}')
+    return amount
+
+
+def to_minor_units(value):
+    """
+    Tutarı tam sayı kuruşa çevirir (None ise None)
+    
+    Raises:
+        ValueError: Tutar geçersizse veya BigInteger aralığının dışındaysa
+    """
+    if value is None:
+        return None
+    minor_units = int(parse_money(value) * MINOR_UNITS)
+    if abs(minor_units) > MAX_MINOR_UNITS:
+        raise ValueError(f'Geçersiz tutar: {value!r}')
+    return minor_units
+
+
+def from_minor_units(value):
+    """Tam sayı kuruşu Decimal tutara çevirir (None ise None)"""
+    if value is None:
+        return None
+    return Decimal(int(value)).scaleb(-2)
+
+
+class Money(TypeDecorator):
+    """
+    Kuruş cinsinden INTEGER saklanan para kolonu
+    
+    Python tarafında Decimal tutar (ör. Decimal('1500.50')) kullanılır;
+    veritabanına 150050 yazılır. SUM ve karşılaştırmalar da aynı tip
+    dönüşümünden geçer.
+    """
+    
+    impl = BigInteger
+    cache_ok = True
+    
+    @property
+    def python_type(self):
+        return Decimal
+    
+    def process_bind_param(self, value, dialect):
+        return to_minor_units(value)
+    
+    def process_result_value(self, value, dialect):
+        return from_minor_units(value)
+    
+    def process_literal_param(self, value, dialect):
+        return str(to_minor_units(value))
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""
+Avukat Yönetim Sistemi - Normalize Arama Kolonları
+Türkçe harfleri dikkate alan metin normalizasyonu ve normalize kolonların
+kayıt sırasında güncel tutulması.
+"""
+
+import unicodedata
+from sqlalchemy import event, update, bindparam, select
+
+# Türkçe büyük/küçük harf farkları: İ, I ve ı harflerinin tamamı i olarak aranır
+_TURKISH_FOLD = str.maketrans({'İ': 'i', 'I': 'i', 'ı': 'i'})
+
+# Mevcut kayıtlar doldurulurken tek seferde güncellenecek satır sayısı
+BACKFILL_BATCH_SIZE = 1000
+
+
+def normalize_text(value):
+    """
+    Metni arama için normalize eder
+    
+    Türkçe harfler ASCII karşılıklarına indirilir, küçük harfe çevrilir ve
+    fazla boşluklar temizlenir (ör. 'Işık  Şahin' -> 'isik sahin').
+    
+    Args:
+        value: Metin
+    
+    Returns:
+        str: Normalize metin veya boşsa None
+    """
+    if not value:
+        return None
+    value = unicodedata.normalize('NFKD', value.translate(_TURKISH_FOLD).lower())
+    value = ''.join(c for c in value if not unicodedata.combining(c))
+    return ' '.join(value.split()) or None
+
+
+def normalize_digits(value):
+    """
+    Telefon gibi değerlerde yalnızca rakamları bırakır
+    
+    Args:
+        value: Metin (ör. '0 (555) 123 45 67')
+    
+    Returns:
+        str: Rakamlar (ör. '05551234567') veya rakam yoksa None
+    """
+    if not value:
+        return None
+    return ''.join(c for c in value if c.isdigit()) or None
+
+
+class NormalizedColumnsMixin:
+    """
+    Arama için normalize edilmiş kolonları yöneten mixin
+    
+    Normalize kolonlar kayıt eklenirken ve güncellenirken kaynak kolonlardan
+    hesaplanır; bu sayede arama, fonksiyon sarmalanmamış indeksli kolonlarda
+    önek aralığı taraması olarak yapılabilir.
+    
+    Attributes:
+        NORMALIZED_COLUMNS: Kaynak kolon -> (normalize kolon, normalize fonksiyonu)
+    """
+    
+    NORMALIZED_COLUMNS = {}
+    
+    def update_normalized_columns(self):
+        """Normalize kolonları kaynak kolonlardan yeniden hesaplar"""
+        for source, (target, normalize) in self.NORMALIZED_COLUMNS.items():
+            setattr(self, target, normalize(getattr(self, source)))
+    
+    @classmethod
+    def backfill_columns(cls, connection, added_columns):
+        """
+        Şema güncellemesinde eklenen normalize kolonları mevcut kayıtlar için doldurur
+        
+        Kayıtlar BACKFILL_BATCH_SIZE satırlık ID aralıklarıyla okunup güncellenir.
+        
+        Args:
+            connection: Veritabanı bağlantısı
+            added_columns: Tabloya yeni eklenen kolon adları
+        """
+        targets = {target for target, _ in cls.NORMALIZED_COLUMNS.values()}
+        if not targets & set(added_columns):
+            return
+        
+        table = cls.__table__
+        sources = list(cls.NORMALIZED_COLUMNS)
+        statement = update(table).where(table.c.id == bindparam('_id')).values({
+            target: bindparam(target) for target, _ in cls.NORMALIZED_COLUMNS.values()
+        })
+        
+        # Satırlar ID sırasıyla sayfa sayfa okunur; tablo belleğe bir kerede alınmaz
+        page = select(table.c.id, *[table.c[s] for s in sources]).order_by(table.c.id).limit(BACKFILL_BATCH_SIZE)
+        last_id = None
+        while True:
+            query = page if last_id is None else page.where(table.c.id > last_id)
+            rows = connection.execute(query).all()
+            if not rows:
+                break
+            
+            params = []
+            for row in rows:
+                values = {'_id': row.id}
+                for source, (target, normalize) in cls.NORMALIZED_COLUMNS.items():
+                    values[target] = normalize(getattr(row, source))
+                params.append(values)
+            connection.execute(statement, params)
+            last_id = rows[-1].id
+
+
+@event.listens_for(NormalizedColumnsMixin, 'before_insert', propagate=True)
+@event.listens_for(NormalizedColumnsMixin, 'before_update', propagate=True)
+def _update_normalized_columns(mapper, connection, target):
+    """Kayıt yazılmadan önce normalize kolonları günceller"""
+    target.update_normalized_columns()
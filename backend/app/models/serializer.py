@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""
+Avukat Yönetim Sistemi - Model Serileştirme
+Modellerin sözlüğe çevrilmesi ve seçili alan (fields) desteği.
+"""
+
+from datetime import date, datetime
+from decimal import Decimal
+
+
+class SerializerMixin:
+    """
+    Model serileştirme yardımcıları
+    
+    Tablo kolonları otomatik olarak, hesaplanan alanlar COMPUTED_FIELDS
+    üzerinden serileştirilir. fields verildiğinde yalnızca istenen alanlar
+    okunur ve hesaplanır.
+    
+    Attributes:
+        COMPUTED_FIELDS: Hesaplanan alan -> bağlı olduğu kolonlar
+        RELATION_FIELDS: İlişkili alan (include_relations) -> bağlı olduğu kolonlar
+        HIDDEN_COLUMNS: Dışa verilmeyecek kolonlar
+    """
+    
+    COMPUTED_FIELDS = {}
+    RELATION_FIELDS = {}
+    HIDDEN_COLUMNS = ()
+    
+    @classmethod
+    def serializable_columns(cls):
+        """Dışa verilen kolon adlarını döndürür"""
+        return [c.key for c in cls.__table__.columns if c.key not in cls.HIDDEN_COLUMNS]
+    
+    @classmethod
+    def parse_fields(cls, value):
+        """
+        fields parametresini geçerli alan adları kümesine çevirir
+        
+        Args:
+            value: Virgülle ayrılmış alan adları (ör. 'id,name,status')
+        
+        Returns:
+            set: İstenen alanlar (id her zaman dahil) veya tüm alanlar için None
+        """
+        if not value:
+            return None
+        
+        known = set(cls.serializable_columns()) | set(cls.COMPUTED_FIELDS) | set(cls.RELATION_FIELDS)
+        fields = {f.strip() for f in value.split(',')} & known
+        fields.add('id')
+        return fields
+    
+    @classmethod
+    def field_columns(cls, fields):
+        """İstenen alanlar için veritabanından okunması gereken kolon adlarını döndürür"""
+        columns = {'id'}
+        for field in fields:
+            if field in cls.COMPUTED_FIELDS:
+                columns.update(cls.COMPUTED_FIELDS[field])
+            elif field in cls.RELATION_FIELDS:
+                columns.update(cls.RELATION_FIELDS[field])
+            else:
+                columns.add(field)
+        return columns
+    
+    @staticmethod
+    def wants(fields, *keys):
+        """Verilen alanlardan herhangi birinin istenip istenmediğini döndürür"""
+        return fields is None or any(key in fields for key in keys)
+    
+    @staticmethod
+    def serialize_value(value):
+        """Tarih ve ondalık değerleri JSON uyumlu hale getirir"""
+        if isinstance(value, (date, datetime)):
+            return value.isoformat()
+        if isinstance(value, Decimal):
+            return float(value)
+        return value
+    
+    def serialize_fields(self, fields=None):
+        """
+        Kolonları ve hesaplanan alanları sözlük olarak döndürür
+        
+        Args:
+            fields: İstenen alanlar (None ise tümü)
+        """
+        data = {}
+        for key in self.serializable_columns():
+            if fields is None or key in fields:
+                data[key] = self.serialize_value(getattr(self, key))
+        for key in self.COMPUTED_FIELDS:
+            if fields is None or key in fields:
+                data[key] = self.serialize_value(getattr(self, key))
+        return data
@@ -6,9 +6,10 @@ Belge şablonu veritabanı modelini tanımlar.
 
 from datetime import datetime
 from app import db
+from app.models.serializer import SerializerMixin
 
 
-class Template(db.Model):
+class Template(SerializerMixin, db.Model):
     """
     Şablon modeli
     
@@ -62,6 +63,18 @@ class Template(db.Model):
         'general': 'Genel'
     }
     
+    # Serileştirme alanları
+    COMPUTED_FIELDS = {
+        'template_type_display': ('template_type',),
+        'category_display': ('category',)
+    }
+    RELATION_FIELDS = {
+        'creator': ('created_by',)
+    }
+    
+    # Tam metin arama kolonları
+    SEARCH_COLUMNS = ('name', 'content')
+    
     @property
     def template_type_display(self):
         """Şablon tipi görüntü adını döndürür"""
@@ -104,24 +117,21 @@ class Template(db.Model):
                 content = content.replace(placeholder, str(value) if value else '')
         return content
     
-    def to_dict(self, include_relations=False):
-        """Model'i sözlük olarak döndürür"""
-        data = {
-            'id': self.id,
-            'name': self.name,
-            'template_type': self.template_type,
-            'template_type_display': self.template_type_display,
-            'content': self.content,
-            'variables': self.get_variables_list(),
-            'category': self.category,
-            'category_display': self.category_display,
-            'is_public': self.is_public,
-            'created_by': self.created_by,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
-        }
+    def to_dict(self, include_relations=False, fields=None):
+        """
+        Model'i sözlük olarak döndürür
+        
+        Args:
+            include_relations: İlişkili verileri ekle
+            fields: Yalnızca bu alanları döndür (None ise tümü)
+        """
+        data = self.serialize_fields(fields)
+        
+        # Değişkenler JSON metni yerine liste olarak döner
+        if 'variables' in data:
+            data['variables'] = self.get_variables_list()
         
-        if include_relations:
+        if include_relations and self.wants(fields, 'creator'):
             data['creator'] = self.creator.to_dict() if self.creator else None
         
         return data
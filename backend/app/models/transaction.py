@@ -6,9 +6,11 @@ Avukat Yönetim Sistemi - Finansal İşlem Modelleri
 
 from datetime import datetime
 from app import db
+from app.models.serializer import SerializerMixin
+from app.models.money import Money
 
 
-class Transaction(db.Model):
+class Transaction(SerializerMixin, db.Model):
     """
     Finansal işlem modeli
     
@@ -27,27 +29,43 @@ class Transaction(db.Model):
         description: Açıklama
         created_at: Oluşturulma tarihi
         updated_at: Güncellenme tarihi
+        installment_count: Taksit sayısı
+        paid_installment_count: Ödenmiş taksit sayısı
+        paid_amount: Ödenmiş taksitlerin toplamı
+        remaining_amount: Tutar ile ödenen taksitler arasındaki fark
     """
     
     __tablename__ = 'transactions'
+    __table_args__ = (
+        # Dashboard ve rapor toplamları: tip + durum eşitliği, tarih aralığı; tutar indekste
+        db.Index('ix_transactions_type_status_date', 'transaction_type', 'status', 'date', 'amount'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     transaction_type = db.Column(db.String(20), nullable=False)  # income, expense
     category = db.Column(db.String(50), nullable=False)
-    amount = db.Column(db.Numeric(15, 2), nullable=False)
+    amount = db.Column(Money, nullable=False)
     currency = db.Column(db.String(3), default='TRY')
-    date = db.Column(db.Date, default=datetime.utcnow)
+    date = db.Column(db.Date, default=datetime.utcnow, index=True)
     payment_method = db.Column(db.String(50))
-    client_id = db.Column(db.Integer, db.ForeignKey('clients.id'))
-    case_id = db.Column(db.Integer, db.ForeignKey('cases.id'))
-    status = db.Column(db.String(20), default='pending')  # pending, paid, cancelled
+    client_id = db.Column(db.Integer, db.ForeignKey('clients.id'), index=True)
+    case_id = db.Column(db.Integer, db.ForeignKey('cases.id'), index=True)
+    status = db.Column(db.String(20), default='pending', index=True)  # pending, paid, cancelled
     receipt_no = db.Column(db.String(50))
     description = db.Column(db.Text)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
+    # Taksit toplamları (app.models.counters tarafından güncel tutulur)
+    installment_count = db.Column(db.Integer, default=0, nullable=False)
+    paid_installment_count = db.Column(db.Integer, default=0, nullable=False)
+    paid_amount = db.Column(Money, default=0, nullable=False)
+    remaining_amount = db.Column(Money, default=0, nullable=False)
+    
     # İlişkiler
     installments = db.relationship('Installment', backref='transaction', lazy='dynamic', cascade='all, delete-orphan')
+    # Toplu (selectin) yüklenebilen salt okunur taksit listesi
+    installment_list = db.relationship('Installment', order_by='Installment.installment_number', viewonly=True)
     
     # İşlem tipleri
     TRANSACTION_TYPES = {
@@ -90,6 +108,25 @@ class Transaction(db.Model):
         'partial': 'Kısmi Ödeme'
     }
     
+    # Serileştirme alanları
+    COMPUTED_FIELDS = {
+        'transaction_type_display': ('transaction_type',),
+        'category_display': ('category',),
+        'payment_method_display': ('payment_method',),
+        'status_display': ('status',)
+    }
+    RELATION_FIELDS = {
+        'client': ('client_id',),
+        'case': ('case_id',),
+        'installments': ()
+    }
+    
+    # Taksit toplamı kolonları
+    INSTALLMENT_TOTAL_COLUMNS = ('installment_count', 'paid_installment_count', 'paid_amount', 'remaining_amount')
+    
+    # Ödenmemiş bakiye sayılan durumlar
+    OPEN_STATUSES = ('pending', 'partial')
+    
     @property
     def transaction_type_display(self):
         """İşlem tipi görüntü adını döndürür"""
@@ -111,47 +148,36 @@ class Transaction(db.Model):
         """Durum görüntü adını döndürür"""
         return self.STATUSES.get(self.status, self.status)
     
-    @property
-    def paid_amount(self):
-        """Ödenen toplam miktarı döndürür"""
-        return self.installments.filter_by(status='paid').with_entities(
-            db.func.sum(Installment.amount)
-        ).scalar() or 0
-    
-    @property
-    def remaining_amount(self):
-        """Kalan miktarı döndürür"""
-        return float(self.amount) - float(self.paid_amount)
-    
-    def to_dict(self, include_relations=False):
-        """Model'i sözlük olarak döndürür"""
-        data = {
-            'id': self.id,
-            'transaction_type': self.transaction_type,
-            'transaction_type_display': self.transaction_type_display,
-            'category': self.category,
-            'category_display': self.category_display,
-            'amount': float(self.amount),
-            'currency': self.currency,
-            'date': self.date.isoformat() if self.date else None,
-            'payment_method': self.payment_method,
-            'payment_method_display': self.payment_method_display,
-            'client_id': self.client_id,
-            'case_id': self.case_id,
-            'status': self.status,
-            'status_display': self.status_display,
-            'receipt_no': self.receipt_no,
-            'description': self.description,
-            'paid_amount': float(self.paid_amount),
-            'remaining_amount': float(self.remaining_amount),
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
-        }
+    @classmethod
+    def backfill_columns(cls, connection, added_columns):
+        """
+        Şema güncellemesinde eklenen taksit toplamı kolonlarını doldurur
+        
+        Args:
+            connection: Veritabanı bağlantısı
+            added_columns: Tabloya yeni eklenen kolon adları
+        """
+        if set(cls.INSTALLMENT_TOTAL_COLUMNS) & set(added_columns):
+            from app.models.counters import rebuild_transaction_totals
+            rebuild_transaction_totals(connection)
+    
+    def to_dict(self, include_relations=False, fields=None):
+        """
+        Model'i sözlük olarak döndürür
+        
+        Args:
+            include_relations: İlişkili verileri ekle
+            fields: Yalnızca bu alanları döndür (None ise tümü)
+        """
+        data = self.serialize_fields(fields)
         
         if include_relations:
-            data['client'] = self.client.to_dict() if self.client else None
-            data['case'] = self.case.to_dict() if self.case else None
-            data['installments'] = [i.to_dict() for i in self.installments.all()]
+            if self.wants(fields, 'client'):
+                data['client'] = self.client.to_dict() if self.client else None
+            if self.wants(fields, 'case'):
+                data['case'] = self.case.to_dict() if self.case else None
+            if self.wants(fields, 'installments'):
+                data['installments'] = [i.to_dict() for i in self.installment_list]
         
         return data
     
@@ -159,7 +185,7 @@ class Transaction(db.Model):
         return f'<Transaction {self.id} - {self.transaction_type}>'
 
 
-class Installment(db.Model):
+class Installment(SerializerMixin, db.Model):
     """
     Taksit modeli
     
@@ -175,11 +201,14 @@ class Installment(db.Model):
     """
     
     __tablename__ = 'installments'
+    __table_args__ = (
+        db.Index('ix_installments_transaction_status', 'transaction_id', 'status'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     transaction_id = db.Column(db.Integer, db.ForeignKey('transactions.id'), nullable=False)
     installment_number = db.Column(db.Integer, nullable=False)
-    amount = db.Column(db.Numeric(15, 2), nullable=False)
+    amount = db.Column(Money, nullable=False)
     due_date = db.Column(db.Date, nullable=False)
     paid_date = db.Column(db.Date)
     status = db.Column(db.String(20), default='pending')  # pending, paid, overdue
@@ -194,6 +223,12 @@ class Installment(db.Model):
         'overdue': 'Vadesi Geçmiş'
     }
     
+    # Serileştirme alanları
+    COMPUTED_FIELDS = {
+        'status_display': ('status',),
+        'is_overdue': ('status', 'due_date')
+    }
+    
     @property
     def status_display(self):
         """Durum görüntü adını döndürür"""
@@ -206,22 +241,9 @@ class Installment(db.Model):
             return False
         return self.due_date < datetime.utcnow().date()
     
-    def to_dict(self):
+    def to_dict(self, fields=None):
         """Model'i sözlük olarak döndürür"""
-        return {
-            'id': self.id,
-            'transaction_id': self.transaction_id,
-            'installment_number': self.installment_number,
-            'amount': float(self.amount),
-            'due_date': self.due_date.isoformat() if self.due_date else None,
-            'paid_date': self.paid_date.isoformat() if self.paid_date else None,
-            'status': self.status,
-            'status_display': self.status_display,
-            'is_overdue': self.is_overdue,
-            'notes': self.notes,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
-        }
+        return self.serialize_fields(fields)
     
     def __repr__(self):
         return f'<Installment {self.id} - Transaction {self.transaction_id}>'
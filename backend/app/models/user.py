@@ -7,9 +7,10 @@ Kullanıcı veritabanı modelini tanımlar.
 from datetime import datetime
 import bcrypt
 from app import db
+from app.models.serializer import SerializerMixin
 
 
-class User(db.Model):
+class User(SerializerMixin, db.Model):
     """
     Kullanıcı modeli
     
@@ -51,6 +52,16 @@ class User(db.Model):
         'intern': 'Stajyer'
     }
     
+    # Serileştirme alanları
+    COMPUTED_FIELDS = {
+        'full_name': ('name', 'surname'),
+        'role_display': ('role',)
+    }
+    HIDDEN_COLUMNS = ('password_hash',)
+    
+    # Tam metin arama kolonları
+    SEARCH_COLUMNS = ('name', 'surname', 'email')
+    
     def set_password(self, password):
         """Şifreyi hashleyerek saklar"""
         self.password_hash = bcrypt.hashpw(
@@ -87,21 +98,9 @@ class User(db.Model):
         """Kayıt silme yetkisi kontrolü"""
         return self.role in ['admin', 'lawyer']
     
-    def to_dict(self):
+    def to_dict(self, fields=None):
         """Model'i sözlük olarak döndürür"""
-        return {
-            'id': self.id,
-            'email': self.email,
-            'name': self.name,
-            'surname': self.surname,
-            'full_name': self.full_name,
-            'role': self.role,
-            'role_display': self.role_display,
-            'phone': self.phone,
-            'is_active': self.is_active,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
-        }
+        return self.serialize_fields(fields)
     
     def __repr__(self):
         return f'<User {self.email}>'
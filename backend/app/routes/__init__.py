@@ -14,6 +14,8 @@ from app.routes.calendar_routes import calendar_bp
 from app.routes.templates import templates_bp
 from app.routes.dashboard import dashboard_bp
 from app.routes.users import users_bp
+from app.routes.search import search_bp
+from app.routes.suggest import suggest_bp
 
 __all__ = [
     'auth_bp',
@@ -25,5 +27,7 @@ __all__ = [
     'calendar_bp',
     'templates_bp',
     'dashboard_bp',
-    'users_bp'
+    'users_bp',
+    'search_bp',
+    'suggest_bp'
 ]
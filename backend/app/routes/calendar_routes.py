@@ -4,24 +4,33 @@ Avukat Yönetim Sistemi - Takvim Routes
 Takvim etkinliği CRUD endpoint'leri.
 """
 
-from flask import Blueprint, request, jsonify, current_app
+from flask import Blueprint, request, jsonify
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from datetime import datetime, timedelta
+from sqlalchemy.orm import joinedload
 from app import db
 from app.models import CalendarEvent
 from app.utils.decorators import role_required
+from app.utils.pagination import paginate_query
+from app.utils.fields import get_fields, apply_fields
+from app.utils.projection import project_query, to_views, json_response
+from app.utils.export import export_query
 
 calendar_bp = Blueprint('calendar', __name__)
 
 
-@calendar_bp.route('/events', methods=['GET'])
-@jwt_required()
-def get_events():
+def filter_events(query):
     """
-    Etkinlik listesi
+    Etkinlik sorgusuna istekteki filtreleri uygular
+    
+    Query Parameters:
+        event_type: Etkinlik tipi
+        status: Durum filtresi
+        related_to: İlişkili kayıt tipi (case/client)
+        related_id: İlişkili kayıt ID'si
+        start_date: Başlangıç tarihi
+        end_date: Bitiş tarihi
     """
-    page = request.args.get('page', 1, type=int)
-    per_page = request.args.get('per_page', current_app.config['ITEMS_PER_PAGE'], type=int)
     event_type = request.args.get('event_type', '')
     status = request.args.get('status', '')
     related_to = request.args.get('related_to', '')
@@ -29,8 +38,6 @@ def get_events():
     start_date = request.args.get('start_date', '')
     end_date = request.args.get('end_date', '')
     
-    query = CalendarEvent.query
-    
     if event_type:
         query = query.filter(CalendarEvent.event_type == event_type)
     if status:
@@ -54,26 +61,71 @@ def get_events():
         except ValueError:
             pass
     
-    query = query.order_by(CalendarEvent.start_datetime.asc())
-    pagination = query.paginate(page=page, per_page=per_page, error_out=False)
+    return query
+
+
+@calendar_bp.route('/events', methods=['GET'])
+@jwt_required()
+def get_events():
+    """
+    Etkinlik listesi
     
-    return jsonify({
-        'events': [e.to_dict(include_relations=True) for e in pagination.items],
-        'total': pagination.total,
-        'pages': pagination.pages,
-        'current_page': page
+    Sayfa numarası (page) veya imleç (cursor) ile sayfalanır. fields
+    parametresi ile yalnızca istenen alanlar döndürülür.
+    """
+    fields = get_fields(CalendarEvent)
+    
+    query = filter_events(CalendarEvent.query)
+    
+    query = project_query(query, CalendarEvent, fields, CalendarEvent.start_datetime)
+    rows, meta = paginate_query(query, CalendarEvent.start_datetime, CalendarEvent.id, 'asc')
+    events = to_views(CalendarEvent, rows, ['creator'] if CalendarEvent.wants(fields, 'creator') else [])
+    
+    # İlişkili dava/müvekkilleri tip başına tek sorguda yükle
+    related = {}
+    if CalendarEvent.wants(fields, 'related_case', 'related_client'):
+        related = CalendarEvent.load_related(events)
+    
+    return json_response({
+        'events': [
+            e.to_dict(include_relations=True, related=related, fields=fields)
+            for e in events
+        ],
+        **meta
     }), 200
 
 
+@calendar_bp.route('/events/export', methods=['GET'])
+@jwt_required()
+def export_events():
+    """
+    Etkinlik listesini dosya olarak dışa aktarır
+    
+    Liste endpoint'i ile aynı filtreleri kabul eder; kayıtlar başlangıç
+    zamanına göre sıralanır.
+    
+    Query Parameters:
+        format: Dosya biçimi (csv, ndjson)
+        fields: Dışa aktarılacak kolonlar
+        event_type, status, related_to, related_id, start_date, end_date: Liste filtreleri
+    """
+    query = filter_events(CalendarEvent.query)
+    return export_query(query, CalendarEvent, 'events', CalendarEvent.start_datetime, 'asc')
+
+
 @calendar_bp.route('/events/<int:id>', methods=['GET'])
 @jwt_required()
 def get_event(id):
     """
     Tek etkinlik detayı
+    
+    Query Parameters:
+        fields: Döndürülecek alanlar
     """
-    event = CalendarEvent.query.get_or_404(id)
+    fields = get_fields(CalendarEvent)
+    event = apply_fields(CalendarEvent.query, CalendarEvent, fields).get_or_404(id)
     return jsonify({
-        'event': event.to_dict(include_relations=True)
+        'event': event.to_dict(include_relations=True, fields=fields)
     }), 200
 
 
@@ -206,14 +258,18 @@ def get_upcoming_events():
     now = datetime.utcnow()
     end_date = now + timedelta(days=days)
     
-    events = CalendarEvent.query.filter(
+    events = CalendarEvent.query.options(
+        joinedload(CalendarEvent.creator)
+    ).filter(
         CalendarEvent.start_datetime >= now,
         CalendarEvent.start_datetime <= end_date,
         CalendarEvent.status == 'scheduled'
     ).order_by(CalendarEvent.start_datetime.asc()).limit(limit).all()
     
+    related = CalendarEvent.load_related(events)
+    
     return jsonify({
-        'events': [e.to_dict(include_relations=True) for e in events]
+        'events': [e.to_dict(include_relations=True, related=related) for e in events]
     }), 200
 
 
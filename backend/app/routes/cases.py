@@ -4,12 +4,18 @@ Avukat Yönetim Sistemi - Dava Routes
 Dava CRUD işlemleri endpoint'leri.
 """
 
-from flask import Blueprint, request, jsonify, current_app
+from flask import Blueprint, request, jsonify
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from datetime import datetime
 from app import db
 from app.models import Case, Client, User
+from app.models.money import parse_money
 from app.utils.decorators import role_required
+from app.utils.pagination import paginate_query, get_sort_column
+from app.utils.fields import get_fields, apply_fields
+from app.utils.projection import project_query, to_views, json_response
+from app.utils.export import export_query
+from app.services.search_service import search_filter
 
 cases_bp = Blueprint('cases', __name__)
 
@@ -33,51 +39,26 @@ def generate_case_number():
     return f'{year}/{str(new_number).zfill(4)}'
 
 
-@cases_bp.route('', methods=['GET'])
-@jwt_required()
-def get_cases():
+def filter_cases(query):
     """
-    Dava listesi
+    Dava sorgusuna istekteki filtreleri uygular
     
     Query Parameters:
-        page: Sayfa numarası
-        per_page: Sayfa başına kayıt
         search: Arama terimi
         status: Durum filtresi
         case_type: Dava tipi filtresi
         client_id: Müvekkil filtresi
         lawyer_id: Avukat filtresi
-        sort: Sıralama alanı
-        order: Sıralama yönü
-    
-    Returns:
-        cases: Dava listesi
-        total: Toplam kayıt sayısı
     """
-    page = request.args.get('page', 1, type=int)
-    per_page = request.args.get('per_page', current_app.config['ITEMS_PER_PAGE'], type=int)
     search = request.args.get('search', '')
     status = request.args.get('status', '')
     case_type = request.args.get('case_type', '')
     client_id = request.args.get('client_id', type=int)
     lawyer_id = request.args.get('lawyer_id', type=int)
-    sort = request.args.get('sort', 'created_at')
-    order = request.args.get('order', 'desc')
-    
-    # Temel sorgu
-    query = Case.query
     
     # Arama filtresi
     if search:
-        search_filter = f'%{search}%'
-        query = query.filter(
-            db.or_(
-                Case.case_number.ilike(search_filter),
-                Case.subject.ilike(search_filter),
-                Case.court_name.ilike(search_filter),
-                Case.opposing_party.ilike(search_filter)
-            )
-        )
+        query = query.filter(search_filter(Case, search))
     
     # Durum filtresi
     if status:
@@ -95,33 +76,105 @@ def get_cases():
     if lawyer_id:
         query = query.filter(Case.lawyer_id == lawyer_id)
     
-    # Sıralama
-    sort_column = getattr(Case, sort, Case.created_at)
-    if order == 'desc':
-        query = query.order_by(sort_column.desc())
-    else:
-        query = query.order_by(sort_column.asc())
+    return query
+
+
+@cases_bp.route('', methods=['GET'])
+@jwt_required()
+def get_cases():
+    """
+    Dava listesi
     
-    # Sayfalama
-    pagination = query.paginate(page=page, per_page=per_page, error_out=False)
+    Query Parameters:
+        page: Sayfa numarası
+        per_page: Sayfa başına kayıt
+        cursor: İmleçli sayfalama için imleç (ilk sayfa için boş)
+        fields: Döndürülecek alanlar (ör. id,case_number,status)
+        search: Arama terimi
+        status: Durum filtresi
+        case_type: Dava tipi filtresi
+        client_id: Müvekkil filtresi
+        lawyer_id: Avukat filtresi
+        sort: Sıralama alanı
+        order: Sıralama yönü
     
-    return jsonify({
-        'cases': [c.to_dict(include_relations=True) for c in pagination.items],
-        'total': pagination.total,
-        'pages': pagination.pages,
-        'current_page': page
+    Returns:
+        cases: Dava listesi
+        total: Toplam kayıt sayısı
+        next_cursor: Sonraki sayfanın imleci (imleçli sayfalamada)
+    """
+    sort = request.args.get('sort', 'created_at')
+    order = request.args.get('order', 'desc')
+    fields = get_fields(Case)
+    
+    query = filter_cases(Case.query)
+    
+    # Sıralama ve sayfalama
+    sort_column = get_sort_column(Case, sort, Case.created_at)
+    query = project_query(query, Case, fields, sort_column)
+    rows, meta = paginate_query(query, sort_column, Case.id, order)
+    
+    # Müvekkil ve avukatlar sayfa için toplu yüklenir
+    relations = []
+    if Case.wants(fields, 'client'):
+        relations.append('client')
+    if Case.wants(fields, 'lawyer'):
+        relations.append('assigned_lawyer')
+    cases = to_views(Case, rows, relations)
+    
+    # Gelir/gider toplamlarını sayfa için tek sorguda hesapla
+    totals = {}
+    if Case.wants(fields, 'total_income', 'total_expense'):
+        totals = Case.load_totals(cases)
+    
+    return json_response({
+        'cases': [
+            c.to_dict(include_relations=True, totals=totals.get(c.id), fields=fields)
+            for c in cases
+        ],
+        **meta
     }), 200
 
 
+@cases_bp.route('/export', methods=['GET'])
+@jwt_required()
+def export_cases():
+    """
+    Dava listesini dosya olarak dışa aktarır
+    
+    Liste endpoint'i ile aynı filtreleri ve sıralamayı kabul eder.
+    
+    Query Parameters:
+        format: Dosya biçimi (csv, ndjson)
+        fields: Dışa aktarılacak kolonlar
+        search, status, case_type, client_id, lawyer_id, sort, order: Liste filtreleri
+    """
+    sort = request.args.get('sort', 'created_at')
+    order = request.args.get('order', 'desc')
+    
+    query = filter_cases(Case.query)
+    sort_column = get_sort_column(Case, sort, Case.created_at)
+    return export_query(query, Case, 'cases', sort_column, order)
+
+
 @cases_bp.route('/<int:id>', methods=['GET'])
 @jwt_required()
 def get_case(id):
     """
     Tek dava detayı
+    
+    Query Parameters:
+        fields: Döndürülecek alanlar
     """
-    case = Case.query.get_or_404(id)
+    fields = get_fields(Case)
+    case = apply_fields(Case.query, Case, fields).get_or_404(id)
+    
+    totals = None
+    if Case.wants(fields, 'total_income', 'total_expense'):
+        totals = Case.load_totals([case])[case.id]
+    
     return jsonify({
-        'case': case.to_dict(include_relations=True)
+        'case': case.to_dict(include_relations=True, totals=totals, fields=fields)
     }), 200
 
 
@@ -187,7 +240,7 @@ def create_case():
     # Dava değeri
     if data.get('case_value'):
         try:
-            case.case_value = float(data['case_value'])
+            case.case_value = parse_money(data['case_value'])
         except ValueError:
             pass
     
@@ -196,7 +249,7 @@ def create_case():
     
     return jsonify({
         'message': 'Dava başarıyla oluşturuldu',
-        'case': case.to_dict(include_relations=True)
+        'case': case.to_dict(include_relations=True, totals=Case.load_totals([case])[case.id])
     }), 201
 
 
@@ -269,7 +322,7 @@ def update_case(id):
     if 'case_value' in data:
         if data['case_value']:
             try:
-                case.case_value = float(data['case_value'])
+                case.case_value = parse_money(data['case_value'])
             except ValueError:
                 pass
         else:
@@ -279,7 +332,7 @@ def update_case(id):
     
     return jsonify({
         'message': 'Dava başarıyla güncellendi',
-        'case': case.to_dict(include_relations=True)
+        'case': case.to_dict(include_relations=True, totals=Case.load_totals([case])[case.id])
     }), 200
 
 
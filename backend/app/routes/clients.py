@@ -4,15 +4,52 @@ Avukat Yönetim Sistemi - Müvekkil Routes
 Müvekkil CRUD işlemleri endpoint'leri.
 """
 
-from flask import Blueprint, request, jsonify, current_app
+from flask import Blueprint, request, jsonify
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from app import db
 from app.models import Client, User
 from app.utils.decorators import role_required
+from app.utils.pagination import paginate_query, get_sort_column, is_cursor_request
+from app.utils.fields import get_fields, apply_fields
+from app.utils.projection import project_query, to_views, json_response
+from app.utils.export import export_query
+from app.services.search_service import search_filter
 
 clients_bp = Blueprint('clients', __name__)
 
 
+def filter_clients(query):
+    """
+    Müvekkil sorgusuna istekteki filtreleri uygular
+    
+    Query Parameters:
+        search: Arama terimi
+        status: Durum filtresi
+        has_debt: true ise yalnızca borcu olan müvekkiller
+        has_active_cases: true ise yalnızca aktif davası olan müvekkiller
+    """
+    search = request.args.get('search', '')
+    status = request.args.get('status', '')
+    has_debt = request.args.get('has_debt', '')
+    has_active_cases = request.args.get('has_active_cases', '')
+    
+    # Arama filtresi
+    if search:
+        query = query.filter(search_filter(Client, search))
+    
+    # Durum filtresi
+    if status:
+        query = query.filter(Client.status == status)
+    
+    # Sayaç filtreleri
+    if has_debt.lower() == 'true':
+        query = query.filter(Client.total_debt > 0)
+    if has_active_cases.lower() == 'true':
+        query = query.filter(Client.active_cases_count > 0)
+    
+    return query
+
+
 @clients_bp.route('', methods=['GET'])
 @jwt_required()
 def get_clients():
@@ -22,59 +59,59 @@ def get_clients():
     Query Parameters:
         page: Sayfa numarası (varsayılan: 1)
         per_page: Sayfa başına kayıt (varsayılan: 10)
+        cursor: İmleçli sayfalama için imleç (ilk sayfa için boş)
+        fields: Döndürülecek alanlar (ör. id,full_name,status)
         search: Arama terimi
         status: Durum filtresi
-        sort: Sıralama alanı
+        has_debt: true ise yalnızca borcu olan müvekkiller
+        has_active_cases: true ise yalnızca aktif davası olan müvekkiller
+        sort: Sıralama alanı (active_cases_count ve total_debt dahil)
         order: Sıralama yönü (asc/desc)
     
     Returns:
         clients: Müvekkil listesi
         total: Toplam kayıt sayısı
         pages: Toplam sayfa sayısı
+        next_cursor: Sonraki sayfanın imleci (imleçli sayfalamada)
     """
-    page = request.args.get('page', 1, type=int)
-    per_page = request.args.get('per_page', current_app.config['ITEMS_PER_PAGE'], type=int)
-    search = request.args.get('search', '')
-    status = request.args.get('status', '')
     sort = request.args.get('sort', 'created_at')
     order = request.args.get('order', 'desc')
+    fields = get_fields(Client)
     
-    # Temel sorgu
-    query = Client.query
+    query = filter_clients(Client.query)
     
-    # Arama filtresi
-    if search:
-        search_filter = f'%{search}%'
-        query = query.filter(
-            db.or_(
-                Client.name.ilike(search_filter),
-                Client.surname.ilike(search_filter),
-                Client.email.ilike(search_filter),
-                Client.phone.ilike(search_filter),
-                Client.tc_no.ilike(search_filter)
-            )
-        )
+    # Sıralama ve sayfalama (ORM nesnesi yerine kolon projeksiyonu)
+    sort_column = get_sort_column(Client, sort, Client.created_at)
+    counter_columns = [Client.active_cases_count, Client.total_debt] if fields is None else []
+    query = project_query(query, Client, fields, sort_column, *counter_columns)
+    rows, meta = paginate_query(query, sort_column, Client.id, order)
+    clients = to_views(Client, rows)
     
-    # Durum filtresi
-    if status:
-        query = query.filter(Client.status == status)
+    return json_response({
+        'clients': [c.to_dict(include_relations=True, fields=fields) for c in clients],
+        **meta
+    }), 200
+
+
+@clients_bp.route('/export', methods=['GET'])
+@jwt_required()
+def export_clients():
+    """
+    Müvekkil listesini dosya olarak dışa aktarır
     
-    # Sıralama
-    sort_column = getattr(Client, sort, Client.created_at)
-    if order == 'desc':
-        query = query.order_by(sort_column.desc())
-    else:
-        query = query.order_by(sort_column.asc())
+    Liste endpoint'i ile aynı filtreleri ve sıralamayı kabul eder.
     
-    # Sayfalama
-    pagination = query.paginate(page=page, per_page=per_page, error_out=False)
+    Query Parameters:
+        format: Dosya biçimi (csv, ndjson)
+        fields: Dışa aktarılacak kolonlar
+        search, status, has_debt, has_active_cases, sort, order: Liste filtreleri
+    """
+    sort = request.args.get('sort', 'created_at')
+    order = request.args.get('order', 'desc')
     
-    return jsonify({
-        'clients': [c.to_dict(include_relations=True) for c in pagination.items],
-        'total': pagination.total,
-        'pages': pagination.pages,
-        'current_page': page
-    }), 200
+    query = filter_clients(Client.query)
+    sort_column = get_sort_column(Client, sort, Client.created_at)
+    return export_query(query, Client, 'clients', sort_column, order)
 
 
 @clients_bp.route('/<int:id>', methods=['GET'])
@@ -86,12 +123,16 @@ def get_client(id):
     Args:
         id: Müvekkil ID'si
     
+    Query Parameters:
+        fields: Döndürülecek alanlar
+    
     Returns:
         client: Müvekkil detayları
     """
-    client = Client.query.get_or_404(id)
+    fields = get_fields(Client)
+    client = apply_fields(Client.query, Client, fields).get_or_404(id)
     return jsonify({
-        'client': client.to_dict(include_relations=True)
+        'client': client.to_dict(include_relations=True, fields=fields)
     }), 200
 
 
@@ -259,12 +300,28 @@ def get_client_cases(id):
     
     Args:
         id: Müvekkil ID'si
+    
+    Query Parameters:
+        cursor: İmleçli sayfalama için imleç (verilmezse tüm davalar döner)
+        per_page: Sayfa başına kayıt
+        sort: Sıralama alanı
+        order: Sıralama yönü (asc/desc)
     """
+    from app.models import Case
+    
     client = Client.query.get_or_404(id)
-    cases = client.cases.all()
+    
+    if not is_cursor_request():
+        return jsonify({
+            'cases': [c.to_dict() for c in client.cases.all()]
+        }), 200
+    
+    sort_column = get_sort_column(Case, request.args.get('sort', 'created_at'), Case.created_at)
+    cases, meta = paginate_query(client.cases, sort_column, Case.id, request.args.get('order', 'desc'))
     
     return jsonify({
-        'cases': [c.to_dict() for c in cases]
+        'cases': [c.to_dict() for c in cases],
+        **meta
     }), 200
 
 
@@ -276,10 +333,27 @@ def get_client_transactions(id):
     
     Args:
         id: Müvekkil ID'si
+    
+    Query Parameters:
+        cursor: İmleçli sayfalama için imleç (verilmezse tüm işlemler döner)
+        per_page: Sayfa başına kayıt
+        sort: Sıralama alanı
+        order: Sıralama yönü (asc/desc)
     """
+    from app.models import Transaction
+    
     client = Client.query.get_or_404(id)
-    transactions = client.transactions.all()
+    query = client.transactions
+    
+    if not is_cursor_request():
+        return jsonify({
+            'transactions': [t.to_dict() for t in query.all()]
+        }), 200
+    
+    sort_column = get_sort_column(Transaction, request.args.get('sort', 'date'), Transaction.date)
+    transactions, meta = paginate_query(query, sort_column, Transaction.id, request.args.get('order', 'desc'))
     
     return jsonify({
-        'transactions': [t.to_dict() for t in transactions]
+        'transactions': [t.to_dict() for t in transactions],
+        **meta
     }), 200
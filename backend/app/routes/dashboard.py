@@ -4,21 +4,67 @@ Avukat Yönetim Sistemi - Dashboard Routes
 Dashboard istatistikleri endpoint'i.
 """
 
-from flask import Blueprint, jsonify
-from flask_jwt_extended import jwt_required
+from flask import Blueprint, jsonify, request, current_app
+from flask_jwt_extended import jwt_required, get_jwt_identity
 from datetime import datetime, timedelta
-from sqlalchemy import func
+from sqlalchemy import func, and_
 from app import db
-from app.models import Client, Case, Transaction, Lead, CalendarEvent
+from app.models import Client, Case, Transaction, Lead, CalendarEvent, FinanceRollup
+from app.services.dashboard_service import get_dashboard_cache, make_etag
+from app.utils.periods import (GRANULARITIES, add_months, period_start, next_period_start,
+                               period_key, month_from_key, periods_between)
 
 dashboard_bp = Blueprint('dashboard', __name__)
 
 
-@dashboard_bp.route('/stats', methods=['GET'])
-@jwt_required()
-def get_stats():
+def _count_if(*conditions):
+    """Koşulları sağlayan satırları sayan toplama ifadesi (boş tabloda 0)"""
+    return func.coalesce(func.sum(db.case((and_(*conditions), 1), else_=0)), 0)
+
+
+def _sum_if(column, *conditions):
+    """Koşulları sağlayan satırların kolon toplamı (boş tabloda 0)"""
+    return func.coalesce(func.sum(db.case((and_(*conditions), column), else_=0)), 0)
+
+
+def _paid_totals_by_date(start, end, granularity):
     """
-    Dashboard istatistikleri
+    Ödenmiş gelir ve giderleri tek bir GROUP BY sorgusuyla toplar
+    
+    Ay ve çeyrek dönemleri aylık finans özetinden, gün ve hafta dönemleri
+    işlem tablosundan (tarih bazında) okunur.
+    
+    Returns:
+        list: (dönem içindeki tarih, işlem tipi, toplam) satırları
+    """
+    if granularity in ('month', 'quarter'):
+        rows = db.session.query(
+            FinanceRollup.month,
+            FinanceRollup.transaction_type,
+            func.sum(FinanceRollup.total)
+        ).filter(
+            FinanceRollup.status == 'paid',
+            FinanceRollup.month.between(FinanceRollup.month_key(start), FinanceRollup.month_key(end))
+        ).group_by(FinanceRollup.month, FinanceRollup.transaction_type).all()
+        return [(month_from_key(month), transaction_type, total) for month, transaction_type, total in rows]
+    
+    return db.session.query(
+        Transaction.date,
+        Transaction.transaction_type,
+        func.sum(Transaction.amount)
+    ).filter(
+        Transaction.transaction_type.in_(['income', 'expense']),
+        Transaction.status == 'paid',
+        Transaction.date.between(start, end)
+    ).group_by(Transaction.date, Transaction.transaction_type).all()
+
+
+def _compute_stats():
+    """
+    Dashboard istatistiklerini hesaplar
+    
+    Her tablo için tek bir koşullu toplama sorgusu (SUM/COUNT + CASE)
+    çalıştırılır; finansal toplamlar aylık finans özetinden okunur.
     """
     now = datetime.utcnow()
     today = now.date()
@@ -26,63 +72,56 @@ def get_stats():
     last_month_start = (month_start - timedelta(days=1)).replace(day=1)
     
     # Müvekkil istatistikleri
-    total_clients = Client.query.count()
-    active_clients = Client.query.filter_by(status='active').count()
-    new_clients_this_month = Client.query.filter(
-        Client.created_at >= month_start
-    ).count()
-    
-    # Dava istatistikleri
-    total_cases = Case.query.count()
-    active_cases = Case.query.filter(Case.status.in_(['open', 'pending', 'in_progress'])).count()
-    cases_won = Case.query.filter_by(status='won').count()
-    cases_lost = Case.query.filter_by(status='lost').count()
-    
-    # Dava tiplerine göre dağılım
+    total_clients, active_clients, new_clients_this_month = db.session.query(
+        func.count(Client.id),
+        _count_if(Client.status == 'active'),
+        _count_if(Client.created_at >= month_start)
+    ).one()
+    
+    # Dava istatistikleri ve dava tiplerine göre dağılım
     cases_by_type = db.session.query(
         Case.case_type,
-        func.count(Case.id).label('count')
+        func.count(Case.id),
+        _count_if(Case.status.in_(['open', 'pending', 'in_progress'])),
+        _count_if(Case.status == 'won'),
+        _count_if(Case.status == 'lost')
     ).group_by(Case.case_type).all()
     
-    # Finansal istatistikler
-    total_income = db.session.query(func.sum(Transaction.amount)).filter(
-        Transaction.transaction_type == 'income',
-        Transaction.status == 'paid'
-    ).scalar() or 0
-    
-    total_expense = db.session.query(func.sum(Transaction.amount)).filter(
-        Transaction.transaction_type == 'expense',
-        Transaction.status == 'paid'
-    ).scalar() or 0
+    total_cases = sum(row[1] for row in cases_by_type)
+    active_cases = sum(row[2] for row in cases_by_type)
+    cases_won = sum(row[3] for row in cases_by_type)
+    cases_lost = sum(row[4] for row in cases_by_type)
     
-    # Bu ayki gelir
-    monthly_income = db.session.query(func.sum(Transaction.amount)).filter(
-        Transaction.transaction_type == 'income',
-        Transaction.status == 'paid',
-        Transaction.date >= month_start
-    ).scalar() or 0
-    
-    # Bu ayki gider
-    monthly_expense = db.session.query(func.sum(Transaction.amount)).filter(
-        Transaction.transaction_type == 'expense',
-        Transaction.status == 'paid',
-        Transaction.date >= month_start
-    ).scalar() or 0
+    # Finansal istatistikler (aylık finans özetinden, ay başına tek satır)
+    is_income = FinanceRollup.transaction_type == 'income'
+    is_expense = FinanceRollup.transaction_type == 'expense'
+    is_paid = FinanceRollup.status == 'paid'
+    finance_rows = db.session.query(
+        FinanceRollup.month,
+        _sum_if(FinanceRollup.total, is_income, is_paid),
+        _sum_if(FinanceRollup.total, is_expense, is_paid),
+        _sum_if(FinanceRollup.total, is_income, FinanceRollup.status == 'pending')
+    ).group_by(FinanceRollup.month).all()
     
-    # Bekleyen ödemeler
-    pending_payments = db.session.query(func.sum(Transaction.amount)).filter(
-        Transaction.transaction_type == 'income',
-        Transaction.status == 'pending'
-    ).scalar() or 0
+    current_month = FinanceRollup.month_key(month_start)
+    total_income = total_expense = monthly_income = monthly_expense = pending_payments = 0
+    paid_income_by_month = {}
+    for month, income, expense, pending in finance_rows:
+        total_income += income
+        total_expense += expense
+        pending_payments += pending
+        paid_income_by_month[month] = income
+        if month >= current_month:
+            monthly_income += income
+            monthly_expense += expense
     
     # Lead istatistikleri
-    total_leads = Lead.query.count()
-    new_leads = Lead.query.filter_by(status='new').count()
-    converted_leads = Lead.query.filter_by(status='converted').count()
-    leads_needing_follow_up = Lead.query.filter(
-        Lead.follow_up_date <= today,
-        Lead.status.notin_(['converted', 'lost'])
-    ).count()
+    total_leads, new_leads, converted_leads, leads_needing_follow_up = db.session.query(
+        func.count(Lead.id),
+        _count_if(Lead.status == 'new'),
+        _count_if(Lead.status == 'converted'),
+        _count_if(Lead.follow_up_date <= today, Lead.status.notin_(['converted', 'lost']))
+    ).one()
     
     # Yaklaşan etkinlikler (7 gün içinde)
     upcoming_events = CalendarEvent.query.filter(
@@ -101,26 +140,13 @@ def get_stats():
     # Aylık gelir trendi (son 6 ay)
     monthly_income_trend = []
     for i in range(5, -1, -1):
-        month_date = today - timedelta(days=30 * i)
-        month_start_date = month_date.replace(day=1)
-        if month_date.month == 12:
-            month_end_date = month_start_date.replace(year=month_date.year + 1, month=1) - timedelta(days=1)
-        else:
-            month_end_date = month_start_date.replace(month=month_date.month + 1) - timedelta(days=1)
-        
-        income = db.session.query(func.sum(Transaction.amount)).filter(
-            Transaction.transaction_type == 'income',
-            Transaction.status == 'paid',
-            Transaction.date >= month_start_date,
-            Transaction.date <= month_end_date
-        ).scalar() or 0
-        
+        month = FinanceRollup.month_key(add_months(month_start, -i))
         monthly_income_trend.append({
-            'month': month_start_date.strftime('%Y-%m'),
-            'income': float(income)
+            'month': month,
+            'income': float(paid_income_by_month.get(month, 0))
         })
     
-    return jsonify({
+    return {
         'clients': {
             'total': total_clients,
             'active': active_clients,
@@ -133,7 +159,7 @@ def get_stats():
             'lost': cases_lost,
             'by_type': [
                 {'type': t, 'count': c, 'type_display': Case.CASE_TYPES.get(t, t)} 
-                for t, c in cases_by_type
+                for t, c, *_ in cases_by_type
             ]
         },
         'finance': {
@@ -153,4 +179,95 @@ def get_stats():
         },
         'upcoming_events': [e.to_dict() for e in upcoming_events],
         'upcoming_hearings': [h.to_dict() for h in upcoming_hearings]
+    }
+
+
+def _stats_response(etag, body):
+    """ETag'i istemcideki sürümle eşleşiyorsa 304, değilse gövdeli yanıt döndürür"""
+    if request.if_none_match.contains(etag):
+        response = current_app.response_class(status=304)
+    else:
+        response = current_app.response_class(body, mimetype='application/json')
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'private, no-cache'
+    return response
+
+
+@dashboard_bp.route('/stats', methods=['GET'])
+@jwt_required()
+def get_stats():
+    """
+    Dashboard istatistikleri
+    
+    Yanıt kullanıcı bazında önbellekten verilir ve güçlü ETag taşır;
+    If-None-Match ile aynı ETag'i gönderen istemciye gövdesiz 304 döner.
+    """
+    cache = get_dashboard_cache()
+    key = get_jwt_identity()
+    
+    cached = cache.get(key) if cache is not None else None
+    if cached is not None:
+        return _stats_response(*cached)
+    
+    version = cache.version if cache is not None else None
+    body = jsonify(_compute_stats()).get_data()
+    etag = make_etag(body)
+    if cache is not None:
+        cache.put(key, version, etag, body)
+    return _stats_response(etag, body)
+
+
+@dashboard_bp.route('/trend', methods=['GET'])
+@jwt_required()
+def get_trend():
+    """
+    Gelir, gider ve net kâr trendi
+    
+    Dönem toplamları tek sorguyla okunur; işlemi olmayan dönemler sıfırla
+    doldurulur. Aralık, N ay önceki ayın başını içeren dönemden bugünü
+    içeren dönemin sonuna kadardır.
+    
+    Query Parameters:
+        months: Kaç aylık trend (varsayılan 6)
+        granularity: Dönem uzunluğu (day, week, month, quarter; varsayılan month)
+    """
+    months = request.args.get('months', 6, type=int)
+    granularity = request.args.get('granularity', 'month')
+    max_months = current_app.config['DASHBOARD_TREND_MAX_MONTHS']
+    
+    if granularity not in GRANULARITIES:
+        return jsonify({'message': f'Geçersiz dönem: {granularity} ({", ".join(GRANULARITIES)})'}), 400
+    if months is None or not 1 <= months <= max_months:
+        return jsonify({'message': f'Ay sayısı 1 ile {max_months} arasında olmalıdır'}), 400
+    
+    today = datetime.utcnow().date()
+    start = period_start(add_months(today.replace(day=1), 1 - months), granularity)
+    end = next_period_start(period_start(today, granularity), granularity) - timedelta(days=1)
+    
+    periods = periods_between(start, end, granularity)
+    totals = {key: {'income': 0, 'expense': 0} for key, _, _ in periods}
+    for value, transaction_type, total in _paid_totals_by_date(start, end, granularity):
+        period = totals.get(period_key(value, granularity))
+        if period is not None and transaction_type in period:
+            period[transaction_type] += total
+    
+    series = []
+    for key, period_begin, period_end in periods:
+        income = totals[key]['income']
+        expense = totals[key]['expense']
+        series.append({
+            'period': key,
+            'start': period_begin.isoformat(),
+            'end': period_end.isoformat(),
+            'income': float(income),
+            'expense': float(expense),
+            'net': float(income - expense)
+        })
+    
+    return jsonify({
+        'granularity': granularity,
+        'months': months,
+        'start': start.isoformat(),
+        'end': end.isoformat(),
+        'series': series
     }), 200
@@ -12,6 +12,11 @@ from werkzeug.utils import secure_filename
 from app import db
 from app.models import Document
 from app.utils.decorators import role_required
+from app.utils.pagination import paginate_query
+from app.utils.fields import get_fields, apply_fields
+from app.utils.projection import project_query, to_views, json_response
+from app.services.search_service import search_filter
+from app.services.extraction_service import queue_extraction
 
 documents_bp = Blueprint('documents', __name__)
 
@@ -36,13 +41,15 @@ def get_file_extension(filename):
 def get_documents():
     """
     Belge listesi
+    
+    Sayfa numarası (page) veya imleç (cursor) ile sayfalanır. fields
+    parametresi ile yalnızca istenen alanlar döndürülür.
     """
-    page = request.args.get('page', 1, type=int)
-    per_page = request.args.get('per_page', current_app.config['ITEMS_PER_PAGE'], type=int)
     document_type = request.args.get('document_type', '')
     related_to = request.args.get('related_to', '')
     related_id = request.args.get('related_id', type=int)
     search = request.args.get('search', '')
+    fields = get_fields(Document)
     
     query = Document.query
     
@@ -53,22 +60,15 @@ def get_documents():
     if related_id:
         query = query.filter(Document.related_id == related_id)
     if search:
-        search_filter = f'%{search}%'
-        query = query.filter(
-            db.or_(
-                Document.original_filename.ilike(search_filter),
-                Document.description.ilike(search_filter)
-            )
-        )
+        query = query.filter(search_filter(Document, search))
     
-    query = query.order_by(Document.created_at.desc())
-    pagination = query.paginate(page=page, per_page=per_page, error_out=False)
+    query = project_query(query, Document, fields, Document.created_at)
+    rows, meta = paginate_query(query, Document.created_at, Document.id, 'desc')
+    documents = to_views(Document, rows, ['uploader'] if Document.wants(fields, 'uploader') else [])
     
-    return jsonify({
-        'documents': [d.to_dict(include_relations=True) for d in pagination.items],
-        'total': pagination.total,
-        'pages': pagination.pages,
-        'current_page': page
+    return json_response({
+        'documents': [d.to_dict(include_relations=True, fields=fields) for d in documents],
+        **meta
     }), 200
 
 
@@ -77,10 +77,14 @@ def get_documents():
 def get_document(id):
     """
     Tek belge detayı
+    
+    Query Parameters:
+        fields: Döndürülecek alanlar
     """
-    document = Document.query.get_or_404(id)
+    fields = get_fields(Document)
+    document = apply_fields(Document.query, Document, fields).get_or_404(id)
     return jsonify({
-        'document': document.to_dict(include_relations=True)
+        'document': document.to_dict(include_relations=True, fields=fields)
     }), 200
 
 
@@ -132,6 +136,9 @@ def upload_document():
     db.session.add(document)
     db.session.commit()
     
+    # Arama için metin içeriğini arka planda çıkar
+    queue_extraction(current_app._get_current_object(), document.id)
+    
     return jsonify({
         'message': 'Belge başarıyla yüklendi',
         'document': document.to_dict()
@@ -7,32 +7,43 @@ Finansal işlem CRUD endpoint'leri.
 from flask import Blueprint, request, jsonify, current_app
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from datetime import datetime, timedelta
-from sqlalchemy import func
+from sqlalchemy import func, or_
 from app import db
-from app.models import Transaction, Installment, Client, Case
+from app.models import Transaction, Installment, Client, Case, FinanceRollup
+from app.models.money import parse_money
 from app.utils.decorators import role_required
+from app.utils.pagination import paginate_query, get_sort_column
+from app.utils.fields import get_fields, apply_fields
+from app.utils.projection import project_query, to_views, json_response
+from app.utils.export import export_query
+from app.utils.periods import GRANULARITIES, add_months, period_key, month_from_key, periods_between
 
 finance_bp = Blueprint('finance', __name__)
 
+# Rapor karşılaştırma dönemleri: önceki eşit uzunluktaki aralık, geçen yılın aynı aralığı
+REPORT_COMPARISONS = ('previous', 'last_year')
 
-@finance_bp.route('', methods=['GET'])
-@jwt_required()
-def get_transactions():
+
+def filter_transactions(query):
     """
-    İşlem listesi
+    İşlem sorgusuna istekteki filtreleri uygular
+    
+    Query Parameters:
+        type: İşlem tipi (income/expense)
+        status: Durum filtresi
+        client_id: Müvekkil filtresi
+        case_id: Dava filtresi
+        start_date: Başlangıç tarihi
+        end_date: Bitiş tarihi
+        has_balance: true ise yalnızca ödenmemiş bakiyesi olan işlemler
     """
-    page = request.args.get('page', 1, type=int)
-    per_page = request.args.get('per_page', current_app.config['ITEMS_PER_PAGE'], type=int)
     transaction_type = request.args.get('type', '')
     status = request.args.get('status', '')
+    has_balance = request.args.get('has_balance', '')
     client_id = request.args.get('client_id', type=int)
     case_id = request.args.get('case_id', type=int)
     start_date = request.args.get('start_date', '')
     end_date = request.args.get('end_date', '')
-    sort = request.args.get('sort', 'date')
-    order = request.args.get('order', 'desc')
-    
-    query = Transaction.query
     
     if transaction_type:
         query = query.filter(Transaction.transaction_type == transaction_type)
@@ -42,6 +53,8 @@ def get_transactions():
         query = query.filter(Transaction.client_id == client_id)
     if case_id:
         query = query.filter(Transaction.case_id == case_id)
+    if has_balance.lower() == 'true':
+        query = query.filter(Transaction.status.in_(Transaction.OPEN_STATUSES), Transaction.remaining_amount > 0)
     
     if start_date:
         try:
@@ -57,31 +70,224 @@ def get_transactions():
         except ValueError:
             pass
     
-    sort_column = getattr(Transaction, sort, Transaction.date)
-    if order == 'desc':
-        query = query.order_by(sort_column.desc())
-    else:
-        query = query.order_by(sort_column.asc())
+    return query
+
+
+def _next_month_start(value):
+    """Verilen tarihten sonraki ayın ilk gününü döndürür"""
+    return (value.replace(day=28) + timedelta(days=4)).replace(day=1)
+
+
+def _split_full_months(start, end):
+    """
+    Tarih aralığını tam aylar ve kenarlardaki kısmi günler olarak ayırır
     
-    pagination = query.paginate(page=page, per_page=per_page, error_out=False)
+    Args:
+        start: Başlangıç tarihi (dahil)
+        end: Bitiş tarihi (dahil)
     
-    return jsonify({
-        'transactions': [t.to_dict(include_relations=True) for t in pagination.items],
-        'total': pagination.total,
-        'pages': pagination.pages,
-        'current_page': page
+    Returns:
+        tuple: ((ilk ay, son ay) anahtarları veya None, [(başlangıç, bitiş), ...] kısmi aralıklar)
+    """
+    first = start if start.day == 1 else _next_month_start(start)
+    after = _next_month_start(end)
+    if after - timedelta(days=1) != end:
+        after = end.replace(day=1)
+    
+    if first >= after:
+        return None, [(start, end)] if start <= end else []
+    
+    partial = []
+    if start < first:
+        partial.append((start, first - timedelta(days=1)))
+    if after <= end:
+        partial.append((after, end))
+    months = (FinanceRollup.month_key(first), FinanceRollup.month_key(after - timedelta(days=1)))
+    return months, partial
+
+
+def _shift_year(value):
+    """Tarihi bir yıl geriye taşır (29 Şubat, 28 Şubat olur)"""
+    try:
+        return value.replace(year=value.year - 1)
+    except ValueError:
+        return value.replace(year=value.year - 1, day=28)
+
+
+def _comparison_range(start, end, compare):
+    """
+    Raporun karşılaştırma aralığını döndürür
+    
+    previous: aralıktan hemen önceki eşit uzunluktaki aralık; aralık tam
+    aylardan oluşuyorsa aynı sayıda önceki ay (ör. Mart için Şubat).
+    last_year: bir yıl önceki aynı tarihler.
+    
+    Returns:
+        tuple: (başlangıç, bitiş) tarihleri (dahil)
+    """
+    if compare == 'last_year':
+        return _shift_year(start), _shift_year(end)
+    if start.day == 1 and _next_month_start(end) - timedelta(days=1) == end:
+        months = (end.year - start.year) * 12 + end.month - start.month + 1
+        return add_months(start, -months), start - timedelta(days=1)
+    return start - (end - start) - timedelta(days=1), start - timedelta(days=1)
+
+
+def _change(current, previous):
+    """Karşılaştırma farkını ve yüzde değişimi döndürür (önceki değer 0 ise yüzde None)"""
+    difference = current - previous
+    return {
+        'difference': float(difference),
+        'percent': round(float(difference * 100 / abs(previous)), 2) if previous else None
+    }
+
+
+class _ReportRange:
+    """
+    Rapordaki bir tarih aralığının toplamlarını biriktirir
+    
+    Aralığın tam ayları aylık finans özeti satırlarından, kenarlardaki
+    kısmi günler (gün ve hafta dönemlerinde aralığın tamamı) işlem tablosu
+    satırlarından toplanır; her satır aralığa yalnızca bir yoldan girer.
+    """
+    
+    def __init__(self, start, end, granularity):
+        self.start = start
+        self.end = end
+        self.granularity = granularity
+        if granularity in ('day', 'week'):
+            self.months, self.partial_ranges = None, [(start, end)] if start <= end else []
+        else:
+            self.months, self.partial_ranges = _split_full_months(start, end)
+        
+        self.paid = {'income': {}, 'expense': {}}
+        self.periods = periods_between(start, end, granularity) if granularity else []
+        self.series = {
+            key: {'income': 0, 'expense': 0, 'pending_income': 0, 'pending_expense': 0}
+            for key, _, _ in self.periods
+        }
+    
+    def _add(self, value, transaction_type, category, status, total):
+        """Aralıkta kalan bir satırı kategori ve dönem toplamlarına ekler"""
+        if status == 'paid':
+            categories = self.paid[transaction_type]
+            categories[category] = categories.get(category, 0) + total
+        if self.granularity:
+            period = self.series[period_key(value, self.granularity)]
+            period[transaction_type if status == 'paid' else f'pending_{transaction_type}'] += total
+    
+    def add_month(self, month, *row):
+        """Aylık finans özeti satırını, ay aralığın tam aylarındansa ekler"""
+        if self.months and self.months[0] <= month <= self.months[1]:
+            self._add(month_from_key(month), *row)
+    
+    def add_day(self, value, *row):
+        """İşlem tablosundaki gün satırını, gün aralığın kısmi günlerindense ekler"""
+        if any(range_start <= value <= range_end for range_start, range_end in self.partial_ranges):
+            self._add(value, *row)
+    
+    def totals(self):
+        """Ödenmiş gelir ve gider toplamları"""
+        return sum(self.paid['income'].values()), sum(self.paid['expense'].values())
+    
+    def period(self):
+        """Aralığın başlangıç ve bitiş tarihleri"""
+        return {'start': self.start.isoformat(), 'end': self.end.isoformat()}
+    
+    def categories(self, transaction_type):
+        """Ödenmiş tutarların kategori dağılımı"""
+        return [
+            {'category': cat, 'total': float(total)}
+            for cat, total in sorted(self.paid[transaction_type].items())
+        ]
+    
+    def series_list(self):
+        """Dönem serisi (ödenmiş ve bekleyen tutarlar)"""
+        series = []
+        for key, period_begin, period_end in self.periods:
+            totals = self.series[key]
+            series.append({
+                'period': key,
+                'start': period_begin.isoformat(),
+                'end': period_end.isoformat(),
+                'income': float(totals['income']),
+                'expense': float(totals['expense']),
+                'net': float(totals['income'] - totals['expense']),
+                'pending_income': float(totals['pending_income']),
+                'pending_expense': float(totals['pending_expense'])
+            })
+        return series
+
+
+@finance_bp.route('', methods=['GET'])
+@jwt_required()
+def get_transactions():
+    """
+    İşlem listesi
+    
+    Sayfa numarası (page) veya imleç (cursor) ile sayfalanır. fields
+    parametresi ile yalnızca istenen alanlar döndürülür.
+    """
+    sort = request.args.get('sort', 'date')
+    order = request.args.get('order', 'desc')
+    fields = get_fields(Transaction)
+    
+    query = filter_transactions(Transaction.query)
+    
+    sort_column = get_sort_column(Transaction, sort, Transaction.date)
+    query = project_query(query, Transaction, fields, sort_column)
+    rows, meta = paginate_query(query, sort_column, Transaction.id, order)
+    
+    # Müvekkil, dava ve taksitler sayfa için toplu yüklenir
+    relations = []
+    if Transaction.wants(fields, 'client'):
+        relations.append('client')
+    if Transaction.wants(fields, 'case'):
+        relations.append('case')
+    if Transaction.wants(fields, 'installments'):
+        relations.append('installment_list')
+    transactions = to_views(Transaction, rows, relations)
+    
+    return json_response({
+        'transactions': [t.to_dict(include_relations=True, fields=fields) for t in transactions],
+        **meta
     }), 200
 
 
+@finance_bp.route('/export', methods=['GET'])
+@jwt_required()
+def export_transactions():
+    """
+    İşlem listesini dosya olarak dışa aktarır
+    
+    Liste endpoint'i ile aynı filtreleri ve sıralamayı kabul eder.
+    
+    Query Parameters:
+        format: Dosya biçimi (csv, ndjson)
+        fields: Dışa aktarılacak kolonlar
+        type, status, client_id, case_id, start_date, end_date, has_balance, sort, order: Liste filtreleri
+    """
+    sort = request.args.get('sort', 'date')
+    order = request.args.get('order', 'desc')
+    
+    query = filter_transactions(Transaction.query)
+    sort_column = get_sort_column(Transaction, sort, Transaction.date)
+    return export_query(query, Transaction, 'transactions', sort_column, order)
+
+
 @finance_bp.route('/<int:id>', methods=['GET'])
 @jwt_required()
 def get_transaction(id):
     """
     Tek işlem detayı
+    
+    Query Parameters:
+        fields: Döndürülecek alanlar
     """
-    transaction = Transaction.query.get_or_404(id)
+    fields = get_fields(Transaction)
+    transaction = apply_fields(Transaction.query, Transaction, fields).get_or_404(id)
     return jsonify({
-        'transaction': transaction.to_dict(include_relations=True)
+        'transaction': transaction.to_dict(include_relations=True, fields=fields)
     }), 200
 
 
@@ -103,10 +309,29 @@ def create_transaction():
     if not data.get('amount'):
         return jsonify({'message': 'Miktar gereklidir'}), 400
     
+    # Tutar ve taksitler kayıt eklenmeden önce doğrulanır; hatalı taksit yarım kayıt bırakmaz
+    installments = data.get('installments') if isinstance(data.get('installments'), list) else []
+    if not all(isinstance(inst_data, dict) for inst_data in installments):
+        return jsonify({'message': 'Geçersiz taksit verisi'}), 400
+    try:
+        amount = parse_money(data['amount'])
+        installment_amounts = [parse_money(inst_data.get('amount', 0)) for inst_data in installments]
+    except ValueError:
+        return jsonify({'message': 'Geçersiz tutar'}), 400
+    
+    installment_due_dates = []
+    for inst_data in installments:
+        try:
+            installment_due_dates.append(
+                datetime.fromisoformat(str(inst_data.get('due_date') or '').replace('Z', '+00:00')).date()
+            )
+        except ValueError:
+            return jsonify({'message': 'Taksit vade tarihi gereklidir'}), 400
+    
     transaction = Transaction(
         transaction_type=data['transaction_type'],
         category=data['category'],
-        amount=float(data['amount']),
+        amount=amount,
         currency=data.get('currency', 'TRY'),
         payment_method=data.get('payment_method'),
         client_id=data.get('client_id'),
@@ -126,20 +351,16 @@ def create_transaction():
     db.session.commit()
     
     # Taksitler
-    if data.get('installments') and isinstance(data['installments'], list):
-        for i, inst_data in enumerate(data['installments'], 1):
-            installment = Installment(
+    if installments:
+        rows = zip(installments, installment_amounts, installment_due_dates)
+        for i, (inst_data, inst_amount, due_date) in enumerate(rows, 1):
+            db.session.add(Installment(
                 transaction_id=transaction.id,
                 installment_number=i,
-                amount=float(inst_data.get('amount', 0)),
+                amount=inst_amount,
+                due_date=due_date,
                 status=inst_data.get('status', 'pending')
-            )
-            if inst_data.get('due_date'):
-                try:
-                    installment.due_date = datetime.fromisoformat(inst_data['due_date'].replace('Z', '+00:00')).date()
-                except ValueError:
-                    pass
-            db.session.add(installment)
+            ))
         db.session.commit()
     
     return jsonify({
@@ -160,12 +381,18 @@ def update_transaction(id):
     if not data:
         return jsonify({'message': 'Geçersiz istek verisi'}), 400
     
+    if 'amount' in data:
+        try:
+            amount = parse_money(data['amount'])
+        except ValueError:
+            return jsonify({'message': 'Geçersiz tutar'}), 400
+    
     if 'transaction_type' in data:
         transaction.transaction_type = data['transaction_type']
     if 'category' in data:
         transaction.category = data['category']
     if 'amount' in data:
-        transaction.amount = float(data['amount'])
+        transaction.amount = amount
     if 'currency' in data:
         transaction.currency = data['currency']
     if 'payment_method' in data:
@@ -215,6 +442,16 @@ def delete_transaction(id):
 def get_report():
     """
     Finansal rapor
+    
+    Tüm toplamlar, dönem serileri ve karşılaştırma aralığı aynı iki gruplu
+    sorgudan (aylık finans özeti ve kısmi günler için işlem tablosu) elde
+    edilir. Bekleyen toplamlar tarihten bağımsızdır.
+    
+    Query Parameters:
+        start_date: Başlangıç tarihi (varsayılan: 30 gün önce)
+        end_date: Bitiş tarihi (varsayılan: bugün)
+        granularity: Dönem serisi uzunluğu (day, week, month, quarter; verilmezse seri dönmez)
+        compare: Karşılaştırma aralığı (previous, last_year)
     """
     start_date = request.args.get('start_date', '')
     end_date = request.args.get('end_date', '')
@@ -236,77 +473,114 @@ def get_report():
         except ValueError:
             end = datetime.utcnow().date()
     
-    # Toplam gelir
-    total_income = db.session.query(func.sum(Transaction.amount)).filter(
-        Transaction.transaction_type == 'income',
-        Transaction.status == 'paid',
-        Transaction.date >= start,
-        Transaction.date <= end
-    ).scalar() or 0
-    
-    # Toplam gider
-    total_expense = db.session.query(func.sum(Transaction.amount)).filter(
-        Transaction.transaction_type == 'expense',
-        Transaction.status == 'paid',
-        Transaction.date >= start,
-        Transaction.date <= end
-    ).scalar() or 0
-    
-    # Bekleyen gelirler
-    pending_income = db.session.query(func.sum(Transaction.amount)).filter(
-        Transaction.transaction_type == 'income',
-        Transaction.status == 'pending'
-    ).scalar() or 0
-    
-    # Bekleyen giderler
-    pending_expense = db.session.query(func.sum(Transaction.amount)).filter(
-        Transaction.transaction_type == 'expense',
-        Transaction.status == 'pending'
-    ).scalar() or 0
-    
-    # Kategoriye göre gelirler
-    income_by_category = db.session.query(
-        Transaction.category,
-        func.sum(Transaction.amount).label('total')
-    ).filter(
-        Transaction.transaction_type == 'income',
-        Transaction.status == 'paid',
-        Transaction.date >= start,
-        Transaction.date <= end
-    ).group_by(Transaction.category).all()
-    
-    # Kategoriye göre giderler
-    expense_by_category = db.session.query(
-        Transaction.category,
-        func.sum(Transaction.amount).label('total')
+    granularity = request.args.get('granularity') or None
+    compare = request.args.get('compare') or None
+    
+    if granularity is not None and granularity not in GRANULARITIES:
+        return jsonify({'message': f'Geçersiz dönem: {granularity} ({", ".join(GRANULARITIES)})'}), 400
+    if compare is not None and compare not in REPORT_COMPARISONS:
+        return jsonify({'message': f'Geçersiz karşılaştırma: {compare} ({", ".join(REPORT_COMPARISONS)})'}), 400
+    
+    ranges = [_ReportRange(start, end, granularity)]
+    if compare:
+        ranges.append(_ReportRange(*_comparison_range(start, end, compare), granularity))
+    
+    max_periods = current_app.config['REPORT_MAX_PERIODS']
+    if any(len(report_range.periods) > max_periods for report_range in ranges):
+        return jsonify({'message': f'Seri en fazla {max_periods} dönem içerebilir'}), 400
+    
+    # Tam aylar ve tarihten bağımsız bekleyen toplamlar aylık finans özetinden
+    pending = {'income': 0, 'expense': 0}
+    rollup_rows = db.session.query(
+        FinanceRollup.month,
+        FinanceRollup.transaction_type,
+        FinanceRollup.category,
+        FinanceRollup.status,
+        func.sum(FinanceRollup.total),
+        func.sum(FinanceRollup.transaction_count)
     ).filter(
-        Transaction.transaction_type == 'expense',
-        Transaction.status == 'paid',
-        Transaction.date >= start,
-        Transaction.date <= end
-    ).group_by(Transaction.category).all()
-    
-    return jsonify({
-        'period': {
-            'start': start.isoformat(),
-            'end': end.isoformat()
-        },
+        FinanceRollup.status.in_(['paid', 'pending'])
+    ).group_by(
+        FinanceRollup.month,
+        FinanceRollup.transaction_type,
+        FinanceRollup.category,
+        FinanceRollup.status
+    ).all()
+    
+    for month, transaction_type, category, status, total, count in rollup_rows:
+        if transaction_type not in pending or not count:
+            continue
+        if status == 'pending':
+            pending[transaction_type] += total
+        for report_range in ranges:
+            report_range.add_month(month, transaction_type, category, status, total)
+    
+    # Aralıkların kısmi günleri işlem tablosundan, gün bazında
+    partial_ranges = [r for report_range in ranges for r in report_range.partial_ranges]
+    if partial_ranges:
+        edge_rows = db.session.query(
+            Transaction.date,
+            Transaction.transaction_type,
+            Transaction.category,
+            Transaction.status,
+            func.sum(Transaction.amount)
+        ).filter(
+            Transaction.status.in_(['paid', 'pending']),
+            or_(*[Transaction.date.between(range_start, range_end) for range_start, range_end in partial_ranges])
+        ).group_by(
+            Transaction.date,
+            Transaction.transaction_type,
+            Transaction.category,
+            Transaction.status
+        ).all()
+        
+        for value, transaction_type, category, status, total in edge_rows:
+            if transaction_type not in pending:
+                continue
+            for report_range in ranges:
+                report_range.add_day(value, transaction_type, category, status, total)
+    
+    current = ranges[0]
+    total_income, total_expense = current.totals()
+    report = {
+        'period': current.period(),
         'summary': {
             'total_income': float(total_income),
             'total_expense': float(total_expense),
             'net_profit': float(total_income - total_expense),
-            'pending_income': float(pending_income),
-            'pending_expense': float(pending_expense)
+            'pending_income': float(pending['income']),
+            'pending_expense': float(pending['expense'])
         },
-        'income_by_category': [
-            {'category': cat, 'total': float(total)} 
-            for cat, total in income_by_category
-        ],
-        'expense_by_category': [
-            {'category': cat, 'total': float(total)} 
-            for cat, total in expense_by_category
-        ]
-    }), 200
+        'income_by_category': current.categories('income'),
+        'expense_by_category': current.categories('expense')
+    }
+    if granularity:
+        report['granularity'] = granularity
+        report['series'] = current.series_list()
+    
+    if compare:
+        previous = ranges[1]
+        previous_income, previous_expense = previous.totals()
+        report['comparison'] = {
+            'type': compare,
+            'period': previous.period(),
+            'summary': {
+                'total_income': float(previous_income),
+                'total_expense': float(previous_expense),
+                'net_profit': float(previous_income - previous_expense)
+            },
+            'change': {
+                'total_income': _change(total_income, previous_income),
+                'total_expense': _change(total_expense, previous_expense),
+                'net_profit': _change(total_income - total_expense, previous_income - previous_expense)
+            },
+            'income_by_category': previous.categories('income'),
+            'expense_by_category': previous.categories('expense')
+        }
+        if granularity:
+            report['comparison']['series'] = previous.series_list()
+    
+    return jsonify(report), 200
 
 
 @finance_bp.route('/categories', methods=['GET'])
@@ -362,15 +636,14 @@ def update_installment(id, inst_id):
     if 'notes' in data:
         installment.notes = data['notes']
     
-    db.session.commit()
+    # Taksit değişikliği flush sırasında işlemin taksit sayaçlarına yansır
+    db.session.flush()
+    db.session.expire(transaction, ['installment_count', 'paid_installment_count'])
     
     # Ana işlem durumunu güncelle
-    all_installments = transaction.installments.all()
-    paid_count = sum(1 for i in all_installments if i.status == 'paid')
-    
-    if paid_count == len(all_installments):
+    if transaction.paid_installment_count == transaction.installment_count:
         transaction.status = 'paid'
-    elif paid_count > 0:
+    elif transaction.paid_installment_count > 0:
         transaction.status = 'partial'
     
     db.session.commit()
@@ -4,12 +4,17 @@ Avukat Yönetim Sistemi - Lead Routes
 Potansiyel iş CRUD endpoint'leri.
 """
 
-from flask import Blueprint, request, jsonify, current_app
+from flask import Blueprint, request, jsonify
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from datetime import datetime
 from app import db
 from app.models import Lead, Client
+from app.models.money import parse_money
 from app.utils.decorators import role_required
+from app.utils.pagination import paginate_query, get_sort_column
+from app.utils.fields import get_fields, apply_fields
+from app.utils.projection import project_query, to_views, json_response
+from app.services.search_service import search_filter
 
 leads_bp = Blueprint('leads', __name__)
 
@@ -19,45 +24,41 @@ leads_bp = Blueprint('leads', __name__)
 def get_leads():
     """
     Lead listesi
+    
+    Sayfa numarası (page) veya imleç (cursor) ile sayfalanır. fields
+    parametresi ile yalnızca istenen alanlar döndürülür.
     """
-    page = request.args.get('page', 1, type=int)
-    per_page = request.args.get('per_page', current_app.config['ITEMS_PER_PAGE'], type=int)
     search = request.args.get('search', '')
     status = request.args.get('status', '')
     source = request.args.get('source', '')
     sort = request.args.get('sort', 'created_at')
     order = request.args.get('order', 'desc')
+    fields = get_fields(Lead)
     
     query = Lead.query
     
     if search:
-        search_filter = f'%{search}%'
-        query = query.filter(
-            db.or_(
-                Lead.name.ilike(search_filter),
-                Lead.contact_info.ilike(search_filter),
-                Lead.description.ilike(search_filter)
-            )
-        )
+        query = query.filter(search_filter(Lead, search))
     
     if status:
         query = query.filter(Lead.status == status)
     if source:
         query = query.filter(Lead.source == source)
     
-    sort_column = getattr(Lead, sort, Lead.created_at)
-    if order == 'desc':
-        query = query.order_by(sort_column.desc())
-    else:
-        query = query.order_by(sort_column.asc())
+    sort_column = get_sort_column(Lead, sort, Lead.created_at)
+    query = project_query(query, Lead, fields, sort_column)
+    rows, meta = paginate_query(query, sort_column, Lead.id, order)
     
-    pagination = query.paginate(page=page, per_page=per_page, error_out=False)
+    relations = []
+    if Lead.wants(fields, 'converted_client'):
+        relations.append('converted_client')
+    if Lead.wants(fields, 'creator'):
+        relations.append('creator')
+    leads = to_views(Lead, rows, relations)
     
-    return jsonify({
-        'leads': [l.to_dict(include_relations=True) for l in pagination.items],
-        'total': pagination.total,
-        'pages': pagination.pages,
-        'current_page': page
+    return json_response({
+        'leads': [l.to_dict(include_relations=True, fields=fields) for l in leads],
+        **meta
     }), 200
 
 
@@ -66,10 +67,14 @@ def get_leads():
 def get_lead(id):
     """
     Tek lead detayı
+    
+    Query Parameters:
+        fields: Döndürülecek alanlar
     """
-    lead = Lead.query.get_or_404(id)
+    fields = get_fields(Lead)
+    lead = apply_fields(Lead.query, Lead, fields).get_or_404(id)
     return jsonify({
-        'lead': lead.to_dict(include_relations=True)
+        'lead': lead.to_dict(include_relations=True, fields=fields)
     }), 200
 
 
@@ -101,7 +106,7 @@ def create_lead():
     
     if data.get('estimated_value'):
         try:
-            lead.estimated_value = float(data['estimated_value'])
+            lead.estimated_value = parse_money(data['estimated_value'])
         except ValueError:
             pass
     
@@ -150,7 +155,7 @@ def update_lead(id):
     if 'estimated_value' in data:
         if data['estimated_value']:
             try:
-                lead.estimated_value = float(data['estimated_value'])
+                lead.estimated_value = parse_money(data['estimated_value'])
             except ValueError:
                 pass
         else:
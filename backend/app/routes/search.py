@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""
+Avukat Yönetim Sistemi - Arama Routes
+Tüm kayıt tiplerinde genel arama endpoint'i.
+"""
+
+from flask import Blueprint, request, jsonify, current_app
+from flask_jwt_extended import jwt_required, get_jwt_identity
+from app.services.search_service import global_search, global_search_types
+
+search_bp = Blueprint('search', __name__)
+
+
+@search_bp.route('', methods=['GET'])
+@jwt_required()
+def search():
+    """
+    Genel arama
+    
+    Müvekkil, dava, potansiyel müvekkil, belge ve şablonlarda tek sorguyla
+    arama yapar ve her tip için en iyi eşleşmeleri döndürür.
+    
+    Query Parameters:
+        q: Arama terimi
+        limit: Tip başına en fazla sonuç (varsayılan: 5)
+        types: Aranacak tipler (ör. clients,cases; varsayılan: tümü)
+    
+    Returns:
+        query: Arama terimi
+        results: Tip -> sonuç listesi (id, title, subtitle, score)
+        total: Toplam sonuç sayısı
+    """
+    term = request.args.get('q', '').strip()
+    if not term:
+        return jsonify({'message': 'Arama terimi gerekli'}), 400
+    
+    limit = request.args.get('limit', current_app.config['GLOBAL_SEARCH_LIMIT'], type=int)
+    limit = max(1, min(limit, current_app.config['GLOBAL_SEARCH_MAX_LIMIT']))
+    
+    types = None
+    if request.args.get('types'):
+        types = {t.strip() for t in request.args['types'].split(',')}
+        unknown = types - set(global_search_types())
+        if unknown:
+            return jsonify({'message': f"Geçersiz arama tipi: {', '.join(sorted(unknown))}"}), 400
+    
+    results = global_search(term, limit, types, get_jwt_identity())
+    
+    return jsonify({
+        'query': term,
+        'results': results,
+        'total': sum(len(items) for items in results.values())
+    }), 200
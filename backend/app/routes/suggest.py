@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""
+Avukat Yönetim Sistemi - Otomatik Tamamlama Routes
+Müvekkil ve dava seçimi için hızlı öneri endpoint'i.
+"""
+
+from flask import Blueprint, request, jsonify, current_app
+from flask_jwt_extended import jwt_required
+from app.models.normalized import normalize_text
+from app.services.suggest_service import get_suggest_index
+
+suggest_bp = Blueprint('suggest', __name__)
+
+SUGGEST_TYPES = {'clients', 'cases'}
+
+
+@suggest_bp.route('', methods=['GET'])
+@jwt_required()
+def suggest():
+    """
+    Otomatik tamamlama önerileri
+    
+    Müvekkil adı/soyadı, TC kimlik numarası veya dava numarasının başıyla
+    eşleşen kayıtları bellek içi indeksten döndürür.
+    
+    Query Parameters:
+        q: Aranan önek
+        types: Öneri tipleri (clients, cases; varsayılan: tümü)
+        limit: En fazla öneri sayısı (varsayılan: 10)
+    
+    Returns:
+        suggestions: type, id, label ve subtitle içeren öneriler
+    """
+    prefix = normalize_text(request.args.get('q', ''))
+    if not prefix:
+        return jsonify({'suggestions': []}), 200
+    
+    limit = request.args.get('limit', current_app.config['SUGGEST_LIMIT'], type=int)
+    limit = max(1, min(limit, current_app.config['SUGGEST_MAX_LIMIT']))
+    
+    types = None
+    if request.args.get('types'):
+        types = {t.strip() for t in request.args['types'].split(',')}
+        unknown = types - SUGGEST_TYPES
+        if unknown:
+            return jsonify({'message': f"Geçersiz öneri tipi: {', '.join(sorted(unknown))}"}), 400
+    
+    return jsonify({
+        'suggestions': get_suggest_index().lookup(prefix, limit, types)
+    }), 200
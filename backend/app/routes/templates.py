@@ -4,11 +4,15 @@ Avukat Yönetim Sistemi - Şablon Routes
 Belge şablonu CRUD endpoint'leri.
 """
 
-from flask import Blueprint, request, jsonify, current_app
+from flask import Blueprint, request, jsonify
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from app import db
 from app.models import Template
 from app.utils.decorators import role_required
+from app.utils.pagination import paginate_query
+from app.utils.fields import get_fields, apply_fields
+from app.utils.projection import project_query, to_views, json_response
+from app.services.search_service import search_filter
 import json
 
 templates_bp = Blueprint('templates', __name__)
@@ -19,13 +23,15 @@ templates_bp = Blueprint('templates', __name__)
 def get_templates():
     """
     Şablon listesi
+    
+    Sayfa numarası (page) veya imleç (cursor) ile sayfalanır. fields
+    parametresi ile yalnızca istenen alanlar döndürülür.
     """
     current_user_id = get_jwt_identity()
-    page = request.args.get('page', 1, type=int)
-    per_page = request.args.get('per_page', current_app.config['ITEMS_PER_PAGE'], type=int)
     template_type = request.args.get('template_type', '')
     category = request.args.get('category', '')
     search = request.args.get('search', '')
+    fields = get_fields(Template)
     
     query = Template.query.filter(
         db.or_(
@@ -39,22 +45,15 @@ def get_templates():
     if category:
         query = query.filter(Template.category == category)
     if search:
-        search_filter = f'%{search}%'
-        query = query.filter(
-            db.or_(
-                Template.name.ilike(search_filter),
-                Template.content.ilike(search_filter)
-            )
-        )
+        query = query.filter(search_filter(Template, search))
     
-    query = query.order_by(Template.name.asc())
-    pagination = query.paginate(page=page, per_page=per_page, error_out=False)
+    query = project_query(query, Template, fields, Template.name)
+    rows, meta = paginate_query(query, Template.name, Template.id, 'asc')
+    templates = to_views(Template, rows, ['creator'] if Template.wants(fields, 'creator') else [])
     
-    return jsonify({
-        'templates': [t.to_dict(include_relations=True) for t in pagination.items],
-        'total': pagination.total,
-        'pages': pagination.pages,
-        'current_page': page
+    return json_response({
+        'templates': [t.to_dict(include_relations=True, fields=fields) for t in templates],
+        **meta
     }), 200
 
 
@@ -63,10 +62,14 @@ def get_templates():
 def get_template(id):
     """
     Tek şablon detayı
+    
+    Query Parameters:
+        fields: Döndürülecek alanlar
     """
-    template = Template.query.get_or_404(id)
+    fields = get_fields(Template)
+    template = apply_fields(Template.query, Template, fields).get_or_404(id)
     return jsonify({
-        'template': template.to_dict(include_relations=True)
+        'template': template.to_dict(include_relations=True, fields=fields)
     }), 200
 
 
@@ -4,11 +4,15 @@ Avukat Yönetim Sistemi - Kullanıcı Yönetimi Routes
 Kullanıcı CRUD endpoint'leri (Admin only).
 """
 
-from flask import Blueprint, request, jsonify, current_app
+from flask import Blueprint, request, jsonify
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from app import db
 from app.models import User
 from app.utils.decorators import role_required
+from app.utils.pagination import paginate_query
+from app.utils.fields import get_fields, apply_fields
+from app.utils.projection import project_query, to_views, json_response
+from app.services.search_service import search_filter
 
 users_bp = Blueprint('users', __name__)
 
@@ -19,24 +23,19 @@ users_bp = Blueprint('users', __name__)
 def get_users():
     """
     Kullanıcı listesi (Admin only)
+    
+    Sayfa numarası (page) veya imleç (cursor) ile sayfalanır. fields
+    parametresi ile yalnızca istenen alanlar döndürülür.
     """
-    page = request.args.get('page', 1, type=int)
-    per_page = request.args.get('per_page', current_app.config['ITEMS_PER_PAGE'], type=int)
     search = request.args.get('search', '')
     role = request.args.get('role', '')
     is_active = request.args.get('is_active', '')
+    fields = get_fields(User)
     
     query = User.query
     
     if search:
-        search_filter = f'%{search}%'
-        query = query.filter(
-            db.or_(
-                User.name.ilike(search_filter),
-                User.surname.ilike(search_filter),
-                User.email.ilike(search_filter)
-            )
-        )
+        query = query.filter(search_filter(User, search))
     
     if role:
         query = query.filter(User.role == role)
@@ -44,14 +43,13 @@ def get_users():
     if is_active != '':
         query = query.filter(User.is_active == (is_active.lower() == 'true'))
     
-    query = query.order_by(User.name.asc())
-    pagination = query.paginate(page=page, per_page=per_page, error_out=False)
+    query = project_query(query, User, fields, User.name)
+    rows, meta = paginate_query(query, User.name, User.id, 'asc')
+    users = to_views(User, rows)
     
-    return jsonify({
-        'users': [u.to_dict() for u in pagination.items],
-        'total': pagination.total,
-        'pages': pagination.pages,
-        'current_page': page
+    return json_response({
+        'users': [u.to_dict(fields=fields) for u in users],
+        **meta
     }), 200
 
 
@@ -60,6 +58,9 @@ def get_users():
 def get_user(id):
     """
     Tek kullanıcı detayı
+    
+    Query Parameters:
+        fields: Döndürülecek alanlar
     """
     current_user_id = get_jwt_identity()
     current_user = User.query.get(current_user_id)
@@ -68,9 +69,10 @@ def get_user(id):
     if not current_user.is_admin() and current_user_id != id:
         return jsonify({'message': 'Yetkisiz erişim'}), 403
     
-    user = User.query.get_or_404(id)
+    fields = get_fields(User)
+    user = apply_fields(User.query, User, fields).get_or_404(id)
     return jsonify({
-        'user': user.to_dict()
+        'user': user.to_dict(fields=fields)
     }), 200
 
 
@@ -5,5 +5,9 @@ Avukat Yönetim Sistemi - Servis Modülü
 """
 
 from app.services.backup_service import init_backup_scheduler, backup_database
+from app.services.schema_service import upgrade_schema
+from app.services.search_service import init_search_indexes, search_filter, ranked_ids, global_search
+from app.services.extraction_service import init_extraction_worker, queue_extraction
+from app.services.counter_service import init_counter_reconciler, reconcile_counters
 
-__all__ = ['init_backup_scheduler', 'backup_database']
+__all__ = ['init_backup_scheduler', 'backup_database', 'upgrade_schema', 'init_search_indexes', 'search_filter', 'ranked_ids', 'global_search', 'init_extraction_worker', 'queue_extraction', 'init_counter_reconciler', 'reconcile_counters']
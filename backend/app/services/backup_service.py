@@ -5,7 +5,7 @@ Otomatik veritabanı yedekleme işlemleri.
 """
 
 import os
-import shutil
+import sqlite3
 from datetime import datetime
 from apscheduler.schedulers.background import BackgroundScheduler
 
@@ -33,8 +33,16 @@ def backup_database(app):
             backup_filename = f'backup_{timestamp}.db'
             backup_path = os.path.join(backup_folder, backup_filename)
             
-            # Veritabanını kopyala
-            shutil.copy2(db_path, backup_path)
+            # Veritabanını SQLite yedekleme API'si ile kopyala (WAL dosyasındaki
+            # henüz ana dosyaya yazılmamış değişiklikler de yedeğe dahil olur)
+            source = sqlite3.connect(db_path)
+            target = sqlite3.connect(backup_path)
+            try:
+                with target:
+                    source.backup(target)
+            finally:
+                target.close()
+                source.close()
             print(f'Veritabanı yedeklendi: {backup_path}')
             
             # Eski yedekleri temizle (son 30 yedeği tut)
@@ -75,6 +83,9 @@ def init_backup_scheduler(app):
     """
     Yedekleme zamanlayıcısını başlatır
     
+    Zamanlayıcı app.extensions['scheduler'] altında tutulur; diğer
+    periyodik işler de aynı zamanlayıcıya eklenir.
+    
     Args:
         app: Flask uygulaması
     """
@@ -105,4 +116,5 @@ def init_backup_scheduler(app):
     )
     
     scheduler.start()
+    app.extensions['scheduler'] = scheduler
     print(f'Yedekleme zamanlayıcısı başlatıldı (her {interval_hours} saatte bir)')
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""
+Avukat Yönetim Sistemi - Sayaç Denetim Servisi
+Müvekkil sayaçlarının, işlem taksit toplamlarının ve aylık finans
+özetinin periyodik olarak kaynak tablolarla karşılaştırılması.
+
+Sayaçlar dava, işlem ve taksit kayıtlarıyla aynı flush içinde güncellenir; toplu
+UPDATE/DELETE sorguları veya veritabanına doğrudan yapılan değişiklikler bu
+olayları tetiklemediğinden oluşabilecek sapmalar bu iş ile düzeltilir.
+"""
+
+from app import db
+from app.services.dashboard_service import invalidate_dashboard_cache
+from app.models.counters import rebuild_client_counters, rebuild_transaction_totals, rebuild_finance_rollup
+
+# (açıklama, yeniden hesaplama fonksiyonu)
+_REBUILDS = (
+    ('Müvekkil sayaçları', rebuild_client_counters),
+    ('İşlem taksit toplamları', rebuild_transaction_totals),
+    ('Aylık finans özeti', rebuild_finance_rollup)
+)
+
+
+def reconcile_counters(app):
+    """
+    Sayaç kolonlarını yeniden hesaplar ve sapmaları düzeltir
+    
+    Args:
+        app: Flask uygulaması
+    
+    Returns:
+        int: Düzeltilen toplam kayıt sayısı
+    """
+    total = 0
+    with app.app_context():
+        for label, rebuild in _REBUILDS:
+            try:
+                with db.engine.begin() as connection:
+                    fixed = rebuild(connection)
+            except Exception as e:
+                print(f'Sayaç denetimi hatası ({label}): {str(e)}')
+                continue
+            
+            if fixed:
+                print(f'{label} düzeltildi: {fixed} kayıt')
+            total += fixed
+        
+        if total:
+            invalidate_dashboard_cache()
+    return total
+
+
+def init_counter_reconciler(app):
+    """
+    Sayaç denetimini yedekleme zamanlayıcısına ekler
+    
+    Zamanlayıcı çalışmıyorsa (ör. test ortamı) hiçbir şey yapmaz.
+    
+    Args:
+        app: Flask uygulaması
+    """
+    scheduler = app.extensions.get('scheduler')
+    interval_hours = app.config['COUNTER_RECONCILE_HOURS']
+    if scheduler is None or not interval_hours:
+        return
+    
+    scheduler.add_job(
+        func=lambda: reconcile_counters(app),
+        trigger='interval',
+        hours=interval_hours,
+        id='counter_reconcile',
+        name='Sayaç Denetimi',
+        replace_existing=True
+    )
+    print(f'Sayaç denetimi zamanlandı (her {interval_hours} saatte bir)')
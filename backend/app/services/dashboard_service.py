@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+"""
+Avukat Yönetim Sistemi - Dashboard Önbelleği
+Dashboard istatistik yanıtlarının kullanıcı bazında bellekte tutulması.
+
+Yanıtlar hazır JSON gövdesi ve gövdenin özetinden üretilen güçlü ETag ile
+saklanır. Müvekkil, dava, işlem, aday, takvim ve kullanıcı kayıtlarında
+commit edilen her değişiklik önbelleği boşaltır; "bugün" ve "şu an"a bağlı
+metrikler (yaklaşan etkinlikler, bu ayın toplamları) için kayıtlar ayrıca
+DASHBOARD_CACHE_TTL saniye sonra geçersiz olur.
+
+Önbellek süreç içidir; birden çok worker ile çalışıldığında her worker
+yalnızca kendi yaptığı değişikliklerde önbelleğini boşaltır, diğer
+worker'ların değişiklikleri en geç TTL süresi sonunda görünür. Olayları
+tetiklemeyen toplu UPDATE/DELETE sorguları için de aynı süre geçerlidir.
+"""
+
+import hashlib
+import threading
+import time
+from flask import current_app, has_app_context
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from app.models import User, Client, Case, Transaction, Lead, CalendarEvent
+
+# Önbellekte tutulacak en fazla kullanıcı sayısı
+MAX_ENTRIES = 256
+
+# Değişiklikleri önbelleği boşaltan modeller
+_WATCHED_MODELS = (User, Client, Case, Transaction, Lead, CalendarEvent)
+
+
+class DashboardCache:
+    """
+    Kullanıcı bazlı yanıt önbelleği
+    
+    Her boşaltmada sürüm numarası artırılır; hesaplamaya başlamadan önce
+    alınan sürüm değişmişse (hesaplama sırasında commit olduysa) sonuç
+    önbelleğe yazılmaz.
+    """
+    
+    def __init__(self, ttl):
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._version = 0
+        self.ttl = ttl
+    
+    @property
+    def version(self):
+        """Geçerli önbellek sürümü"""
+        return self._version
+    
+    def get(self, key):
+        """
+        Kullanıcının geçerli yanıtını döndürür
+        
+        Returns:
+            tuple: (etag, gövde) veya kayıt yoksa/süresi dolduysa None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None or entry[2] <= time.monotonic():
+            return None
+        return entry[0], entry[1]
+    
+    def put(self, key, version, etag, body):
+        """Yanıtı, hesaplama başındaki sürüm hâlâ geçerliyse saklar"""
+        if not self.ttl:
+            return
+        with self._lock:
+            if version != self._version:
+                return
+            if len(self._entries) >= MAX_ENTRIES:
+                self._entries.clear()
+            self._entries[key] = (etag, body, time.monotonic() + self.ttl)
+    
+    def invalidate(self):
+        """Tüm kayıtları siler"""
+        with self._lock:
+            self._version += 1
+            self._entries.clear()
+
+
+def make_etag(body):
+    """Yanıt gövdesinden güçlü ETag değeri üretir"""
+    return hashlib.sha256(body).hexdigest()[:32]
+
+
+def init_dashboard_cache(app):
+    """
+    Dashboard önbelleğini oluşturur
+    
+    Önbellek app.extensions['dashboard_cache'] altında tutulur;
+    DASHBOARD_CACHE_TTL 0 ise yanıtlar saklanmaz (ETag yine üretilir).
+    
+    Args:
+        app: Flask uygulaması
+    """
+    app.extensions['dashboard_cache'] = DashboardCache(app.config['DASHBOARD_CACHE_TTL'])
+
+
+def get_dashboard_cache():
+    """Geçerli uygulamanın önbelleğini döndürür (yoksa None)"""
+    if not has_app_context():
+        return None
+    return current_app.extensions.get('dashboard_cache')
+
+
+def invalidate_dashboard_cache():
+    """Geçerli uygulamanın önbelleğini boşaltır"""
+    cache = get_dashboard_cache()
+    if cache is not None:
+        cache.invalidate()
+
+
+@event.listens_for(Session, 'after_flush')
+def _collect_changes(session, flush_context):
+    """İzlenen modellerde değişiklik flush edildiyse commit'e kadar işaretler"""
+    if session.info.get('dashboard_changed'):
+        return
+    for obj in session.new | session.dirty | session.deleted:
+        if isinstance(obj, _WATCHED_MODELS):
+            session.info['dashboard_changed'] = True
+            return
+
+
+@event.listens_for(Session, 'after_commit')
+def _apply_changes(session):
+    """Commit edilen değişiklik varsa önbelleği boşaltır"""
+    if session.info.pop('dashboard_changed', None):
+        invalidate_dashboard_cache()
+
+
+@event.listens_for(Session, 'after_rollback')
+def _discard_changes(session):
+    """Geri alınan işlemin işaretini atar"""
+    session.info.pop('dashboard_changed', None)
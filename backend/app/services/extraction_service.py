@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+"""
+Avukat Yönetim Sistemi - Belge İçeriği Çıkarma Servisi
+Yüklenen txt, docx ve xlsx dosyalarından arka planda metin çıkarılması.
+
+docx ve xlsx dosyaları XML içeren ZIP arşivleri olduğundan standart
+kütüphane ile okunur. Çıkarılan metin document_contents tablosuna yazılır
+ve tetikleyicilerle tam metin arama indeksine eklenir.
+
+Çıkarma işlemleri yükleme isteğini bekletmemek için bir iş parçacığı
+havuzunda çalıştırılır.
+"""
+
+import codecs
+import zipfile
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from app import db
+from app.models import Document, DocumentContent
+
+# Metni çıkarılabilen dosya uzantıları
+SUPPORTED_EXTENSIONS = {'txt', 'docx', 'xlsx'}
+
+# Arşiv içindeki tek bir XML dosyasının açılmış halde en fazla boyutu (ZIP bombası koruması)
+MAX_ARCHIVE_MEMBER_SIZE = 50 * 1024 * 1024
+
+_WORD_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_SHEET_NS = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+
+# Metin dosyaları için denenecek karakter kodlamaları
+_TEXT_ENCODINGS = ('utf-8-sig', 'cp1254')
+
+
+def _read_txt(path, max_length):
+    """
+    Metin dosyasını okur
+    
+    Dosyanın yalnızca baş kısmı okunduysa, sınırda yarım kalan çok baytlı
+    karakter hata sayılmaz; artımlı çözücü bu baytları atar. Bir sonraki
+    kodlama yalnızca gerçek bir çözme hatasında denenir.
+    """
+    with open(path, 'rb') as f:
+        data = f.read(max_length * 4)
+        truncated = bool(f.read(1))
+    
+    for encoding in _TEXT_ENCODINGS:
+        try:
+            return codecs.getincrementaldecoder(encoding)().decode(data, final=not truncated)
+        except UnicodeDecodeError:
+            continue
+    return data.decode('utf-8', errors='replace')
+
+
+def _open_member(archive, name):
+    """Arşivdeki XML dosyasını boyut kontrolüyle açar"""
+    info = archive.getinfo(name)
+    if info.file_size > MAX_ARCHIVE_MEMBER_SIZE:
+        raise ValueError(f'{name} çok büyük ({info.file_size} bayt)')
+    return archive.open(info)
+
+
+def _element_texts(stream, block_tag, text_tag):
+    """XML içindeki her blok elemanın metnini sırayla üretir"""
+    for _, element in ET.iterparse(stream):
+        if element.tag == block_tag:
+            text = ''.join(t.text or '' for t in element.iter(text_tag))
+            if text:
+                yield text
+            element.clear()
+
+
+def _read_docx(path):
+    """Word belgesindeki paragrafları okur"""
+    with zipfile.ZipFile(path) as archive:
+        with _open_member(archive, 'word/document.xml') as stream:
+            return '\n'.join(_element_texts(stream, f'{_WORD_NS}p', f'{_WORD_NS}t'))
+
+
+def _read_xlsx(path):
+    """Excel dosyasındaki metin hücrelerini okur"""
+    texts = []
+    with zipfile.ZipFile(path) as archive:
+        names = archive.namelist()
+        
+        # Metin hücrelerinin çoğu paylaşılan metin tablosunda tutulur
+        if 'xl/sharedStrings.xml' in names:
+            with _open_member(archive, 'xl/sharedStrings.xml') as stream:
+                texts.extend(_element_texts(stream, f'{_SHEET_NS}si', f'{_SHEET_NS}t'))
+        
+        # Satır içi metinler sayfa dosyalarında bulunur
+        for name in sorted(n for n in names if n.startswith('xl/worksheets/') and n.endswith('.xml')):
+            with _open_member(archive, name) as stream:
+                texts.extend(_element_texts(stream, f'{_SHEET_NS}is', f'{_SHEET_NS}t'))
+    
+    return '\n'.join(texts)
+
+
+def extract_text(path, extension, max_length):
+    """
+    Dosyadan metin çıkarır
+    
+    Args:
+        path: Dosya yolu
+        extension: Dosya uzantısı
+        max_length: Döndürülecek en fazla karakter sayısı
+    
+    Returns:
+        str: Çıkarılan metin
+    
+    Raises:
+        OSError, ValueError, KeyError, zipfile.BadZipFile, ET.ParseError: Dosya okunamazsa
+    """
+    if extension == 'txt':
+        text = _read_txt(path, max_length)
+    elif extension == 'docx':
+        text = _read_docx(path)
+    elif extension == 'xlsx':
+        text = _read_xlsx(path)
+    else:
+        raise ValueError(f'Desteklenmeyen dosya tipi: {extension}')
+    return text[:max_length]
+
+
+def extract_document(app, document_id):
+    """
+    Belgenin metnini çıkarıp kaydeder
+    
+    Args:
+        app: Flask uygulaması
+        document_id: Belge ID'si
+    """
+    with app.app_context():
+        document = db.session.get(Document, document_id)
+        if document is None or document.extension not in SUPPORTED_EXTENSIONS:
+            return
+        file_path, extension, original_filename = document.file_path, document.extension, document.original_filename
+        
+        # Dosya okunurken yazma havuzundaki bağlantıyı tutma
+        db.session.close()
+        
+        try:
+            text = extract_text(file_path, extension, app.config['DOCUMENT_TEXT_MAX_LENGTH'])
+            status = 'done'
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile, ET.ParseError) as e:
+            print(f'Belge içeriği okunamadı ({original_filename}): {str(e)}')
+            text = None
+            status = 'failed'
+        
+        content = db.session.get(DocumentContent, document_id) or DocumentContent(id=document_id)
+        content.content = text
+        content.status = status
+        content.extracted_at = datetime.utcnow()
+        db.session.add(content)
+        db.session.flush()
+        
+        # Belge dosya okunurken silinmiş olabilir; yazma kilidi alındıktan sonra
+        # kontrol edilir, aksi halde içerik satırı sahipsiz kalır ve ID yeniden
+        # kullanıldığında yeni belgeye geçer
+        if db.session.query(Document.id).filter_by(id=document_id).first() is None:
+            db.session.rollback()
+            return
+        db.session.commit()
+
+
+def queue_extraction(app, document_id):
+    """
+    Belgeyi içerik çıkarma kuyruğuna ekler
+    
+    DOCUMENT_EXTRACTION_WORKERS 0 ise işlem hemen, çağıran iş
+    parçacığında yapılır.
+    
+    Args:
+        app: Flask uygulaması
+        document_id: Belge ID'si
+    """
+    executor = app.extensions.get('extraction_executor')
+    if executor is None:
+        extract_document(app, document_id)
+    else:
+        executor.submit(extract_document, app, document_id)
+
+
+def init_extraction_worker(app):
+    """
+    İçerik çıkarma havuzunu başlatır
+    
+    Uygulama başlarken çağrılır; içeriği henüz çıkarılmamış belgeler
+    kuyruğa eklenir.
+    
+    Args:
+        app: Flask uygulaması
+    """
+    workers = app.config['DOCUMENT_EXTRACTION_WORKERS']
+    executor = None
+    if workers > 0:
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='document-extraction')
+    app.extensions['extraction_executor'] = executor
+    
+    with app.app_context():
+        pending = db.session.query(Document.id, Document.original_filename).outerjoin(
+            DocumentContent, DocumentContent.id == Document.id
+        ).filter(DocumentContent.id.is_(None)).all()
+    
+    for document_id, original_filename in pending:
+        if original_filename.rsplit('.', 1)[-1].lower() in SUPPORTED_EXTENSIONS:
+            queue_extraction(app, document_id)
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""
+Avukat Yönetim Sistemi - Şema Güncelleme Servisi
+Mevcut veritabanlarına yeni kolon ve indekslerin eklenmesi.
+
+db.create_all() yalnızca eksik tabloları oluşturur; var olan tablolara
+sonradan modele eklenen kolonları ve indeksleri eklemez. Bu servis
+uygulama başlarken modelleri veritabanıyla karşılaştırır, eksikleri ekler
+ve yeni kolonlar için modelin backfill_columns metodunu çağırır.
+
+Mevcut verinin biçimini değiştiren dönüşümler DATA_MIGRATIONS listesinde
+sürüm numarasıyla tutulur; veritabanının PRAGMA user_version değeri
+hangi dönüşümlerin uygulandığını gösterir.
+"""
+
+from sqlalchemy import inspect, literal
+from app import db
+
+# Kuruşa çevrilen para kolonları (önceden lira cinsinden REAL saklanıyordu)
+_MONEY_COLUMNS = {
+    'transactions': ('amount',),
+    'installments': ('amount',),
+    'cases': ('case_value',),
+    'leads': ('estimated_value',)
+}
+
+
+def _money_to_minor_units(connection):
+    """Para tutarlarını tam sayı kuruşa çevirir"""
+    for table, columns in _MONEY_COLUMNS.items():
+        for column in columns:
+            connection.exec_driver_sql(
+                f'UPDATE {table} SET {column} = CAST(ROUND({column} * 100) AS INTEGER) '
+                f'WHERE {column} IS NOT NULL'
+            )
+
+
+def _build_finance_rollup(connection):
+    """Aylık finans özetini mevcut işlemlerden oluşturur"""
+    from app.models.counters import rebuild_finance_rollup
+    rebuild_finance_rollup(connection)
+
+
+# (sürüm, dönüşüm fonksiyonu) - yalnızca sona eklenir, sıralama değiştirilmez
+DATA_MIGRATIONS = (
+    (1, _money_to_minor_units),
+    (2, _build_finance_rollup),
+)
+
+
+def _run_data_migrations(connection):
+    """Veritabanına henüz uygulanmamış veri dönüşümlerini çalıştırır"""
+    if connection.dialect.name != 'sqlite':
+        return
+    
+    version = connection.exec_driver_sql('PRAGMA user_version').scalar()
+    for target, migrate in DATA_MIGRATIONS:
+        if version < target:
+            migrate(connection)
+            connection.exec_driver_sql(f'PRAGMA user_version = {target}')
+            print(f'Veri dönüşümü uygulandı: {target} ({migrate.__doc__})')
+
+
+def _column_ddl(column, dialect):
+    """ALTER TABLE ... ADD COLUMN için kolon tanımını üretir"""
+    ddl = f'{column.name} {column.type.compile(dialect=dialect)}'
+    default = column.default
+    if default is not None and default.is_scalar:
+        value = literal(default.arg).compile(dialect=dialect, compile_kwargs={'literal_binds': True})
+        ddl += f' DEFAULT {value}'
+    return ddl
+
+
+def upgrade_schema():
+    """
+    Eksik kolon ve indeksleri ekler
+    
+    Uygulama başlarken db.create_all() sonrasında çağrılır.
+    """
+    models = {mapper.local_table.name: mapper.class_ for mapper in db.Model.registry.mappers}
+    
+    dialect = db.engine.dialect
+    with db.engine.begin() as connection:
+        _run_data_migrations(connection)
+        
+        inspector = inspect(connection)
+        
+        for table in db.metadata.sorted_tables:
+            existing = {c['name'] for c in inspector.get_columns(table.name)}
+            existing_indexes = {i['name'] for i in inspector.get_indexes(table.name)}
+            added = [c for c in table.columns if c.name not in existing]
+            
+            for column in added:
+                connection.exec_driver_sql(f'ALTER TABLE {table.name} ADD COLUMN {_column_ddl(column, dialect)}')
+                print(f'Kolon eklendi: {table.name}.{column.name}')
+            
+            for index in table.indexes:
+                if index.name not in existing_indexes:
+                    index.create(connection)
+                    print(f'İndeks eklendi: {index.name}')
+            
+            model = models.get(table.name)
+            if added and hasattr(model, 'backfill_columns'):
+                model.backfill_columns(connection, [c.name for c in added])
@@ -0,0 +1,376 @@
+# -*- coding: utf-8 -*-
+"""
+Avukat Yönetim Sistemi - Arama Servisi
+SQLite FTS5 tam metin arama indeksleri.
+
+SEARCH_COLUMNS tanımlı her model için "<tablo>_fts" adında harici içerikli
+(external content) bir FTS5 tablosu oluşturulur. Tablo, ana tablodaki
+INSERT/UPDATE/DELETE işlemlerinde tetikleyicilerle güncel tutulur; bu
+sayede ORM dışından yapılan değişiklikler de indekse yansır.
+
+Veritabanı SQLite değilse veya FTS5 desteklenmiyorsa arama, eski
+ilike '%terim%' filtresine geri döner.
+"""
+
+import re
+from flask import current_app
+from sqlalchemy import text, literal, literal_column, select, table, column, func, union_all, or_
+from sqlalchemy.exc import OperationalError
+from app import db
+from app.models.normalized import normalize_text, normalize_digits
+
+# Kelimeleri büyük/küçük harf ve aksan farkı gözetmeden eşleştirir (ç -> c, ş -> s)
+FTS_TOKENIZER = 'unicode61 remove_diacritics 2'
+
+_TOKEN_PATTERN = re.compile(r'\w+', re.UNICODE)
+
+# Genel arama sonuçlarındaki özet metinlerin en fazla uzunluğu
+SUMMARY_LENGTH = 120
+
+
+def searchable_models():
+    """SEARCH_COLUMNS tanımlı modelleri döndürür"""
+    from app.models import Client, Case, Lead, Document, DocumentContent, Template, User
+    return [Client, Case, Lead, Document, DocumentContent, Template, User]
+
+
+def _model_for_table(name):
+    """Tablo adına karşılık gelen model sınıfını döndürür"""
+    for mapper in db.Model.registry.mappers:
+        if mapper.local_table.name == name:
+            return mapper.class_
+    raise KeyError(name)
+
+
+def fts_table(model):
+    """Modelin FTS tablosunun adını döndürür"""
+    return f'{model.__tablename__}_fts'
+
+
+def _create_table_sql(model):
+    """FTS tablosunun CREATE ifadesini üretir"""
+    columns = ', '.join(model.SEARCH_COLUMNS)
+    return (
+        f"CREATE VIRTUAL TABLE {fts_table(model)} USING fts5("
+        f"{columns}, content='{model.__tablename__}', content_rowid='id', "
+        f"tokenize='{FTS_TOKENIZER}')"
+    )
+
+
+def _indexed_value(expression):
+    """
+    Kolon değerini indekse yazılacak hale getirir
+    
+    unicode61 tokenizer'ı ı ve İ harflerini i ile eşleştirmediğinden bu
+    harfler indekse i olarak yazılır; diğer harfler tokenizer tarafından
+    katlanır.
+    """
+    return f"replace(replace({expression}, 'ı', 'i'), 'İ', 'i')"
+
+
+def _trigger_sql(model):
+    """FTS tablosunu güncel tutan tetikleyicileri üretir"""
+    content_table = model.__tablename__
+    fts = fts_table(model)
+    columns = ', '.join(model.SEARCH_COLUMNS)
+    new_values = ', '.join(_indexed_value(f'new.{c}') for c in model.SEARCH_COLUMNS)
+    old_values = ', '.join(_indexed_value(f'old.{c}') for c in model.SEARCH_COLUMNS)
+    
+    delete_old = (
+        f"INSERT INTO {fts}({fts}, rowid, {columns}) "
+        f"VALUES ('delete', old.id, {old_values});"
+    )
+    insert_new = f"INSERT INTO {fts}(rowid, {columns}) VALUES (new.id, {new_values});"
+    
+    # Güncellemede yalnızca arama kolonları değiştiyse indeks yenilenir
+    return {
+        f'{fts}_ai': f"CREATE TRIGGER {fts}_ai AFTER INSERT ON {content_table} BEGIN {insert_new} END",
+        f'{fts}_ad': f"CREATE TRIGGER {fts}_ad AFTER DELETE ON {content_table} BEGIN {delete_old} END",
+        f'{fts}_au': (
+            f"CREATE TRIGGER {fts}_au AFTER UPDATE OF {columns} ON {content_table} "
+            f"BEGIN {delete_old} {insert_new} END"
+        )
+    }
+
+
+def _rebuild_sql(model):
+    """FTS tablosunu ana tablodaki kayıtlardan dolduran ifadeleri üretir"""
+    fts = fts_table(model)
+    columns = ', '.join(model.SEARCH_COLUMNS)
+    values = ', '.join(_indexed_value(c) for c in model.SEARCH_COLUMNS)
+    return [
+        f"INSERT INTO {fts}({fts}) VALUES ('delete-all')",
+        f"INSERT INTO {fts}(rowid, {columns}) SELECT id, {values} FROM {model.__tablename__}"
+    ]
+
+
+def _schema_objects(connection):
+    """Veritabanındaki tablo ve tetikleyici tanımlarını döndürür"""
+    rows = connection.execute(
+        text("SELECT name, sql FROM sqlite_master WHERE type IN ('table', 'trigger')")
+    )
+    return {name: sql for name, sql in rows}
+
+
+def _ensure_index(connection, model, existing):
+    """
+    Modelin FTS tablosunu ve tetikleyicilerini oluşturur
+    
+    Tablo tanımı değişmişse (ör. yeni arama kolonu) tablo yeniden
+    oluşturulur ve mevcut kayıtlardan doldurulur.
+    
+    Returns:
+        bool: İndeks yeniden oluşturulduysa True
+    """
+    fts = fts_table(model)
+    create_sql = _create_table_sql(model)
+    triggers = _trigger_sql(model)
+    
+    if existing.get(fts) == create_sql and all(existing.get(n) == sql for n, sql in triggers.items()):
+        return False
+    
+    for name in triggers:
+        connection.execute(text(f'DROP TRIGGER IF EXISTS {name}'))
+    connection.execute(text(f'DROP TABLE IF EXISTS {fts}'))
+    
+    connection.execute(text(create_sql))
+    for sql in triggers.values():
+        connection.execute(text(sql))
+    for sql in _rebuild_sql(model):
+        connection.execute(text(sql))
+    return True
+
+
+def init_search_indexes(app):
+    """
+    FTS indekslerini hazırlar
+    
+    Uygulama başlarken çağrılır. FTS5 kullanılamıyorsa SEARCH_USE_FTS
+    kapatılır ve arama ilike filtresiyle yapılır.
+    
+    Args:
+        app: Flask uygulaması
+    """
+    if not app.config.get('SEARCH_USE_FTS'):
+        return
+    
+    if db.engine.dialect.name != 'sqlite':
+        app.config['SEARCH_USE_FTS'] = False
+        return
+    
+    try:
+        with db.engine.begin() as connection:
+            existing = _schema_objects(connection)
+            for model in searchable_models():
+                if _ensure_index(connection, model, existing):
+                    print(f'Arama indeksi oluşturuldu: {fts_table(model)}')
+    except OperationalError as e:
+        app.config['SEARCH_USE_FTS'] = False
+        print(f'FTS5 kullanılamıyor, arama ilike ile yapılacak: {str(e)}')
+
+
+def build_match_query(term):
+    """
+    Arama terimini FTS5 MATCH ifadesine çevirir
+    
+    Her kelime önek olarak aranır ve tüm kelimelerin eşleşmesi gerekir
+    (ör. 'Ahm Yıl' -> '"ahm"* "yil"*').
+    
+    Returns:
+        str: MATCH ifadesi veya terimde kelime yoksa None
+    """
+    tokens = _TOKEN_PATTERN.findall(normalize_text(term) or '')
+    if not tokens:
+        return None
+    return ' '.join('"{}"*'.format(token.replace('"', '""')) for token in tokens)
+
+
+def _use_fts():
+    """FTS indekslerinin kullanılıp kullanılmayacağını döndürür"""
+    return current_app.config.get('SEARCH_USE_FTS', False)
+
+
+def _prefix_range(column_, prefix):
+    """
+    Önek aramasını indeksli aralık koşuluna çevirir
+    
+    column LIKE 'abc%' yerine column >= 'abc' AND column < 'abd'
+    kullanılır; böylece kolon üzerindeki indeks kullanılabilir.
+    """
+    upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+    return db.and_(column_ >= prefix, column_ < upper)
+
+
+def _normalized_filters(model, term):
+    """Normalize arama kolonları için önek aralığı koşullarını döndürür"""
+    filters = []
+    for target, normalize in getattr(model, 'NORMALIZED_COLUMNS', {}).values():
+        prefix = normalize(term)
+        if prefix:
+            filters.append(_prefix_range(getattr(model, target), prefix))
+    return filters
+
+
+def search_filter(model, term):
+    """
+    Liste sorgularında kullanılacak arama koşulunu döndürür
+    
+    Normalize kolonlarda (ad, e-posta, telefon vb.) önek aralığı taraması,
+    diğer kolonlarda FTS eşleşmesi yapılır. FTS kullanılamıyorsa normalize
+    edilmemiş kolonlar ilike ile aranır.
+    
+    Args:
+        model: SEARCH_COLUMNS tanımlı model sınıfı
+        term: Arama terimi
+    
+    Returns:
+        Sorguya filter ile eklenecek SQL ifadesi
+    """
+    filters = _normalized_filters(model, term)
+    match = build_match_query(term) if _use_fts() else None
+    
+    # Modelin kendisi ve SEARCH_INCLUDES ile bağlı tablolar (ör. belge içerikleri)
+    sources = [model] + [_model_for_table(name) for name in getattr(model, 'SEARCH_INCLUDES', ())]
+    
+    if match is None:
+        normalized = set(getattr(model, 'NORMALIZED_COLUMNS', {}))
+        pattern = f'%{term}%'
+        filters.extend(
+            getattr(model, c).ilike(pattern) for c in model.SEARCH_COLUMNS if c not in normalized
+        )
+        for include in sources[1:]:
+            filters.append(model.id.in_(select(include.id).where(
+                db.or_(*[getattr(include, c).ilike(pattern) for c in include.SEARCH_COLUMNS])
+            )))
+        return db.or_(*filters)
+    
+    matches = []
+    for source in sources:
+        fts = table(fts_table(source), column('rowid'))
+        matches.append(model.id.in_(select(fts.c.rowid).where(literal_column(fts.name).match(match))))
+    return db.or_(*matches, *filters)
+
+
+def _ranked_select(model, term, limit, *columns):
+    """
+    Terimle eşleşen kayıtları alaka sırasına göre seçen sorguyu üretir
+    
+    FTS kullanılabiliyorsa kayıtlar bm25 puanına (rank) göre sıralanır;
+    kullanılamıyorsa ilike filtresiyle en yeni kayıtlar seçilir ve puan 0
+    olur.
+    """
+    match = build_match_query(term) if _use_fts() else None
+    
+    if match is None:
+        return select(
+            model.id.label('id'), literal(0.0).label('score'), *columns
+        ).where(search_filter(model, term)).order_by(model.id.desc()).limit(limit)
+    
+    fts = table(fts_table(model), column('rowid'), column('rank'))
+    return select(
+        model.id.label('id'), fts.c.rank.label('score'), *columns
+    ).join_from(fts, model, model.id == fts.c.rowid).where(
+        literal_column(fts.name).match(match)
+    ).order_by(fts.c.rank).limit(limit)
+
+
+def ranked_ids(model, term, limit=10):
+    """
+    Terimle eşleşen kayıtları alaka sırasına göre döndürür
+    
+    Sıralama FTS5'in bm25 puanına göre yapılır; puan ne kadar küçükse
+    eşleşme o kadar iyidir.
+    
+    Args:
+        model: SEARCH_COLUMNS tanımlı model sınıfı
+        term: Arama terimi
+        limit: En fazla sonuç sayısı
+    
+    Returns:
+        list: (kayıt ID'si, puan) çiftleri
+    """
+    rows = db.session.execute(_ranked_select(model, term, limit))
+    return [(row.id, row.score) for row in rows]
+
+
+def global_search_types():
+    """
+    Genel aramadaki sonuç tiplerini döndürür
+    
+    Returns:
+        dict: Tip adı -> (model, başlık ifadesi, alt başlık ifadesi)
+    """
+    from app.models import Client, Case, Lead, Document, Template
+    return {
+        'clients': (Client, Client.name + ' ' + Client.surname, Client.tc_no),
+        'cases': (Case, Case.case_number, func.substr(Case.subject, 1, SUMMARY_LENGTH)),
+        'leads': (Lead, Lead.name, Lead.contact_info),
+        'documents': (Document, Document.original_filename, func.substr(Document.description, 1, SUMMARY_LENGTH)),
+        'templates': (Template, Template.name, Template.category)
+    }
+
+
+def _visibility_filter(name, model, user_id):
+    """
+    Tipin liste endpoint'indeki görünürlük kuralını döndürür (kural yoksa None)
+    
+    Şablonlar: herkese açık olanlar ve kullanıcının kendi oluşturdukları.
+    """
+    if name == 'templates':
+        return or_(model.is_public == True, model.created_by == user_id)
+    return None
+
+
+def global_search(term, limit=5, types=None, user_id=None):
+    """
+    Tüm tiplerde tek sorguyla arama yapar
+    
+    Her tip için en iyi limit kadar sonuç, alaka sırasına göre seçilir ve
+    alt sorgular UNION ALL ile birleştirilerek tek seferde çalıştırılır.
+    Sonuçlar, liste endpoint'lerindeki görünürlük kurallarıyla (ör. başka
+    kullanıcıların gizli şablonları) sınırlanır.
+    
+    Args:
+        term: Arama terimi
+        limit: Tip başına en fazla sonuç sayısı
+        types: Aranacak tip adları (None ise tümü)
+        user_id: İsteği yapan kullanıcının ID'si
+    
+    Returns:
+        dict: Tip adı -> sonuç listesi (id, title, subtitle, score)
+    """
+    search_types = {
+        name: spec for name, spec in global_search_types().items()
+        if types is None or name in types
+    }
+    results = {name: [] for name in search_types}
+    if not search_types:
+        return results
+    
+    selects = []
+    for name, (model, title, subtitle) in search_types.items():
+        ranked = _ranked_select(
+            model, term, limit,
+            literal(name).label('type'),
+            title.label('title'),
+            subtitle.label('subtitle')
+        )
+        visibility = _visibility_filter(name, model, user_id)
+        if visibility is not None:
+            ranked = ranked.where(visibility)
+        selects.append(select(ranked.subquery()))
+    
+    for row in db.session.execute(union_all(*selects)):
+        results[row.type].append({
+            'id': row.id,
+            'title': row.title,
+            'subtitle': row.subtitle,
+            # bm25 puanı negatiftir; yüksek skor daha iyi eşleşme olacak şekilde çevrilir
+            'score': round(-row.score, 4) if row.score else 0.0
+        })
+    
+    # UNION ALL alt sorgu sırasını garanti etmediğinden sonuçlar yeniden sıralanır
+    for items in results.values():
+        items.sort(key=lambda item: item['score'], reverse=True)
+    
+    return results
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""
+Avukat Yönetim Sistemi - SQLite Bağlantı Ayarları
+Her yeni veritabanı bağlantısına yapılandırmadaki PRAGMA ayarlarının
+uygulanması ve GET istekleri için salt okunur bağlantı havuzu.
+
+Varsayılan profil WAL günlük kipini kullanır; bu kipte okuyucular yazma
+işlemlerini beklemez ve eşzamanlı isteklerde 'database is locked'
+hataları büyük ölçüde ortadan kalkar. Uzun süren rapor ve dışa aktarma
+okumaları ayrı havuzdan bağlantı aldığından yazma havuzunu meşgul etmez.
+"""
+
+from sqlalchemy import event, create_engine
+from app import db
+
+# Desteklenen PRAGMA'lar; busy_timeout, günlük kipi değişirken kilit beklenebilmesi için ilk sırada uygulanır
+SUPPORTED_PRAGMAS = ('busy_timeout', 'journal_mode', 'synchronous', 'cache_size', 'mmap_size', 'temp_store', 'query_only')
+
+
+def _apply_pragmas(dbapi_connection, pragmas):
+    """PRAGMA ayarlarını DBAPI bağlantısına uygular"""
+    cursor = dbapi_connection.cursor()
+    try:
+        for name in SUPPORTED_PRAGMAS:
+            if name in pragmas:
+                cursor.execute(f'PRAGMA {name} = {pragmas[name]}')
+    finally:
+        cursor.close()
+
+
+def read_pragmas(connection):
+    """
+    Bağlantıdaki geçerli PRAGMA değerlerini okur
+    
+    Args:
+        connection: SQLAlchemy bağlantısı
+    
+    Returns:
+        dict: PRAGMA adı -> değer
+    """
+    return {name: connection.exec_driver_sql(f'PRAGMA {name}').scalar() for name in SUPPORTED_PRAGMAS}
+
+
+def configure_engine(engine, pragmas):
+    """
+    Motorun açacağı her bağlantıya PRAGMA ayarlarını uygular
+    
+    Args:
+        engine: SQLAlchemy motoru
+        pragmas: PRAGMA adı -> değer (bilinmeyen adlar ValueError verir)
+    """
+    unknown = set(pragmas) - set(SUPPORTED_PRAGMAS)
+    if unknown:
+        raise ValueError(f'Desteklenmeyen SQLite ayarı: {", ".join(sorted(unknown))}')
+    
+    @event.listens_for(engine, 'connect')
+    def _on_connect(dbapi_connection, connection_record):
+        _apply_pragmas(dbapi_connection, pragmas)
+
+
+def init_sqlite_pragmas(app):
+    """
+    Uygulamanın veritabanı motoru için SQLite ayarlarını etkinleştirir
+    
+    Uygulama başlarken, ilk bağlantı açılmadan önce çağrılır. Geçerli
+    değerler konsola yazılır ve app.extensions['sqlite_pragmas'] altında
+    tutulur.
+    
+    Args:
+        app: Flask uygulaması
+    """
+    engine = db.engine
+    if engine.dialect.name != 'sqlite':
+        return
+    
+    pragmas = app.config['SQLITE_PRAGMAS']
+    configure_engine(engine, pragmas)
+    
+    with engine.connect() as connection:
+        effective = read_pragmas(connection)
+    app.extensions['sqlite_pragmas'] = effective
+    
+    print('SQLite ayarları: ' + ', '.join(f'{name}={value}' for name, value in effective.items()))
+    
+    # Ağ sürücüleri ve bellek içi veritabanları WAL kipini desteklemez
+    requested_mode = str(pragmas.get('journal_mode', '')).lower()
+    if requested_mode and effective['journal_mode'] != requested_mode:
+        print(f'Uyarı: journal_mode={requested_mode} uygulanamadı, {effective["journal_mode"]} kullanılıyor')
+
+
+def init_read_engine(app):
+    """
+    GET istekleri için salt okunur motoru oluşturur
+    
+    Motor aynı veritabanı dosyasına query_only ayarıyla bağlanır ve
+    app.extensions['read_engine'] altında tutulur; oturum GET ve HEAD
+    isteklerinde bu motoru kullanır. Bellek içi veritabanlarında ve
+    DATABASE_READ_POOL_SIZE 0 iken devre dışıdır.
+    
+    Args:
+        app: Flask uygulaması
+    """
+    app.extensions['read_engine'] = None
+    
+    engine = db.engine
+    pool_size = app.config['DATABASE_READ_POOL_SIZE']
+    if pool_size <= 0 or engine.dialect.name != 'sqlite' or engine.url.database in (None, '', ':memory:'):
+        return
+    
+    read_engine = create_engine(engine.url, pool_size=pool_size, max_overflow=0)
+    configure_engine(read_engine, {**app.config['SQLITE_PRAGMAS'], 'query_only': 1})
+    app.extensions['read_engine'] = read_engine
+    
+    print(f'Salt okunur bağlantı havuzu: {pool_size} bağlantı')
@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+"""
+Avukat Yönetim Sistemi - Otomatik Tamamlama Servisi
+Müvekkil adları, TC numaraları ve dava numaraları için bellek içi önek indeksi.
+
+İndeks, uygulama başlarken veritabanından bir kez oluşturulur ve
+sonrasında ORM commit olaylarıyla güncel tutulur. Aramalar sıralı bir
+liste üzerinde bisect ile yapıldığından veritabanına gidilmez.
+
+İndeks süreç içidir; birden çok worker ile çalışıldığında her worker
+kendi indeksini tutar ve yalnızca kendi yaptığı değişiklikleri görür.
+"""
+
+import threading
+from bisect import bisect_left, insort
+from itertools import chain
+from flask import current_app, has_app_context
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+from app.models import Client, Case
+from app.models.normalized import normalize_text, normalize_digits
+
+# Dava özetinde gösterilecek konu uzunluğu
+SUBJECT_LENGTH = 80
+
+# Başlangıçta veritabanından tek seferde okunacak satır sayısı
+LOAD_BATCH_SIZE = 1000
+
+
+class SuggestIndex:
+    """
+    Sıralı önek indeksi
+    
+    Her kayıt bir veya daha fazla normalize anahtarla (ör. 'ahmet yilmaz',
+    'yilmaz ahmet') (anahtar, tip, id) biçiminde sıralı listede tutulur.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._keys = []
+        self._items = {}
+    
+    def __len__(self):
+        return len(self._items)
+    
+    def load(self, entries):
+        """
+        İndeksi verilen kayıtlarla baştan oluşturur
+        
+        Args:
+            entries: (tip, id, anahtarlar, özet) demetleri
+        """
+        items = {}
+        keys = []
+        for type_, id_, entry_keys, summary in entries:
+            items[(type_, id_)] = (entry_keys, summary)
+            keys.extend((key, type_, id_) for key in entry_keys)
+        keys.sort()
+        
+        with self._lock:
+            self._keys = keys
+            self._items = items
+    
+    def _remove(self, type_, id_):
+        """Kaydın anahtarlarını listeden çıkarır (kilit alınmış olmalı)"""
+        item = self._items.pop((type_, id_), None)
+        if item is None:
+            return
+        for key in item[0]:
+            entry = (key, type_, id_)
+            i = bisect_left(self._keys, entry)
+            if i < len(self._keys) and self._keys[i] == entry:
+                del self._keys[i]
+    
+    def add(self, type_, id_, entry_keys, summary):
+        """Kaydı ekler veya günceller"""
+        with self._lock:
+            self._remove(type_, id_)
+            self._items[(type_, id_)] = (entry_keys, summary)
+            for key in entry_keys:
+                insort(self._keys, (key, type_, id_))
+    
+    def remove(self, type_, id_):
+        """Kaydı indeksten çıkarır"""
+        with self._lock:
+            self._remove(type_, id_)
+    
+    def lookup(self, prefix, limit=10, types=None):
+        """
+        Önekle başlayan kayıtları döndürür
+        
+        Args:
+            prefix: Normalize önek
+            limit: En fazla sonuç sayısı
+            types: İzin verilen tipler (None ise tümü)
+        
+        Returns:
+            list: type, id, label ve subtitle içeren sözlükler
+        """
+        results = []
+        seen = set()
+        with self._lock:
+            keys = self._keys
+            i = bisect_left(keys, (prefix,))
+            while i < len(keys) and len(results) < limit:
+                key, type_, id_ = keys[i]
+                if not key.startswith(prefix):
+                    break
+                if (type_, id_) not in seen and (types is None or type_ in types):
+                    seen.add((type_, id_))
+                    results.append({'type': type_, 'id': id_, **self._items[(type_, id_)][1]})
+                i += 1
+        return results
+
+
+def client_entry(id_, name, surname, tc_no):
+    """Müvekkil için indeks kaydını üretir"""
+    full_name = f'{name} {surname}'
+    keys = {normalize_text(full_name), normalize_text(f'{surname} {name}'), normalize_digits(tc_no)}
+    return 'clients', id_, tuple(sorted(keys - {None})), {'label': full_name, 'subtitle': tc_no}
+
+
+def case_entry(id_, case_number, subject):
+    """Dava için indeks kaydını üretir"""
+    keys = {normalize_text(case_number)}
+    summary = {'label': case_number, 'subtitle': (subject or '')[:SUBJECT_LENGTH]}
+    return 'cases', id_, tuple(sorted(keys - {None})), summary
+
+
+def _load_entries():
+    """Veritabanındaki müvekkil ve davaları indeks kayıtlarına çevirir"""
+    clients = Client.query.with_entities(
+        Client.id, Client.name, Client.surname, Client.tc_no
+    ).yield_per(LOAD_BATCH_SIZE)
+    cases = Case.query.with_entities(
+        Case.id, Case.case_number, Case.subject
+    ).yield_per(LOAD_BATCH_SIZE)
+    
+    return chain(
+        (client_entry(*row) for row in clients),
+        (case_entry(*row) for row in cases)
+    )
+
+
+def init_suggest_index(app):
+    """
+    Otomatik tamamlama indeksini oluşturur
+    
+    Uygulama başlarken çağrılır; indeks app.extensions['suggest_index']
+    altında tutulur.
+    
+    Args:
+        app: Flask uygulaması
+    """
+    index = SuggestIndex()
+    with app.app_context():
+        index.load(_load_entries())
+    app.extensions['suggest_index'] = index
+
+
+def get_suggest_index():
+    """Geçerli uygulamanın indeksini döndürür (yoksa None)"""
+    if not has_app_context():
+        return None
+    return current_app.extensions.get('suggest_index')
+
+
+def _entry_for(obj):
+    """ORM nesnesi için indeks kaydını üretir"""
+    if isinstance(obj, Client):
+        return client_entry(obj.id, obj.name, obj.surname, obj.tc_no)
+    return case_entry(obj.id, obj.case_number, obj.subject)
+
+
+# İndeksi etkileyen kolonlar
+_INDEXED_ATTRIBUTES = {
+    Client: ('name', 'surname', 'tc_no'),
+    Case: ('case_number', 'subject')
+}
+
+
+def _is_indexed_change(obj):
+    """Güncellenen nesnede indeksi etkileyen bir değişiklik olup olmadığını döndürür"""
+    state = inspect(obj)
+    return any(state.attrs[a].history.has_changes() for a in _INDEXED_ATTRIBUTES[type(obj)])
+
+
+@event.listens_for(Session, 'after_flush')
+def _collect_changes(session, flush_context):
+    """Flush edilen müvekkil ve dava değişikliklerini commit'e kadar biriktirir"""
+    changes = []
+    for obj in session.new:
+        if type(obj) in _INDEXED_ATTRIBUTES:
+            changes.append(('add', _entry_for(obj)))
+    for obj in session.dirty:
+        if type(obj) in _INDEXED_ATTRIBUTES and _is_indexed_change(obj):
+            changes.append(('add', _entry_for(obj)))
+    for obj in session.deleted:
+        if type(obj) in _INDEXED_ATTRIBUTES:
+            changes.append(('remove', ('clients' if isinstance(obj, Client) else 'cases', obj.id)))
+    
+    if changes:
+        session.info.setdefault('suggest_changes', []).extend(changes)
+
+
+@event.listens_for(Session, 'after_commit')
+def _apply_changes(session):
+    """Commit edilen değişiklikleri indekse uygular"""
+    changes = session.info.pop('suggest_changes', None)
+    index = get_suggest_index()
+    if not changes or index is None:
+        return
+    
+    for action, entry in changes:
+        if action == 'add':
+            index.add(*entry)
+        else:
+            index.remove(*entry)
+
+
+@event.listens_for(Session, 'after_rollback')
+def _discard_changes(session):
+    """Geri alınan işlemin değişikliklerini atar"""
+    session.info.pop('suggest_changes', None)
@@ -5,5 +5,7 @@ Yardımcı fonksiyonlar ve decorator'lar.
 """
 
 from app.utils.decorators import role_required
+from app.utils.pagination import paginate_query, get_sort_column
+from app.utils.fields import get_fields, apply_fields
 
-__all__ = ['role_required']
+__all__ = ['role_required', 'paginate_query', 'get_sort_column', 'get_fields', 'apply_fields']
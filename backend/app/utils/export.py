@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""
+Avukat Yönetim Sistemi - Dışa Aktarma
+Liste sorgularının CSV veya NDJSON olarak akış halinde dışa aktarılması.
+
+Kayıtlar veritabanından yield_per ile parça parça okunur ve yanıt bir
+generator üzerinden yazılır; böylece bellek kullanımı kayıt sayısından
+bağımsız kalır.
+"""
+
+import csv
+import io
+from datetime import datetime
+from flask import Response, request, stream_with_context, jsonify, make_response, abort
+from app.utils.projection import dumps
+
+# Veritabanından tek seferde okunacak satır sayısı
+EXPORT_BATCH_SIZE = 1000
+
+EXPORT_FORMATS = {
+    'csv': 'text/csv',
+    'ndjson': 'application/x-ndjson'
+}
+
+
+def _csv_value(value):
+    """Değeri CSV hücresine uygun hale getirir"""
+    if value is None:
+        return ''
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    return value
+
+
+def _csv_chunks(rows, columns):
+    """Satırları CSV parçaları olarak üretir"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    
+    # Excel'in Türkçe karakterleri doğru açması için BOM eklenir
+    buffer.write('\ufeff')
+    writer.writerow(columns)
+    
+    for index, row in enumerate(rows, 1):
+        writer.writerow([_csv_value(value) for value in row])
+        if index % EXPORT_BATCH_SIZE == 0:
+            yield buffer.getvalue().encode('utf-8')
+            buffer.seek(0)
+            buffer.truncate()
+    
+    yield buffer.getvalue().encode('utf-8')
+
+
+def _ndjson_chunks(rows, columns):
+    """Satırları satır başına bir JSON nesnesi olacak şekilde üretir"""
+    lines = []
+    for row in rows:
+        lines.append(dumps(dict(zip(columns, row))))
+        if len(lines) == EXPORT_BATCH_SIZE:
+            yield b'\n'.join(lines) + b'\n'
+            lines = []
+    
+    if lines:
+        yield b'\n'.join(lines) + b'\n'
+
+
+def export_query(query, model, name, sort_column, order='desc'):
+    """
+    Filtrelenmiş sorguyu akış halinde dışa aktarır
+    
+    Query Parameters:
+        format: Dosya biçimi (csv, ndjson; varsayılan: csv)
+        fields: Dışa aktarılacak kolonlar (ör. id,name,status)
+    
+    Args:
+        query: Liste endpoint'i ile aynı filtreler uygulanmış sorgu
+        model: Model sınıfı
+        name: Dosya adı öneki (ör. 'clients')
+        sort_column: Sıralama kolonu
+        order: Sıralama yönü (asc/desc)
+    
+    Returns:
+        Response: Akış halinde dosya yanıtı
+    """
+    export_format = request.args.get('format', 'csv')
+    if export_format not in EXPORT_FORMATS:
+        abort(make_response(jsonify({'message': 'Geçersiz dışa aktarma biçimi'}), 400))
+    
+    # Yalnızca tablo kolonları dışa aktarılır
+    fields = model.parse_fields(request.args.get('fields', ''))
+    columns = [
+        column for column in model.serializable_columns()
+        if fields is None or column in fields
+    ]
+    
+    query = query.with_entities(*[getattr(model, column) for column in columns])
+    if order == 'desc':
+        query = query.order_by(sort_column.desc(), model.id.desc())
+    else:
+        query = query.order_by(sort_column.asc(), model.id.asc())
+    
+    rows = query.yield_per(EXPORT_BATCH_SIZE)
+    if export_format == 'csv':
+        chunks = _csv_chunks(rows, columns)
+    else:
+        chunks = _ndjson_chunks(rows, columns)
+    
+    filename = f"{name}_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.{export_format}"
+    return Response(
+        stream_with_context(chunks),
+        mimetype=EXPORT_FORMATS[export_format],
+        headers={'Content-Disposition': f'attachment; filename={filename}'}
+    )
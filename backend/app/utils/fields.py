@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""
+Avukat Yönetim Sistemi - Seçili Alanlar
+fields parametresi ile istenen kolonların sorguya uygulanması.
+"""
+
+from flask import request
+from sqlalchemy.orm import load_only
+
+
+def get_fields(model):
+    """
+    İstekteki fields parametresini okur
+    
+    Args:
+        model: Model sınıfı
+    
+    Returns:
+        set: İstenen alanlar veya tüm alanlar için None
+    """
+    return model.parse_fields(request.args.get('fields', ''))
+
+
+def apply_fields(query, model, fields, *columns):
+    """
+    Sorgunun yalnızca istenen alanlar için gereken kolonları okumasını sağlar
+    
+    Diğer kolonlar (notlar, açıklamalar gibi büyük metinler dahil)
+    SELECT'e eklenmez.
+    
+    Args:
+        query: Sorgu
+        model: Model sınıfı
+        fields: get_fields ile okunan alanlar
+        columns: Ayrıca yüklenmesi gereken kolonlar (ör. sıralama kolonu)
+    """
+    if fields is None:
+        return query
+    
+    names = model.field_columns(fields) | {c.key for c in columns}
+    return query.options(load_only(*[getattr(model, name) for name in sorted(names)]))
@@ -0,0 +1,282 @@
+# -*- coding: utf-8 -*-
+"""
+Avukat Yönetim Sistemi - Sayfalama
+Liste endpoint'leri için sayfa numaralı ve imleçli (keyset) sayfalama.
+"""
+
+import base64
+import json
+import math
+import threading
+import time
+from datetime import date, datetime
+from decimal import Decimal
+from flask import request, current_app, jsonify, make_response, abort
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from app import db
+
+# Filtre bazlı toplam sayı önbelleği: anahtar -> (sayı, geçerlilik zamanı)
+_count_cache = {}
+_count_cache_lock = threading.Lock()
+_COUNT_CACHE_MAX_ENTRIES = 1024
+
+
+def get_sort_column(model, sort, default):
+    """
+    Sıralama alanını model kolonuna çevirir
+    
+    Args:
+        model: Model sınıfı
+        sort: İstenen sıralama alanı adı
+        default: Geçersiz alan için varsayılan kolon
+    
+    Returns:
+        Sıralama kolonu
+    """
+    if sort in model.__table__.columns:
+        return getattr(model, sort)
+    return default
+
+
+def is_cursor_request():
+    """İsteğin imleçli sayfalama kullanıp kullanmadığını döndürür"""
+    return 'cursor' in request.args
+
+
+def _encode_value(value):
+    """İmleç değerini JSON'a uygun hale getirir"""
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+def _decode_value(value, column):
+    """İmleç değerini kolon tipine geri çevirir"""
+    if value is None:
+        return None
+    python_type = column.type.python_type
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is date:
+        return date.fromisoformat(value)
+    if python_type is Decimal:
+        return Decimal(value)
+    return value
+
+
+def encode_cursor(item, sort_column):
+    """Sayfanın son kaydından opak imleç üretir"""
+    payload = [_encode_value(getattr(item, sort_column.key)), item.id]
+    raw = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor, sort_column):
+    """
+    İmleci (sıralama değeri, id) çiftine çözer
+    
+    Raises:
+        ValueError: İmleç geçersizse
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        value, last_id = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        return _decode_value(value, sort_column), int(last_id)
+    except (TypeError, ValueError, UnicodeError):
+        raise ValueError('Geçersiz imleç')
+
+
+def _table_statistics_count(query):
+    """
+    Filtresiz sorgular için SQLite istatistiklerinden satır sayısını okur
+    
+    sqlite_stat1 tablosu ANALYZE çalıştırıldığında oluşur; her satırın
+    ilk sayısı tablodaki yaklaşık kayıt sayısıdır.
+    
+    Returns:
+        int: Tahmini kayıt sayısı veya istatistik yoksa None
+    """
+    if query.whereclause is not None:
+        return None
+    
+    entity = query.column_descriptions[0]['entity']
+    try:
+        stat = db.session.execute(
+            text('SELECT stat FROM sqlite_stat1 WHERE tbl = :tbl LIMIT 1'),
+            {'tbl': entity.__table__.name}
+        ).scalar()
+    except OperationalError:
+        return None
+    
+    if not stat:
+        return None
+    return int(stat.split()[0])
+
+
+def estimate_count(query):
+    """
+    Sorgunun toplam kayıt sayısını tahmin eder
+    
+    Önce SQLite istatistiklerine bakılır; bulunamazsa aynı filtre için
+    önbellekteki sayı kullanılır, o da yoksa sayılıp önbelleğe alınır.
+    
+    Args:
+        query: Filtrelenmiş sorgu
+    
+    Returns:
+        int: Tahmini kayıt sayısı
+    """
+    count_query = query.order_by(None)
+    
+    count = _table_statistics_count(count_query)
+    if count is not None:
+        return count
+    
+    compiled = count_query.statement.compile(db.session.get_bind())
+    key = (str(compiled), tuple(sorted((k, repr(v)) for k, v in compiled.params.items())))
+    now = time.monotonic()
+    
+    with _count_cache_lock:
+        cached = _count_cache.get(key)
+    if cached and cached[1] > now:
+        return cached[0]
+    
+    count = count_query.count()
+    
+    with _count_cache_lock:
+        if len(_count_cache) >= _COUNT_CACHE_MAX_ENTRIES:
+            _count_cache.clear()
+        _count_cache[key] = (count, now + current_app.config['COUNT_CACHE_TTL'])
+    
+    return count
+
+
+def _offset_page(query, page, per_page, count_mode):
+    """
+    Sayfa numaralı sayfalama yapar
+    
+    count_mode 'exact' ise COUNT sorgusu çalıştırılır; 'estimate' ise
+    tahmini toplam, 'none' ise hiç toplam döndürülmez.
+    """
+    if count_mode not in ('estimate', 'none'):
+        pagination = query.paginate(page=page, per_page=per_page, error_out=False)
+        return pagination.items, {
+            'total': pagination.total,
+            'pages': pagination.pages,
+            'current_page': page
+        }
+    
+    page = max(page, 1)
+    per_page = max(per_page, 1)
+    offset = (page - 1) * per_page
+    
+    # Sonraki sayfanın varlığını anlamak için bir kayıt fazla çek
+    items = query.limit(per_page + 1).offset(offset).all()
+    has_more = len(items) > per_page
+    items = items[:per_page]
+    
+    meta = {
+        'current_page': page,
+        'has_more': has_more
+    }
+    
+    if count_mode == 'none':
+        meta.update({'total': None, 'pages': None})
+        return items, meta
+    
+    # Tahmin, görülen kayıt sayısından küçük olamaz
+    total = max(estimate_count(query), offset + len(items) + (1 if has_more else 0))
+    meta.update({
+        'total': total,
+        'pages': math.ceil(total / per_page),
+        'total_estimated': True
+    })
+    return items, meta
+
+
+def _seek_filter(sort_column, id_column, value, last_id, descending):
+    """
+    Son kayıttan sonra gelen satırları seçen koşulu üretir
+    
+    SQLite'ta NULL değerler artan sıralamada başta, azalan sıralamada
+    sonda yer alır; koşul bu sıralamaya göre kurulur.
+    """
+    if descending:
+        if value is None:
+            return db.and_(sort_column.is_(None), id_column < last_id)
+        return db.or_(
+            sort_column < value,
+            db.and_(sort_column == value, id_column < last_id),
+            sort_column.is_(None)
+        )
+    
+    if value is None:
+        return db.or_(
+            db.and_(sort_column.is_(None), id_column > last_id),
+            sort_column.isnot(None)
+        )
+    return db.or_(
+        sort_column > value,
+        db.and_(sort_column == value, id_column > last_id)
+    )
+
+
+def paginate_query(query, sort_column, id_column, order='desc'):
+    """
+    Sorguyu sıralar ve isteğe göre sayfalar
+    
+    Varsayılan olarak sayfa numaralı sayfalama yapılır. İstekte cursor
+    parametresi varsa OFFSET ve COUNT yerine (sıralama kolonu, id)
+    üzerinden arama yapan imleçli sayfalama kullanılır.
+    
+    Query Parameters:
+        page: Sayfa numarası
+        per_page: Sayfa başına kayıt
+        cursor: İmleç (ilk sayfa için boş bırakılır)
+        count: Toplam sayı modu (exact, estimate, none; varsayılan: exact)
+    
+    Args:
+        query: Filtrelenmiş sorgu
+        sort_column: Sıralama kolonu
+        id_column: Eşitlik durumunda kullanılacak kimlik kolonu
+        order: Sıralama yönü (asc/desc)
+    
+    Returns:
+        tuple: (kayıtlar, yanıt meta verisi)
+    """
+    descending = order == 'desc'
+    if descending:
+        query = query.order_by(sort_column.desc(), id_column.desc())
+    else:
+        query = query.order_by(sort_column.asc(), id_column.asc())
+    
+    per_page = request.args.get('per_page', current_app.config['ITEMS_PER_PAGE'], type=int)
+    
+    if not is_cursor_request():
+        page = request.args.get('page', 1, type=int)
+        count_mode = request.args.get('count', 'exact')
+        return _offset_page(query, page, per_page, count_mode)
+    
+    per_page = max(1, min(per_page, current_app.config['MAX_ITEMS_PER_PAGE']))
+    
+    cursor = request.args.get('cursor', '')
+    if cursor:
+        try:
+            value, last_id = decode_cursor(cursor, sort_column)
+        except ValueError:
+            abort(make_response(jsonify({'message': 'Geçersiz sayfa imleci'}), 400))
+        query = query.filter(_seek_filter(sort_column, id_column, value, last_id, descending))
+    
+    # Sonraki sayfanın varlığını anlamak için bir kayıt fazla çek
+    items = query.limit(per_page + 1).all()
+    has_more = len(items) > per_page
+    items = items[:per_page]
+    
+    return items, {
+        'next_cursor': encode_cursor(items[-1], sort_column) if has_more else None,
+        'has_more': has_more,
+        'per_page': per_page
+    }
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""
+Avukat Yönetim Sistemi - Dönemler
+Trend ve rapor serileri için gün, hafta, ay ve çeyrek dönemlerinin
+anahtarları ve sınırları.
+
+Sorgular tarih (veya ay) bazında gruplanır; satırlar dönemlere Python
+tarafında bu fonksiyonlarla katlanır ve boş dönemler sıfırla doldurulur.
+"""
+
+from datetime import date, timedelta
+
+# Desteklenen dönem uzunlukları
+GRANULARITIES = ('day', 'week', 'month', 'quarter')
+
+
+def add_months(value, months):
+    """Ayın ilk gününe verilen sayıda ay ekler (negatif olabilir)"""
+    index = value.year * 12 + value.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def period_start(value, granularity):
+    """Tarihin içinde bulunduğu dönemin ilk gününü döndürür"""
+    if granularity == 'day':
+        return value
+    if granularity == 'week':
+        return value - timedelta(days=value.weekday())
+    if granularity == 'month':
+        return value.replace(day=1)
+    return date(value.year, (value.month - 1) // 3 * 3 + 1, 1)
+
+
+def next_period_start(start, granularity):
+    """Dönem başlangıcından sonraki dönemin ilk gününü döndürür"""
+    if granularity == 'day':
+        return start + timedelta(days=1)
+    if granularity == 'week':
+        return start + timedelta(days=7)
+    return add_months(start, 1 if granularity == 'month' else 3)
+
+
+def period_key(value, granularity):
+    """
+    Tarihin dönem anahtarını döndürür
+    
+    Örnekler: 2024-03-15 (gün), 2024-W11 (ISO hafta), 2024-03 (ay), 2024-Q1 (çeyrek)
+    """
+    if granularity == 'day':
+        return value.isoformat()
+    if granularity == 'week':
+        year, week, _ = value.isocalendar()
+        return f'{year}-W{week:02d}'
+    if granularity == 'month':
+        return value.strftime('%Y-%m')
+    return f'{value.year}-Q{(value.month - 1) // 3 + 1}'
+
+
+def month_from_key(month):
+    """Ay anahtarını (YYYY-MM) ayın ilk gününe çevirir"""
+    return date(int(month[:4]), int(month[5:7]), 1)
+
+
+def periods_between(start, end, granularity):
+    """
+    Tarih aralığını kapsayan dönemleri sırayla döndürür
+    
+    Args:
+        start: Başlangıç tarihi (dahil)
+        end: Bitiş tarihi (dahil)
+        granularity: Dönem uzunluğu
+    
+    Returns:
+        list: (anahtar, dönem başı, dönem sonu) demetleri; ilk ve son dönem
+            aralığın dışına taşmayacak şekilde kırpılır
+    """
+    periods = []
+    current = period_start(start, granularity)
+    while current <= end:
+        following = next_period_start(current, granularity)
+        periods.append((
+            period_key(current, granularity),
+            max(current, start),
+            min(following - timedelta(days=1), end)
+        ))
+        current = following
+    return periods
@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+"""
+Avukat Yönetim Sistemi - Kolon Projeksiyonu
+Salt okunur liste istekleri için ORM nesnesi oluşturmadan serileştirme.
+
+Sorgular yalnızca gereken kolonları seçer ve satırlar, modelin özellik ve
+to_dict metotlarını taşıyan sade Python nesnelerine (satır görünümü)
+aktarılır. Böylece identity map ve attribute instrumentation maliyeti
+olmadan mevcut to_dict çıktısı birebir üretilir.
+"""
+
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from flask import current_app
+from sqlalchemy.orm import QueryableAttribute
+from sqlalchemy.orm.interfaces import MANYTOONE
+from app import db
+from app.models.serializer import SerializerMixin
+
+try:
+    import orjson
+except ImportError:  # isteğe bağlı bağımlılık
+    orjson = None
+
+# IN sorgularında tek seferde gönderilecek en fazla kimlik
+_IN_CHUNK_SIZE = 500
+
+# Model -> satır görünümü sınıfı
+_view_classes = {}
+
+# Satır görünümüne kopyalanmayacak SQLAlchemy/Flask-SQLAlchemy öznitelikleri
+_SKIPPED_ATTRIBUTES = {'__init__', '__dict__', '__weakref__', '__mapper__', 'query', 'query_class'}
+
+
+def _view_class(model):
+    """
+    Model için satır görünümü sınıfını döndürür
+    
+    Sınıf; modelin sabitlerini, özelliklerini ve metotlarını taşır fakat
+    SQLAlchemy tarafından izlenen kolon ve ilişki tanımlarını içermez.
+    """
+    view_class = _view_classes.get(model)
+    if view_class is not None:
+        return view_class
+    
+    namespace = {}
+    for klass in (SerializerMixin, model):
+        for name, value in vars(klass).items():
+            if name in _SKIPPED_ATTRIBUTES or name.startswith('_sa_'):
+                continue
+            if isinstance(value, QueryableAttribute):
+                continue
+            namespace[name] = value
+    
+    view_class = type(f'{model.__name__}Row', (), namespace)
+    _view_classes[model] = view_class
+    return view_class
+
+
+def _chunks(values):
+    """Kimlik listesini IN sorgusu boyutunda parçalara ayırır"""
+    values = list(values)
+    for i in range(0, len(values), _IN_CHUNK_SIZE):
+        yield values[i:i + _IN_CHUNK_SIZE]
+
+
+def project_query(query, model, fields=None, *columns):
+    """
+    Model sorgusunu yalnızca gereken kolonları seçen sorguya çevirir
+    
+    Args:
+        query: Filtrelenmiş model sorgusu
+        model: Model sınıfı
+        fields: İstenen alanlar (None ise tümü)
+        columns: Ayrıca seçilmesi gereken kolonlar (ör. sıralama kolonu)
+    
+    Returns:
+        Query: Kolon projeksiyonu yapan sorgu
+    """
+    if fields is None:
+        names = set(model.serializable_columns())
+    else:
+        names = model.field_columns(fields)
+    names |= {c.key for c in columns}
+    return query.with_entities(*[getattr(model, name) for name in sorted(names)])
+
+
+def _select_views(model, filter_column, values, order_by=()):
+    """Verilen değerlere sahip kayıtları tüm kolonlarıyla satır görünümü olarak getirir"""
+    columns = [getattr(model, name) for name in model.serializable_columns()]
+    rows = []
+    for chunk in _chunks(values):
+        query = db.session.query(*columns).filter(filter_column.in_(chunk))
+        if order_by:
+            query = query.order_by(*order_by)
+        rows.extend(query.all())
+    return to_views(model, rows)
+
+
+def _attach_relation(model, views, name):
+    """
+    Satır görünümlerine ilişkiyi toplu yükler
+    
+    Çoktan-bire ilişkilerde hedef kayıtlar, birden-çoğa ilişkilerde alt
+    kayıtlar tek bir IN sorgusuyla getirilip görünümlere eklenir.
+    """
+    relationship = model.__mapper__.relationships[name]
+    local, remote = relationship.local_remote_pairs[0]
+    target = relationship.mapper.class_
+    
+    if relationship.direction is MANYTOONE:
+        keys = {getattr(view, local.key) for view in views} - {None}
+        targets = {
+            getattr(item, remote.key): item
+            for item in _select_views(target, getattr(target, remote.key), keys)
+        }
+        for view in views:
+            setattr(view, name, targets.get(getattr(view, local.key)))
+        return
+    
+    keys = {getattr(view, local.key) for view in views}
+    groups = {}
+    for item in _select_views(target, getattr(target, remote.key), keys, relationship.order_by or ()):
+        groups.setdefault(getattr(item, remote.key), []).append(item)
+    for view in views:
+        setattr(view, name, groups.get(getattr(view, local.key), []))
+
+
+def to_views(model, rows, relations=()):
+    """
+    Projeksiyon satırlarını satır görünümlerine çevirir
+    
+    Args:
+        model: Model sınıfı
+        rows: project_query sonucundaki satırlar
+        relations: Toplu yüklenecek ilişki adları (ör. 'client', 'installment_list')
+    
+    Returns:
+        list: to_dict çağrılabilen satır görünümleri
+    """
+    view_class = _view_class(model)
+    views = []
+    for row in rows:
+        view = view_class.__new__(view_class)
+        view.__dict__.update(row._asdict())
+        views.append(view)
+    
+    if views:
+        for name in relations:
+            _attach_relation(model, views, name)
+    
+    return views
+
+
+def _json_default(value):
+    """Standart JSON kodlayıcısının tanımadığı tipleri çevirir"""
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f'{type(value).__name__} JSON olarak kodlanamaz')
+
+
+def dumps(payload):
+    """Veriyi JSON baytlarına çevirir (orjson kuruluysa onu kullanır)"""
+    if orjson is not None:
+        return orjson.dumps(payload, default=_json_default)
+    return json.dumps(payload, default=_json_default, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def json_response(payload):
+    """
+    Hızlı JSON yanıtı oluşturur
+    
+    jsonify'dan farklı olarak anahtarları sıralamaz ve orjson kuruluysa
+    kodlama için onu kullanır.
+    """
+    return current_app.response_class(dumps(payload), mimetype='application/json')
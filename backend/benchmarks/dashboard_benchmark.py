@@ -0,0 +1,246 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Avukat Yönetim Sistemi - Dashboard Karşılaştırması
+GET /api/dashboard/stats endpoint'inin sorgu sayısını ve süresini, metrik
+başına ayrı sorgu çalıştıran önceki uygulamayla karşılaştırır.
+
+Veritabanı toplu INSERT ile doldurulur, sayaç kolonları ve aylık finans
+özeti rebuild_* fonksiyonlarıyla oluşturulur. İki yolun aynı sonucu
+ürettiği doğrulanır; endpoint MAX_QUERIES sınırından fazla sorgu
+çalıştırırsa hata koduyla çıkar. Güncel uygulama boş önbellekle ölçülür;
+önbellekten verilen yanıt ve ETag ile dönen 304 süreleri ayrıca yazdırılır.
+
+Kullanım (backend klasöründen):
+    python benchmarks/dashboard_benchmark.py [işlem_sayısı]
+"""
+
+import os
+import sys
+import time
+import random
+from decimal import Decimal
+from datetime import date, datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import Blueprint, jsonify
+from sqlalchemy import event, func, insert
+from flask_jwt_extended import create_access_token
+from app import create_app, db
+from app.models import (User, Client, Case, Transaction, Lead, CalendarEvent,
+                        rebuild_client_counters, rebuild_transaction_totals, rebuild_finance_rollup)
+from app.services.dashboard_service import invalidate_dashboard_cache
+from app.utils.periods import add_months
+
+TRANSACTION_COUNT = 100000
+REPEAT = 5
+BATCH_SIZE = 5000
+
+# Endpoint'in çalıştırabileceği en fazla sorgu sayısı
+MAX_QUERIES = 6
+
+
+def _insert(model, rows):
+    """Kayıtları ORM olaylarını tetiklemeden toplu ekler"""
+    for start in range(0, len(rows), BATCH_SIZE):
+        db.session.execute(insert(model.__table__), rows[start:start + BATCH_SIZE])
+
+
+def seed(transaction_count):
+    """İşlem sayısıyla orantılı müvekkil, dava, aday ve etkinlik kayıtları oluşturur"""
+    random.seed(0)
+    admin_id = User.query.first().id
+    now = datetime.utcnow()
+    today = now.date()
+    
+    client_count = max(transaction_count // 50, 1)
+    _insert(Client, [
+        {'name': f'Ad{i}', 'surname': f'Soyad{i}', 'tc_no': str(10000000000 + i),
+         'status': random.choice(['active', 'passive', 'potential']), 'created_by': admin_id,
+         'created_at': now - timedelta(days=random.randint(0, 1000))}
+        for i in range(client_count)
+    ])
+    
+    case_count = max(transaction_count // 10, 1)
+    _insert(Case, [
+        {'case_number': f'2024/{i:06d}', 'client_id': random.randint(1, client_count), 'lawyer_id': admin_id,
+         'case_type': random.choice(list(Case.CASE_TYPES)), 'subject': f'Konu {i}',
+         'status': random.choice(list(Case.STATUSES))}
+        for i in range(case_count)
+    ])
+    
+    _insert(Transaction, [
+        {'transaction_type': random.choice(['income', 'expense']), 'category': 'case_fee',
+         'amount': Decimal(random.randint(100, 1000000)) / 100, 'currency': 'TRY',
+         'client_id': random.randint(1, client_count), 'case_id': random.randint(1, case_count),
+         'status': random.choice(['paid', 'paid', 'pending', 'cancelled']),
+         'date': today - timedelta(days=random.randint(-30, 3 * 365))}
+        for _ in range(transaction_count)
+    ])
+    
+    _insert(Lead, [
+        {'name': f'Aday {i}', 'status': random.choice(list(Lead.STATUSES)), 'created_by': admin_id,
+         'follow_up_date': today + timedelta(days=random.randint(-60, 60))}
+        for i in range(max(transaction_count // 50, 1))
+    ])
+    
+    _insert(CalendarEvent, [
+        {'title': f'Etkinlik {i}', 'event_type': random.choice(['hearing', 'meeting']), 'created_by': admin_id,
+         'status': 'scheduled', 'start_datetime': now + timedelta(hours=random.randint(-2000, 2000))}
+        for i in range(max(transaction_count // 100, 1))
+    ])
+    
+    connection = db.session.connection()
+    rebuild_client_counters(connection)
+    rebuild_transaction_totals(connection)
+    rebuild_finance_rollup(connection)
+    db.session.commit()
+
+
+def legacy_stats():
+    """Önceki uygulama: her metrik için ayrı COUNT/SUM sorgusu ve aylık döngü"""
+    now = datetime.utcnow()
+    today = now.date()
+    month_start = today.replace(day=1)
+    
+    def total(*conditions):
+        return db.session.query(func.sum(Transaction.amount)).filter(*conditions).scalar() or 0
+    
+    income, expense = Transaction.transaction_type == 'income', Transaction.transaction_type == 'expense'
+    paid = Transaction.status == 'paid'
+    
+    total_income = total(income, paid)
+    total_expense = total(expense, paid)
+    
+    monthly_trend = []
+    for i in range(5, -1, -1):
+        month_start_date = add_months(month_start, -i)
+        month_end_date = (month_start_date.replace(day=28) + timedelta(days=4)).replace(day=1) - timedelta(days=1)
+        monthly_trend.append({
+            'month': month_start_date.strftime('%Y-%m'),
+            'income': float(total(income, paid, Transaction.date >= month_start_date,
+                                  Transaction.date <= month_end_date))
+        })
+    
+    cases_by_type = db.session.query(Case.case_type, func.count(Case.id)).group_by(Case.case_type).all()
+    upcoming = CalendarEvent.query.filter(CalendarEvent.start_datetime >= now, CalendarEvent.status == 'scheduled')
+    
+    return jsonify({
+        'clients': {
+            'total': Client.query.count(),
+            'active': Client.query.filter_by(status='active').count(),
+            'new_this_month': Client.query.filter(Client.created_at >= month_start).count()
+        },
+        'cases': {
+            'total': Case.query.count(),
+            'active': Case.query.filter(Case.status.in_(['open', 'pending', 'in_progress'])).count(),
+            'won': Case.query.filter_by(status='won').count(),
+            'lost': Case.query.filter_by(status='lost').count(),
+            'by_type': [
+                {'type': t, 'count': c, 'type_display': Case.CASE_TYPES.get(t, t)}
+                for t, c in cases_by_type
+            ]
+        },
+        'finance': {
+            'total_income': float(total_income),
+            'total_expense': float(total_expense),
+            'net_profit': float(total_income - total_expense),
+            'monthly_income': float(total(income, paid, Transaction.date >= month_start)),
+            'monthly_expense': float(total(expense, paid, Transaction.date >= month_start)),
+            'pending_payments': float(total(income, Transaction.status == 'pending')),
+            'monthly_trend': monthly_trend
+        },
+        'leads': {
+            'total': Lead.query.count(),
+            'new': Lead.query.filter_by(status='new').count(),
+            'converted': Lead.query.filter_by(status='converted').count(),
+            'needs_follow_up': Lead.query.filter(
+                Lead.follow_up_date <= today,
+                Lead.status.notin_(['converted', 'lost'])
+            ).count()
+        },
+        'upcoming_events': [e.to_dict() for e in upcoming.filter(
+            CalendarEvent.start_datetime <= now + timedelta(days=7)
+        ).order_by(CalendarEvent.start_datetime.asc()).limit(5).all()],
+        'upcoming_hearings': [h.to_dict() for h in upcoming.filter(
+            CalendarEvent.event_type == 'hearing'
+        ).order_by(CalendarEvent.start_datetime.asc()).limit(5).all()]
+    })
+
+
+def measure(client, url, headers, cold=True):
+    """
+    İsteği birkaç kez çalıştırır; en iyi süreyi, sorgu sayısını ve yanıtı döndürür
+    
+    cold True ise her istekten önce dashboard önbelleği boşaltılır.
+    """
+    statements = []
+    
+    def _count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+    
+    best = None
+    response = None
+    event.listen(db.engine, 'before_cursor_execute', _count)
+    try:
+        for _ in range(REPEAT):
+            db.session.remove()
+            if cold:
+                invalidate_dashboard_cache()
+            del statements[:]
+            started = time.perf_counter()
+            response = client.get(url, headers=headers)
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', _count)
+    return best, len(statements), response
+
+
+def main():
+    transaction_count = int(sys.argv[1]) if len(sys.argv) > 1 else TRANSACTION_COUNT
+    
+    app = create_app('testing')
+    legacy_bp = Blueprint('legacy_dashboard', __name__)
+    legacy_bp.add_url_rule('/stats', view_func=legacy_stats)
+    app.register_blueprint(legacy_bp, url_prefix='/benchmark/dashboard')
+    
+    with app.app_context():
+        started = time.perf_counter()
+        seed(transaction_count)
+        print(f'Veri hazırlama      : {time.perf_counter() - started:.1f} s')
+        
+        client = app.test_client()
+        headers = {'Authorization': 'Bearer ' + create_access_token(identity=User.query.first().id)}
+        
+        legacy_time, legacy_queries, legacy_response = measure(client, '/benchmark/dashboard/stats', headers)
+        current_time, current_queries, current_response = measure(client, '/api/dashboard/stats', headers)
+        cached_time, _, _ = measure(client, '/api/dashboard/stats', headers, cold=False)
+        
+        headers['If-None-Match'] = current_response.headers['ETag']
+        not_modified_time, _, not_modified_response = measure(client, '/api/dashboard/stats', headers, cold=False)
+        
+        if legacy_response.get_json() != current_response.get_json():
+            print('HATA: İki uygulamanın çıktısı farklı')
+            return 1
+        
+        print(f'İşlem sayısı        : {transaction_count}')
+        print(f'Önceki uygulama     : {legacy_time * 1000:.1f} ms, {legacy_queries} sorgu')
+        print(f'Güncel uygulama     : {current_time * 1000:.1f} ms, {current_queries} sorgu')
+        print(f'Hızlanma            : {legacy_time / current_time:.2f}x')
+        print(f'Önbellekten         : {cached_time * 1000:.1f} ms')
+        print(f'ETag (304)          : {not_modified_time * 1000:.1f} ms')
+        
+        if not_modified_response.status_code != 304:
+            print(f'HATA: If-None-Match isteği {not_modified_response.status_code} döndürdü')
+            return 1
+        
+        if current_queries > MAX_QUERIES:
+            print(f'HATA: Endpoint {current_queries} sorgu çalıştırdı (en fazla {MAX_QUERIES})')
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,180 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Avukat Yönetim Sistemi - Sorgu Planı Kontrolü
+Liste, dashboard ve rapor endpoint'lerinin çalıştırdığı her sorgu için
+EXPLAIN QUERY PLAN çıktısını inceler; indeks kullanmadan tüm tabloyu
+tarayan (SCAN <tablo>) bir sorgu bulunursa hata koduyla çıkar.
+
+Kullanım (backend klasöründen):
+    python benchmarks/query_plan_check.py [-v]
+"""
+
+import os
+import re
+import sys
+import random
+from datetime import date, datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import event
+from flask_jwt_extended import create_access_token
+from app import create_app, db
+from app.models import User, Client, Case, Transaction, Installment, Lead, Document, CalendarEvent, Template
+
+# Kontrol edilen endpoint'ler (filtre ve sıralama kombinasyonlarıyla)
+URLS = [
+    '/api/clients',
+    '/api/clients?status=active',
+    '/api/clients?search=ahmet',
+    '/api/clients?cursor=',
+    '/api/clients?sort=total_debt&cursor=',
+    '/api/clients?has_debt=true',
+    '/api/clients/1/cases',
+    '/api/clients/1/transactions',
+    '/api/cases',
+    '/api/cases?status=open',
+    '/api/cases?case_type=civil',
+    '/api/cases?client_id=1',
+    '/api/cases?lawyer_id=1',
+    '/api/cases?search=2024',
+    '/api/transactions',
+    '/api/transactions?type=income&status=paid',
+    '/api/transactions?status=pending',
+    '/api/transactions?has_balance=true',
+    '/api/transactions?start_date=2024-03-01&end_date=2024-06-30',
+    '/api/transactions?client_id=1',
+    '/api/transactions?case_id=1',
+    '/api/transactions/report?start_date=2024-01-01&end_date=2024-12-31',
+    '/api/transactions/report?start_date=2024-01-15&end_date=2024-03-10',
+    '/api/transactions/report?start_date=2024-01-01&end_date=2024-06-30&granularity=month&compare=previous',
+    '/api/transactions/report?start_date=2024-03-01&end_date=2024-05-31&granularity=week&compare=last_year',
+    '/api/calendar/events',
+    '/api/calendar/events?status=scheduled',
+    '/api/calendar/events?start_date=2024-03-01&end_date=2024-03-31',
+    '/api/calendar/events?related_to=case&related_id=1',
+    '/api/calendar/upcoming',
+    '/api/leads',
+    '/api/leads?status=new',
+    '/api/leads?source=referral',
+    '/api/documents',
+    '/api/documents?related_to=case&related_id=1',
+    '/api/documents?document_type=petition',
+    '/api/templates',
+    '/api/templates?template_type=petition',
+    '/api/users',
+    '/api/users/lawyers',
+    '/api/dashboard/stats',
+    '/api/dashboard/trend?months=12&granularity=day',
+    '/api/dashboard/trend?months=60&granularity=quarter'
+]
+
+# İndeks kullanmayan tam tablo taraması: 'SCAN clients' (ör. 'SCAN clients USING INDEX ...' değil)
+FULL_SCAN = re.compile(r'^SCAN (\w+)$')
+
+# Satır sayısı büro çalışanları ve şablonlarla sınırlı kalan tablolar; taranmaları kabul edilir
+SMALL_TABLES = {'users', 'templates'}
+
+
+def seed():
+    """Her tabloya birkaç kayıt ekler (planlar veri hacminden bağımsızdır)"""
+    random.seed(0)
+    admin = User.query.first()
+    
+    for i in range(20):
+        db.session.add(Client(name=f'Ad{i}', surname=f'Soyad{i}', tc_no=str(10000000000 + i), created_by=admin.id))
+    db.session.flush()
+    clients = Client.query.all()
+    
+    for i in range(40):
+        db.session.add(Case(case_number=f'2024/{i:05d}', client_id=random.choice(clients).id, lawyer_id=admin.id,
+                            case_type='civil', subject=f'Konu {i}', status=random.choice(['open', 'won'])))
+    db.session.flush()
+    cases = Case.query.all()
+    
+    for i in range(80):
+        case = random.choice(cases)
+        transaction = Transaction(
+            transaction_type=random.choice(['income', 'expense']), category='case_fee',
+            amount=random.randint(100, 10000), client_id=case.client_id, case_id=case.id,
+            status=random.choice(['paid', 'pending']), date=date(2024, 1, 1) + timedelta(days=i)
+        )
+        db.session.add(transaction)
+        db.session.flush()
+        db.session.add(Installment(transaction_id=transaction.id, installment_number=1, amount=50,
+                                   due_date=date(2024, 6, 1), status='pending'))
+    
+    for i in range(20):
+        db.session.add(CalendarEvent(title=f'Etkinlik {i}', event_type='hearing', related_to='case',
+                                     related_id=random.choice(cases).id, created_by=admin.id,
+                                     start_datetime=datetime(2024, 3, 1) + timedelta(days=i)))
+        db.session.add(Lead(name=f'Aday {i}', status='new', created_by=admin.id,
+                            follow_up_date=date(2024, 1, 1) + timedelta(days=i)))
+        db.session.add(Document(filename=f'd{i}.pdf', original_filename=f'belge{i}.pdf', file_path=f'/tmp/d{i}.pdf',
+                                document_type='petition', related_to='case', related_id=random.choice(cases).id,
+                                uploaded_by=admin.id))
+        db.session.add(Template(name=f'Şablon {i}', template_type='petition', content='Metin', created_by=admin.id))
+    db.session.commit()
+
+
+def collect_statements(app):
+    """URL listesindeki istekleri çalıştırır, SELECT sorgularını parametreleriyle toplar"""
+    statements = []
+    
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith('SELECT'):
+            statements.append((request_url[0], statement, parameters))
+    
+    request_url = [None]
+    client = app.test_client()
+    headers = {'Authorization': 'Bearer ' + create_access_token(identity=User.query.first().id)}
+    
+    event.listen(db.engine, 'before_cursor_execute', _capture)
+    try:
+        for url in URLS:
+            request_url[0] = url
+            db.session.remove()
+            response = client.get(url, headers=headers)
+            if response.status_code != 200:
+                print(f'UYARI: {url} -> {response.status_code}')
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', _capture)
+    return statements
+
+
+def full_scans(statement, parameters):
+    """Sorgunun planındaki indekssiz tablo taramalarını döndürür"""
+    rows = db.session.connection().exec_driver_sql(f'EXPLAIN QUERY PLAN {statement}', parameters).all()
+    tables = {t.name for t in db.metadata.sorted_tables}
+    return [row.detail for row in rows if (m := FULL_SCAN.match(row.detail)) and m.group(1) in tables - SMALL_TABLES]
+
+
+def main():
+    verbose = '-v' in sys.argv[1:]
+    
+    app = create_app('testing')
+    with app.app_context():
+        seed()
+        statements = collect_statements(app)
+        
+        failures = 0
+        seen = set()
+        for url, statement, parameters in statements:
+            if statement in seen:
+                continue
+            seen.add(statement)
+            
+            scans = full_scans(statement, parameters)
+            if scans:
+                failures += 1
+                print(f'TAM TARAMA: {url}\n  {", ".join(scans)}\n  {" ".join(statement.split())}\n')
+            elif verbose:
+                print(f'OK: {url}\n  {" ".join(statement.split())}\n')
+        
+        print(f'{len(seen)} sorgu incelendi, {failures} tanesinde tam tablo taraması var')
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
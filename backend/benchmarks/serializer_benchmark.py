@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Avukat Yönetim Sistemi - Serileştirme Karşılaştırması
+ORM nesneleri ile kolon projeksiyonu üzerinden liste serileştirme sürelerini
+karşılaştırır ve iki yolun aynı çıktıyı ürettiğini doğrular.
+
+Kullanım (backend klasöründen):
+    python benchmarks/serializer_benchmark.py [kayıt_sayısı]
+"""
+
+import os
+import sys
+import json
+import time
+import random
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy.orm import joinedload, selectinload
+from app import create_app, db
+from app.models import User, Client, Case, Transaction, Installment
+from app.utils.projection import project_query, to_views, dumps
+
+ROW_COUNT = 10000
+REPEAT = 3
+
+
+def seed(row_count):
+    """Karşılaştırma için müvekkil, dava, işlem ve taksit kayıtları oluşturur"""
+    random.seed(0)
+    admin = User.query.first()
+    
+    clients = [
+        Client(name=f'Ad{i}', surname=f'Soyad{i}', tc_no=str(10000000000 + i), created_by=admin.id)
+        for i in range(max(row_count // 20, 1))
+    ]
+    db.session.add_all(clients)
+    db.session.flush()
+    
+    cases = [
+        Case(case_number=f'2024/{i:05d}', client_id=random.choice(clients).id, lawyer_id=admin.id,
+             case_type='civil', subject=f'Konu {i}', status=random.choice(['open', 'pending', 'won']))
+        for i in range(max(row_count // 5, 1))
+    ]
+    db.session.add_all(cases)
+    db.session.flush()
+    
+    for i in range(row_count):
+        case = random.choice(cases)
+        transaction = Transaction(
+            transaction_type=random.choice(['income', 'expense']), category='case_fee',
+            amount=random.randint(100, 10000) + 0.5, client_id=case.client_id, case_id=case.id,
+            description=f'Açıklama {i}', status=random.choice(['paid', 'pending']),
+            date=date(2024, 1, 1) + timedelta(days=i % 365)
+        )
+        db.session.add(transaction)
+        db.session.flush()
+        for number in (1, 2):
+            db.session.add(Installment(
+                transaction_id=transaction.id, installment_number=number, amount=50,
+                due_date=date(2024, 6, 1), status=random.choice(['paid', 'pending'])
+            ))
+    db.session.commit()
+
+
+def orm_path(row_count):
+    """Mevcut yol: ORM nesneleri, eager loading ve standart JSON"""
+    transactions = Transaction.query.options(
+        joinedload(Transaction.client),
+        joinedload(Transaction.case),
+        selectinload(Transaction.installment_list)
+    ).order_by(Transaction.date.desc(), Transaction.id.desc()).limit(row_count).all()
+    payload = {'transactions': [t.to_dict(include_relations=True) for t in transactions]}
+    return json.dumps(payload, ensure_ascii=False).encode('utf-8')
+
+
+def projection_path(row_count):
+    """Kolon projeksiyonu, satır görünümleri ve hızlı JSON"""
+    query = project_query(Transaction.query, Transaction)
+    rows = query.order_by(Transaction.date.desc(), Transaction.id.desc()).limit(row_count).all()
+    transactions = to_views(Transaction, rows, ['client', 'case', 'installment_list'])
+    return dumps({'transactions': [t.to_dict(include_relations=True) for t in transactions]})
+
+
+def measure(func, row_count):
+    """Fonksiyonu oturum temizlenmiş halde birkaç kez çalıştırır, en iyi süreyi döndürür"""
+    best = None
+    output = None
+    for _ in range(REPEAT):
+        db.session.remove()
+        started = time.perf_counter()
+        output = func(row_count)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, output
+
+
+def main():
+    row_count = int(sys.argv[1]) if len(sys.argv) > 1 else ROW_COUNT
+    
+    app = create_app('testing')
+    with app.app_context():
+        seed(row_count)
+        
+        orm_time, orm_output = measure(orm_path, row_count)
+        projection_time, projection_output = measure(projection_path, row_count)
+        
+        if json.loads(orm_output) != json.loads(projection_output):
+            print('HATA: İki yolun çıktısı farklı')
+            return 1
+        
+        print(f'Kayıt sayısı       : {row_count}')
+        print(f'ORM                : {orm_time * 1000:.1f} ms')
+        print(f'Kolon projeksiyonu : {projection_time * 1000:.1f} ms')
+        print(f'Hızlanma           : {orm_time / projection_time:.2f}x')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())